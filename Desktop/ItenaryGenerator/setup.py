@@ -5,13 +5,23 @@ Handles virtual environment creation and dependency installation
 """
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+_IS_WIN = os.name == 'nt'
+_VENV = Path("venv")
+_VENV_PY = _VENV / ("Scripts/python.exe" if _IS_WIN else "bin/python")
+_ACTIVATE = str(_VENV / ("Scripts/activate.bat" if _IS_WIN else "bin/activate"))
+
+# Project directories and the package __init__.py files to create in them
+_PROJECT_DIRS = [Path(d) for d in ("src", "src/agents", "src/tools", "src/workflows", "tests", "config")]
+_PACKAGE_INITS = [d / "__init__.py" for d in _PROJECT_DIRS if d.parts[0] == "src"]
+
 def create_virtual_environment():
     """Create a virtual environment if it doesn't exist."""
-    venv_path = Path("venv")
+    venv_path = _VENV
     
     if not venv_path.exists():
         print("Creating virtual environment...")
@@ -24,44 +34,34 @@ def create_virtual_environment():
 
 def get_activation_command():
     """Get the appropriate activation command for the current OS."""
-    if os.name == 'nt':  # Windows
-        return str(Path("venv") / "Scripts" / "activate.bat")
-    else:  # Unix/macOS
-        return f"source {Path('venv') / 'bin' / 'activate'}"
+    if _IS_WIN:
+        return _ACTIVATE
+    return f"source {_ACTIVATE}"
 
 def install_dependencies():
     """Install required dependencies."""
     print("Installing dependencies from requirements.txt...")
     
     # Use the python executable from the virtual environment
-    if os.name == 'nt':  # Windows
-        python_exe = Path("venv") / "Scripts" / "python.exe"
-    else:  # Unix/macOS
-        python_exe = Path("venv") / "bin" / "python"
+    python_exe = _VENV_PY
     
-    subprocess.run([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"], check=True)
-    subprocess.run([str(python_exe), "-m", "pip", "install", "-r", "requirements.txt"], check=True)
+    # uv resolves and installs in parallel; otherwise upgrade pip and install in one pip run
+    if shutil.which("uv"):
+        cmd = ["uv", "pip", "install", "--python", str(python_exe), "-r", "requirements.txt"]
+    else:
+        cmd = [str(python_exe), "-m", "pip", "install", "--upgrade", "--prefer-binary",
+               "pip", "-r", "requirements.txt"]
+    subprocess.run(cmd, check=True)
     print("✅ Dependencies installed successfully!")
 
 def create_project_structure():
     """Create the project directory structure."""
-    directories = [
-        "src",
-        "src/agents",
-        "src/tools", 
-        "src/workflows",
-        "tests",
-        "config"
-    ]
+    for directory in _PROJECT_DIRS:
+        os.makedirs(directory, exist_ok=True)
     
-    for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
-        
-        # Create __init__.py files for Python packages
-        if directory.startswith("src"):
-            init_file = Path(directory) / "__init__.py"
-            if not init_file.exists():
-                init_file.touch()
+    # Create __init__.py files for Python packages
+    for init_file in _PACKAGE_INITS:
+        init_file.touch(exist_ok=True)
     
     print("✅ Project structure created successfully!")
 
@@ -70,25 +70,41 @@ def create_env_file():
     env_file = Path(".env")
     env_example = Path(".env.example")
     
-    if not env_file.exists():
-        if env_example.exists():
-            # Copy .env.example to .env
-            env_file.write_text(env_example.read_text())
-            print("✅ .env file created from .env.example")
-            print("⚠️  Please update .env with your actual Google API key!")
-        else:
-            # Create basic .env file
-            env_content = """# Google API Key for Gemini integration
+    if env_file.exists():
+        print("✅ .env file already exists")
+        return
+    
+    # Read the template before creating .env, so a read error can't leave an empty file behind
+    try:
+        # Copy .env.example to .env
+        env_content = env_example.read_text()
+        created_message = "✅ .env file created from .env.example"
+    except FileNotFoundError:
+        # Create basic .env file
+        env_content = """# Google API Key for Gemini integration
 GOOGLE_API_KEY=your_google_api_key_here
 
 # Optional: Set to development for verbose logging
 ENVIRONMENT=development
 """
-            env_file.write_text(env_content)
-            print("✅ .env file created")
-            print("⚠️  Please update .env with your actual Google API key!")
-    else:
+        created_message = "✅ .env file created"
+    
+    # O_EXCL makes the existence check and the create a single atomic step; the file
+    # holds API keys, so only the owner may read it
+    try:
+        fd = os.open(env_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
         print("✅ .env file already exists")
+        return
+    
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(env_content)
+    except BaseException:
+        env_file.unlink()
+        raise
+    print(created_message)
+    print("⚠️  Please update .env with your actual Google API key!")
 
 def main():
     """Main setup function."""
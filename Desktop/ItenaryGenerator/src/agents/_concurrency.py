@@ -0,0 +1,22 @@
+"""
+Concurrency limits shared by the agents and the workflow.
+
+asyncio semaphores are bound to the event loop they are first used on, while
+the CLIs and test scripts each start their own loop with asyncio.run, so
+limits are kept as one semaphore per name and loop.
+"""
+
+import asyncio
+from typing import Dict, Tuple
+
+# (name, limit) -> (event loop, semaphore)
+_SEMAPHORES: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+
+def loop_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    """Process-wide semaphore for the name and limit on the running loop"""
+    loop = asyncio.get_running_loop()
+    entry = _SEMAPHORES.get((name, limit))
+    if entry is None or entry[0] is not loop:
+        entry = _SEMAPHORES[(name, limit)] = (loop, asyncio.Semaphore(limit))
+    return entry[1]
@@ -0,0 +1,21 @@
+"""
+Marks agent results that were built from canned fallback data.
+
+The helpers that stand in for a failed LLM call note it here, in the context
+of the task running the agent call, so callers that cache results can tell a
+degraded result from a real one without the agents raising.
+"""
+
+from contextvars import ContextVar
+
+_USED_FALLBACK: ContextVar[bool] = ContextVar("agent_used_fallback", default=False)
+
+
+def note_fallback():
+    """Record that the current task's result includes fallback data"""
+    _USED_FALLBACK.set(True)
+
+
+def used_fallback() -> bool:
+    """Whether a fallback was used in the current task"""
+    return _USED_FALLBACK.get()
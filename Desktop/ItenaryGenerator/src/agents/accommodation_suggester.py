@@ -19,14 +19,27 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 # Import ActivitiesPlanner data structures for compatibility
 from agents.activities_planner import ItineraryOutput, Place
+from agents.request_parser import CoreTravelRequest
+from agents._fallback import note_fallback
 
 
-@dataclass
+@dataclass(slots=True)
 class AccommodationOption:
     """Represents a hotel/accommodation option with location intelligence"""
     name: str
@@ -38,8 +51,21 @@ class AccommodationOption:
     proximity_score: Optional[str] = None  # "Near Gateway of India, Marine Drive"
     travel_convenience: Optional[str] = None  # "5 min walk to attractions"
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "name": self.name,
+            "location": self.location,
+            "price_per_night": self.price_per_night,
+            "total_cost": self.total_cost,
+            "rating": self.rating,
+            "brief_description": self.brief_description,
+            "proximity_score": self.proximity_score,
+            "travel_convenience": self.travel_convenience
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class AccommodationOutput:
     """Complete accommodation suggestions with budget and location context"""
     destination: str
@@ -50,6 +76,18 @@ class AccommodationOutput:
     key_activity_areas: List[str]  # Top 4 activity areas
     accommodation_options: List[AccommodationOption]
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "destination": self.destination,
+            "duration_days": self.duration_days,
+            "budget_allocated": self.budget_allocated,
+            "budget_category": self.budget_category,
+            "nightly_budget_range": self.nightly_budget_range,
+            "key_activity_areas": list(self.key_activity_areas),
+            "accommodation_options": [option.to_dict() for option in self.accommodation_options]
+        }
+
 
 class AccommodationSuggester:
     """
@@ -171,6 +209,27 @@ class AccommodationSuggester:
             self.logger.error(f"Error in accommodation suggestions: {e}")
             raise
 
+    async def suggest_for_places(self, travel_request: CoreTravelRequest, places: List[Place]) -> AccommodationOutput:
+        """
+        Suggest accommodations from the parsed request and must-visit places alone,
+        so the search can start before the day-by-day itinerary is planned
+        
+        Args:
+            travel_request: Parsed travel request from RequestParser
+            places: Must-visit places found by ActivitiesPlanner
+            
+        Returns:
+            AccommodationOutput: Structured accommodation suggestions
+        """
+        return await self.suggest_accommodations(ItineraryOutput(
+            destination=travel_request.destination,
+            duration_days=travel_request.duration,
+            total_budget=f"{travel_request.budget.total_amount} {travel_request.budget.currency}",
+            accommodation_type=travel_request.budget.accommodation_type,
+            must_visit_places=places,
+            daily_itineraries=[]
+        ))
+
     def _extract_budget_info(self, itinerary_output: ItineraryOutput) -> Dict:
         """Extract and calculate budget information from itinerary output"""
         try:
@@ -255,7 +314,7 @@ Focus on REAL area names from the activities and keep it to TOP 4 areas only.
             elif response_content.startswith("```"):
                 response_content = response_content.replace("```", "", 1).replace("```", "").strip()
             
-            result = json.loads(response_content)
+            result = _json_loads(response_content)
             
             # Ensure we have exactly 4 areas (top 4)
             if len(result["key_activity_areas"]) > 4:
@@ -270,6 +329,7 @@ Focus on REAL area names from the activities and keep it to TOP 4 areas only.
 
     def _fallback_location_analysis(self, activity_locations: List[Dict], destination: str) -> Dict:
         """Fallback location analysis if LLM fails"""
+        note_fallback()
         # Simple fallback: extract unique location areas
         areas = set()
         for location in activity_locations:
@@ -360,7 +420,7 @@ Use REAL market data from search results, not assumptions. Ensure ranges make se
             elif response_content.startswith("```"):
                 response_content = response_content.replace("```", "", 1).replace("```", "").strip()
             
-            result = json.loads(response_content)
+            result = _json_loads(response_content)
             
             self.logger.info(f"Budget categories determined: {result['budget_categories']}")
             return result
@@ -371,6 +431,7 @@ Use REAL market data from search results, not assumptions. Ensure ranges make se
 
     def _fallback_budget_categories(self, destination: str, currency: str) -> Dict:
         """Fallback budget categories if research fails"""
+        note_fallback()
         # Simple fallback based on currency
         if currency == "INR":
             categories = {
@@ -573,7 +634,7 @@ IMPORTANT:
             elif response_content.startswith("```"):
                 response_content = response_content.replace("```", "", 1).replace("```", "").strip()
             
-            result = json.loads(response_content)
+            result = _json_loads(response_content)
             hotels = result.get("hotels", [])
             
             self.logger.info(f"LLM extracted {len(hotels)} hotels from search results")
@@ -586,6 +647,7 @@ IMPORTANT:
     def _fallback_hotel_extraction(self, destination: str, budget_tier: str, 
                                  nightly_budget: float, currency: str) -> List[Dict]:
         """Fallback hotel data if LLM extraction fails"""
+        note_fallback()
         return [
             {
                 "name": f"Sample {budget_tier.title()} Hotel {destination}",
@@ -17,11 +17,21 @@ from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # Import RequestParser data structures for compatibility
 from .request_parser import CoreTravelRequest, Travelers, Budget, AccommodationType
+from ._fallback import note_fallback
 
 
-@dataclass
+@dataclass(slots=True)
 class Place:
     """Represents a must-visit place with details"""
     name: str
@@ -31,8 +41,27 @@ class Place:
     estimated_duration: Optional[str] = None  # e.g., "2-3 hours"
     best_time_to_visit: Optional[str] = None  # e.g., "morning", "evening"
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "name": self.name,
+            "location": self.location,
+            "significance": self.significance,
+            "category": self.category,
+            "estimated_duration": self.estimated_duration,
+            "best_time_to_visit": self.best_time_to_visit
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, estimated_duration: Optional[str] = None,
+                  best_time_to_visit: Optional[str] = None) -> "Place":
+        """Build from a research result place, with defaults for the optional fields"""
+        return cls(data["name"], data["location"], data["significance"], data["category"],
+                   data.get("estimated_duration", estimated_duration),
+                   data.get("best_time_to_visit", best_time_to_visit))
+
 
-@dataclass
+@dataclass(slots=True)
 class Activity:
     """Represents a specific activity at a place"""
     name: str
@@ -41,8 +70,18 @@ class Activity:
     description: str
     cost_estimate: Optional[str] = None  # e.g., "₹500-1000"
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "name": self.name,
+            "place": self.place,
+            "duration": self.duration,
+            "description": self.description,
+            "cost_estimate": self.cost_estimate
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class DayItinerary:
     """Represents a single day's itinerary"""
     day_number: int
@@ -58,8 +97,19 @@ class DayItinerary:
         if self.meals is None:
             self.meals = []
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "day_number": self.day_number,
+            "date": self.date,
+            "activities": [activity.to_dict() for activity in self.activities],
+            "meals": [dict(meal) for meal in self.meals],
+            "total_estimated_cost": self.total_estimated_cost,
+            "notes": self.notes
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ItineraryOutput:
     """Final structured output for downstream agents"""
     destination: str
@@ -71,6 +121,19 @@ class ItineraryOutput:
     total_estimated_cost: Optional[str] = None
     recommendations: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "destination": self.destination,
+            "duration_days": self.duration_days,
+            "total_budget": self.total_budget,
+            "accommodation_type": self.accommodation_type,
+            "must_visit_places": [place.to_dict() for place in self.must_visit_places],
+            "daily_itineraries": [day.to_dict() for day in self.daily_itineraries],
+            "total_estimated_cost": self.total_estimated_cost,
+            "recommendations": self.recommendations
+        }
+
 
 class ActivitiesPlanner:
     """
@@ -158,12 +221,14 @@ Always respond with valid JSON format for structured processing.
 
 Current Mode: PHASE 1 - Destination Research Focus"""
 
-    async def research_destination(self, travel_request: CoreTravelRequest) -> Dict:
+    async def research_destination(self, travel_request: CoreTravelRequest,
+                                   search_results: Optional[List[Dict]] = None) -> Dict:
         """
         Phase 1: Research destination and discover must-visit places
         
         Args:
             travel_request: Parsed travel request from RequestParser
+            search_results: Results of search_must_visit_places if already fetched
             
         Returns:
             Dict containing destination research results
@@ -177,7 +242,8 @@ Current Mode: PHASE 1 - Destination Research Focus"""
             self.logger.info(f"Starting destination research for {destination}")
             
             # Phase 1: Search for must-visit places
-            search_results = await self._search_must_visit_places(destination)
+            if search_results is None:
+                search_results = await self.search_must_visit_places(destination)
             
             # Phase 1: Process search results with LLM
             places_analysis = await self._analyze_places_with_llm(
@@ -200,7 +266,7 @@ Current Mode: PHASE 1 - Destination Research Focus"""
                 "message": "Failed to research destination"
             }
 
-    async def _search_must_visit_places(self, destination: str) -> List[Dict]:
+    async def search_must_visit_places(self, destination: str) -> List[Dict]:
         """Use Tavily to search for must-visit places with PARALLEL execution for 3-4x speed boost"""
         if not self.search_tool:
             self.logger.warning("Search tool not available, using mock data")
@@ -341,7 +407,7 @@ Respond with VALID JSON in this format:
             
             # Parse JSON response
             try:
-                parsed_response = json.loads(response_content)
+                parsed_response = _json_loads(response_content)
                 return parsed_response
                 
             except json.JSONDecodeError as e:
@@ -579,6 +645,7 @@ Respond with VALID JSON in this format:
     def _create_fallback_itinerary(self, activities: List[Activity], 
                                  travel_request: CoreTravelRequest) -> List[DayItinerary]:
         """Create a simple fallback itinerary if main logic fails"""
+        note_fallback()
         daily_itineraries = []
         activities_per_day = max(2, len(activities) // travel_request.duration)
         
@@ -722,14 +789,7 @@ async def test_activities_planner():
         
         # Convert places data to Place objects
         places_data = research_result.get("must_visit_places", [])
-        places = [Place(
-            name=place["name"],
-            location=place["location"],
-            significance=place["significance"],
-            category=place["category"],
-            estimated_duration=place.get("estimated_duration"),
-            best_time_to_visit=place.get("best_time_to_visit")
-        ) for place in places_data]
+        places = [Place.from_dict(place) for place in places_data]
         
         # Generate complete itinerary
         itinerary = await planner.generate_itinerary(mock_request, places)
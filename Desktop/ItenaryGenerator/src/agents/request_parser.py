@@ -10,17 +10,127 @@ This agent collects 4 core travel planning fields through interactive conversati
 Uses pure LLM processing with progressive questioning and robust error handling.
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
+import re
 import sys
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Union
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
 
 from config.openrouter_config import OpenRouterConfig, create_request_parser_agent
+from config.model_used import get_model, supports_prompt_caching
+from agents._concurrency import loop_semaphore
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_pretty(data) -> str:
+    """Serialize to 2-space indented JSON, stringifying unknown types"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+# Structured-output schema for one parser turn (OpenAI-compatible json_schema response_format)
+_NULLABLE_STRING = {"type": ["string", "null"]}
+PARSED_TURN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "destination": _NULLABLE_STRING,
+        "duration": {"type": ["integer", "null"]},
+        "travelers": {
+            "type": ["object", "null"],
+            "properties": {
+                "adults": {"type": "integer"},
+                "children": {"type": "integer"},
+                "total": {"type": "integer"}
+            },
+            "required": ["adults", "children", "total"],
+            "additionalProperties": False
+        },
+        "budget": {
+            "type": ["object", "null"],
+            "properties": {
+                "total_amount": {"type": "number"},
+                "currency": {"type": "string"}
+            },
+            "required": ["total_amount", "currency"],
+            "additionalProperties": False
+        },
+        "missing_fields": {"type": "array", "items": {"type": "string"}},
+        "next_question": _NULLABLE_STRING,
+        "is_complete": {"type": "boolean"},
+        "needs_disambiguation": _NULLABLE_STRING,
+        "parse_error": _NULLABLE_STRING
+    },
+    "required": [
+        "destination", "duration", "travelers", "budget", "missing_fields",
+        "next_question", "is_complete", "needs_disambiguation", "parse_error"
+    ],
+    "additionalProperties": False
+}
+PARSED_TURN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "parsed_turn", "schema": PARSED_TURN_SCHEMA, "strict": True}
+}
+
+# Leading ```/```json and trailing ``` markdown fences around an LLM response
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.I)
+
+# Completed "next_question" string value inside a partially streamed JSON response
+NEXT_QUESTION_RE = re.compile(r'"next_question"\s*:\s*("(?:[^"\\]|\\.)*")')
+# Completed "destination" string value inside a partially streamed JSON response
+DESTINATION_RE = re.compile(r'"destination"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Caps in-flight LLM calls across all parser agents, below provider rate limits
+MAX_CONCURRENT_LLM_CALLS = 48
+
+# Number of conversation exchanges retained per conversation
+HISTORY_SIZE = 8
+
+# Maximum number of parsed LLM responses kept per agent
+RESPONSE_CACHE_SIZE = 512
+
+# Patterns for single-field replies that can be parsed without an LLM call; a stay given
+# in nights is left to the LLM, since it doesn't map one-to-one onto trip days
+DURATION_RE = re.compile(r'\b(\d+)\s*(day|days|week|weeks)\b', re.I)
+TRAVELERS_RE = re.compile(
+    r'\b(\d+)\s*adults?\b(?:\s*(?:,|and|&)?\s*(\d+)\s*(?:child|children|kids?)\b)?', re.I
+)
+BUDGET_RE = re.compile(
+    r'(?:([$₹€])\s*(\d[\d,]*(?:\.\d+)?)|(\d[\d,]*(?:\.\d+)?)\s*(USD|INR|EUR|dollars?|rupees?|euros?)\b)', re.I
+)
+CURRENCY_CODES = {
+    "$": "USD", "₹": "INR", "€": "EUR",
+    "usd": "USD", "dollar": "USD", "dollars": "USD",
+    "inr": "INR", "rupee": "INR", "rupees": "INR",
+    "eur": "EUR", "euro": "EUR", "euros": "EUR"
+}
+FIELD_QUESTIONS = {
+    "destination": "Where would you like to travel?",
+    "duration": "How many days will your trip be?",
+    "travelers": "How many adults and children will be traveling?",
+    "budget": "What is your total budget for the trip, including the currency?"
+}
 
 
 class AccommodationType(Enum):
@@ -30,23 +140,35 @@ class AccommodationType(Enum):
     LUXURY = "luxury"
 
 
-@dataclass
+@dataclass(slots=True)
 class Travelers:
     """Traveler information"""
     adults: int
     children: int
     total: int
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {"adults": self.adults, "children": self.children, "total": self.total}
 
 
-@dataclass
+@dataclass(slots=True)
 class Budget:
     """Budget information with accommodation type determination"""
     total_amount: float
     currency: str
     accommodation_type: Optional[AccommodationType] = None
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary with the accommodation type as its value"""
+        return {
+            "total_amount": self.total_amount,
+            "currency": self.currency,
+            "accommodation_type": self.accommodation_type.value if self.accommodation_type else None
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class CoreTravelRequest:
     """Enhanced core travel request schema with 4 required fields"""
     destination: Optional[str] = None
@@ -61,23 +183,65 @@ class CoreTravelRequest:
     def __post_init__(self):
         if self.missing_fields is None:
             self.missing_fields = []
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary"""
+        return {
+            "destination": self.destination,
+            "duration": self.duration,
+            "travelers": self.travelers.to_dict() if self.travelers else None,
+            "budget": self.budget.to_dict() if self.budget else None,
+            "missing_fields": list(self.missing_fields),
+            "is_complete": self.is_complete,
+            "needs_disambiguation": self.needs_disambiguation,
+            "parse_error": self.parse_error
+        }
+
+
+# Bits tracking which core fields have been collected
+_DEST, _DUR, _TRV, _BUD = 1, 2, 4, 8
+_ALL = _DEST | _DUR | _TRV | _BUD
+_BITS = ((_DEST, "destination"), (_DUR, "duration"), (_TRV, "travelers"), (_BUD, "budget"))
+
+# Per-person-per-day budget limits (budget below first, mid-range up to second) by currency
+_ACCOMMODATION_THRESHOLDS = {
+    "USD": (50, 150),
+    "INR": (4000, 12000),
+    "EUR": (45, 135)
+}
+
+
+@lru_cache(maxsize=32)
+def _upper_currency(currency: str) -> str:
+    """Upper-case a currency code, caching repeats"""
+    return currency.upper()
+
+
+@lru_cache(maxsize=256)
+def _normalize_destination(destination: str) -> str:
+    """Title-case a destination name, caching repeats"""
+    return destination.strip().title()
 
 
 class ConversationManager:
     """Manages conversation state and field collection progress"""
     
+    # Known ambiguous destinations that need country clarification
+    AMBIGUOUS_DESTINATIONS = frozenset({
+        "Paris", "Springfield", "Cambridge", "Alexandria", "Madrid", 
+        "Birmingham", "Richmond", "Salem", "Dover", "Chester"
+    })
+    
     def __init__(self):
         self.collected_data = CoreTravelRequest()
-        self.conversation_history = []
+        # Only recent exchanges feed the LLM context, so older ones are dropped
+        self.conversation_history = deque(maxlen=HISTORY_SIZE)
         self.validation_rules = {
             "duration": {"min": 1, "max": 365},
             "budget": {"min": 1}
         }
-        # Known ambiguous destinations that need country clarification
-        self.ambiguous_destinations = [
-            "Paris", "Springfield", "Cambridge", "Alexandria", "Madrid", 
-            "Birmingham", "Richmond", "Salem", "Dover", "Chester"
-        ]
+        # Bitmask of collected core fields, updated via mark_collected
+        self._field_mask = 0
     
     def add_exchange(self, user_input: str, agent_response: Dict):
         """Track conversation exchange"""
@@ -89,29 +253,19 @@ class ConversationManager:
     
     def get_missing_fields(self) -> List[str]:
         """Identify which core fields are still missing"""
-        missing = []
-        
-        if not self.collected_data.destination:
-            missing.append("destination")
-        if not self.collected_data.duration:
-            missing.append("duration")
-        if not self.collected_data.travelers:
-            missing.append("travelers")
-        if not self.collected_data.budget:
-            missing.append("budget")
-            
-        return missing
+        mask = self._field_mask
+        return [name for bit, name in _BITS if not mask & bit]
+    
+    def mark_collected(self, bit: int):
+        """Record that a core field (one of the _DEST/_DUR/_TRV/_BUD bits) has been set"""
+        self._field_mask |= bit
     
     def is_complete(self) -> bool:
         """Check if all 4 core fields are collected and validated"""
         return (
-            self.collected_data.destination and
-            self.collected_data.duration and
-            self.collected_data.travelers and
-            self.collected_data.budget and
+            self._field_mask == _ALL and
             not self.collected_data.needs_disambiguation and
-            not self.collected_data.parse_error and
-            len(self.get_missing_fields()) == 0
+            not self.collected_data.parse_error
         )
     
     def validate_duration(self, duration: int) -> bool:
@@ -124,8 +278,8 @@ class ConversationManager:
     
     def check_destination_disambiguation(self, destination: str) -> Optional[str]:
         """Check if destination needs country clarification"""
-        destination_clean = destination.strip().title()
-        if destination_clean in self.ambiguous_destinations:
+        destination_clean = _normalize_destination(destination)
+        if destination_clean in self.AMBIGUOUS_DESTINATIONS:
             return f"There are multiple cities named {destination_clean}. Which country - {destination_clean}, France or another location? Please specify the country."
         return None
     
@@ -142,38 +296,22 @@ class ConversationManager:
         Returns:
             AccommodationType enum value
         """
-        budget_per_person_per_day = total_budget / (travelers_count * duration)
-        
-        # Currency-specific thresholds
-        if currency.upper() == "USD":
-            if budget_per_person_per_day < 50:
-                return AccommodationType.BUDGET
-            elif budget_per_person_per_day <= 150:
-                return AccommodationType.MID_RANGE
-            else:
-                return AccommodationType.LUXURY
-        elif currency.upper() == "INR":
-            if budget_per_person_per_day < 4000:
-                return AccommodationType.BUDGET
-            elif budget_per_person_per_day <= 12000:
-                return AccommodationType.MID_RANGE
-            else:
-                return AccommodationType.LUXURY
-        elif currency.upper() == "EUR":
-            if budget_per_person_per_day < 45:
-                return AccommodationType.BUDGET
-            elif budget_per_person_per_day <= 135:
-                return AccommodationType.MID_RANGE
-            else:
-                return AccommodationType.LUXURY
-        else:
+        thresholds = _ACCOMMODATION_THRESHOLDS.get(_upper_currency(currency))
+        if thresholds is None:
             # Default to mid-range for unknown currencies
             return AccommodationType.MID_RANGE
+        
+        budget_limit, mid_range_limit = thresholds
+        budget_per_person_per_day = total_budget / (travelers_count * duration)
+        if budget_per_person_per_day < budget_limit:
+            return AccommodationType.BUDGET
+        if budget_per_person_per_day <= mid_range_limit:
+            return AccommodationType.MID_RANGE
+        return AccommodationType.LUXURY
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp for conversation tracking"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _get_timestamp(self) -> int:
+        """Get current timestamp (ns since epoch) for conversation tracking"""
+        return time.time_ns()
 
 
 class RequestParserAgent:
@@ -189,30 +327,34 @@ class RequestParserAgent:
         
         # Enhanced system prompt for 4 core fields
         self.system_prompt = self._create_system_prompt()
+        
+        # Parsed LLM responses keyed by a hash of the full user prompt (LRU-bounded)
+        self._response_cache = OrderedDict()
+        
+        # Resolved once per agent rather than on every turn
+        self._model_name = get_model("REQUEST_PARSER")
+        self._api_key = os.getenv("OPENROUTER_API_KEY")
+        
+        # Optional callback invoked with next_question as soon as it streams in
+        self.on_next_question: Optional[Callable[[str], None]] = None
+        # Optional callback invoked with the destination as soon as it streams in
+        self.on_destination: Optional[Callable[[str], None]] = None
     
     def _create_system_prompt(self) -> str:
         """Create the enhanced system prompt for 4 core fields collection"""
+        # Providers that ignore response_format still need the shape spelled out; the prompt stays
+        # static, so it remains cacheable
         return """
 You are a travel request parser. Collect 4 fields: destination, duration (1-365 days), travelers (adults/children), budget (amount+currency).
 
-Rules: Ask one field at a time, be friendly, validate inputs. For ambiguous destinations like "Paris", ask for country.
-
-Response format (JSON only):
-{
-    "destination": "string or null",
-    "duration": "number or null", 
-    "travelers": {"adults": number, "children": number, "total": number} or null,
-    "budget": {"total_amount": number, "currency": "string"} or null,
-    "missing_fields": ["list of missing fields"],
-    "next_question": "string or null",
-    "is_complete": boolean,
-    "needs_disambiguation": "string or null",
-    "parse_error": "string or null"
-}
+Rules: Ask one field at a time, be friendly, validate inputs. For ambiguous destinations like "Paris", ask for country (set needs_disambiguation). Respond with JSON only.
 
-Examples:
-Input: "Paris for 5 days" → {"destination": "Paris", "duration": 5, "needs_disambiguation": "Which country - France or another?", "missing_fields": ["travelers", "budget"], "is_complete": false}
-Input: "Kashmir 2 weeks, 100000 INR" → {"destination": "Kashmir", "duration": 14, "budget": {"total_amount": 100000, "currency": "INR"}, "missing_fields": ["travelers"], "next_question": "How many people traveling?", "is_complete": false}
+Response keys (use null for unknown values):
+{"destination": str|null, "duration": int|null,
+ "travelers": {"adults": int, "children": int, "total": int}|null,
+ "budget": {"total_amount": number, "currency": str}|null,
+ "missing_fields": [str], "next_question": str|null, "is_complete": bool,
+ "needs_disambiguation": str|null, "parse_error": str|null}
 """
     
     async def start_conversation(self, initial_input: str) -> Dict:
@@ -285,45 +427,61 @@ Input: "Kashmir 2 weeks, 100000 INR" → {"destination": "Kashmir", "duration":
         Returns:
             Dict containing structured agent response
         """
+        # Trivial single-field replies are parsed locally without a network round trip
+        local_response = self._try_local_parse(user_input)
+        if local_response is not None:
+            self.logger.info(f"Parsed locally without LLM: {local_response}")
+            return local_response
+        
         try:
-            # Build full prompt for LLM
-            full_prompt = f"""
+            # Only the per-turn data goes in the user message, so the system prompt
+            # stays byte-identical across turns and can be served from the prompt cache
+            user_prompt = f"""
 CONVERSATION CONTEXT: {conversation_context}
 
 CURRENT COLLECTED DATA: {self._get_current_data_summary()}
 
 USER INPUT: {user_input}
-
-{self.system_prompt}
 """
             
-            # Use LiteLLM directly for cleaner integration
-            import litellm
-            from config.model_used import get_model
+            # Identical context + data + input means an identical request, so reuse the answer
+            cache_key = hashlib.blake2b(user_prompt.encode(), digest_size=16).hexdigest()
+            cached_response = self._response_cache.get(cache_key)
+            if cached_response is not None:
+                self._response_cache.move_to_end(cache_key)
+                self.logger.info("Reusing cached LLM response")
+                return copy.deepcopy(cached_response)
             
             # Configure OpenRouter settings - using cheaper model to avoid credit limits
-            response = await litellm.acompletion(
-                model=get_model("REQUEST_PARSER"), 
-                messages=[{"role": "user", "content": full_prompt}],
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-                max_tokens=1000  # Limit tokens to avoid credit issues
-            )
-            
-            response_content = response.choices[0].message.content
+            messages = [self._system_message(self._model_name), {"role": "user", "content": user_prompt}]
+            if self.on_next_question is not None or self.on_destination is not None:
+                response_content = await self._stream_completion(messages)
+            else:
+                # Use LiteLLM directly for cleaner integration; imported here since it's slow to load
+                import litellm
+                async with loop_semaphore("parser_llm", MAX_CONCURRENT_LLM_CALLS):
+                    response = await litellm.acompletion(
+                        model=self._model_name, 
+                        messages=messages,
+                        api_key=self._api_key,
+                        max_tokens=1000,  # Limit tokens to avoid credit issues
+                        response_format=PARSED_TURN_RESPONSE_FORMAT
+                    )
+                response_content = response.choices[0].message.content
             self.logger.info(f"LiteLLM response content: {response_content}")
             
             # Clean up response content (remove markdown code blocks if present)
-            if response_content.startswith("```json"):
-                response_content = response_content.replace("```json", "").replace("```", "").strip()
-            elif response_content.startswith("```"):
-                response_content = response_content.replace("```", "", 1).replace("```", "").strip()
+            response_content = self._strip_code_fences(response_content)
             
             # Parse JSON response
             try:
-                parsed_response = json.loads(response_content)
+                parsed_response = _json_loads(response_content)
                 
                 # Validate response format
                 if self._is_valid_response_format(parsed_response):
+                    self._response_cache[cache_key] = copy.deepcopy(parsed_response)
+                    if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                        self._response_cache.popitem(last=False)
                     return parsed_response
                 else:
                     return self._create_error_response("I had trouble understanding that. Could you please rephrase your request?")
@@ -336,17 +494,142 @@ USER INPUT: {user_input}
             self.logger.error(f"LLM processing error: {e}")
             return self._create_error_response("I encountered an error processing your request. Please try again.")
     
+    async def _stream_completion(self, messages: List[Dict]) -> str:
+        """
+        Stream the completion, handing next_question to on_next_question and the
+        destination to on_destination as soon as each value is complete
+        
+        Returns:
+            The full response content once the stream closes
+        """
+        buffer = ""
+        announced = self.on_next_question is None
+        destination_announced = self.on_destination is None
+        import litellm
+        async with loop_semaphore("parser_llm", MAX_CONCURRENT_LLM_CALLS):
+            stream = await litellm.acompletion(
+                model=self._model_name,
+                messages=messages,
+                api_key=self._api_key,
+                max_tokens=1000,
+                response_format=PARSED_TURN_RESPONSE_FORMAT,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+                if not destination_announced:
+                    match = DESTINATION_RE.search(buffer)
+                    if match:
+                        destination_announced = True
+                        try:
+                            self.on_destination(_json_loads(match.group(1)))
+                        except Exception as e:
+                            self.logger.warning(f"destination callback failed: {e}")
+                if not announced:
+                    match = NEXT_QUESTION_RE.search(buffer)
+                    if match:
+                        announced = True
+                        try:
+                            self.on_next_question(_json_loads(match.group(1)))
+                        except Exception as e:
+                            self.logger.warning(f"next_question callback failed: {e}")
+        return buffer
+    
+    def _try_local_parse(self, user_input: str) -> Optional[Dict]:
+        """
+        Parse replies that only answer one missing numeric field, e.g. "5 days",
+        "2 adults 1 child" or "50000 INR"
+        
+        Returns:
+            Structured agent response, or None if the input needs the LLM
+        """
+        manager = self.conversation_manager
+        if manager.collected_data.needs_disambiguation:
+            return None
+        
+        text = user_input.strip()
+        matches = [
+            (field, match)
+            for field, pattern in (("duration", DURATION_RE), ("travelers", TRAVELERS_RE), ("budget", BUDGET_RE))
+            for match in (pattern.search(text),)
+            if match
+        ]
+        if len(matches) != 1:
+            return None
+        
+        field, match = matches[0]
+        missing = manager.get_missing_fields()
+        # Anything besides the matched phrase (e.g. a destination) needs the LLM
+        leftover = (text[:match.start()] + text[match.end():]).strip(" .,!")
+        if field not in missing or leftover:
+            return None
+        
+        response = self._create_error_response(None)
+        if field == "duration":
+            duration = int(match.group(1))
+            if match.group(2).lower().startswith("week"):
+                duration *= 7
+            if not manager.validate_duration(duration):
+                return None
+            response["duration"] = duration
+        elif field == "travelers":
+            adults = int(match.group(1))
+            children = int(match.group(2) or 0)
+            if adults < 1:
+                return None
+            response["travelers"] = {"adults": adults, "children": children, "total": adults + children}
+        else:
+            symbol, symbol_amount, amount, code = match.groups()
+            total_amount = float((symbol_amount or amount).replace(",", ""))
+            if not manager.validate_budget(total_amount):
+                return None
+            response["budget"] = {
+                "total_amount": total_amount,
+                "currency": CURRENCY_CODES[(symbol or code).lower()]
+            }
+        
+        remaining = [name for name in missing if name != field]
+        response["missing_fields"] = remaining
+        response["next_question"] = FIELD_QUESTIONS[remaining[0]] if remaining else None
+        response["is_complete"] = not remaining
+        return response
+    
+    def _system_message(self, model: str) -> Dict:
+        """Build the system message, marking it cacheable for models that need explicit breakpoints"""
+        if not supports_prompt_caching(model):
+            # OpenAI-style providers cache long stable prefixes automatically
+            return {"role": "system", "content": self.system_prompt}
+        return {
+            "role": "system",
+            "content": [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        }
+    
+    @staticmethod
+    def _strip_code_fences(response_content: str) -> str:
+        """Remove markdown code blocks wrapped around a JSON response"""
+        return _FENCE_RE.sub("", response_content)
+    
     def _update_conversation_state(self, llm_response: Dict):
         """Update conversation manager state based on LLM response"""
         # Update destination
         if llm_response.get("destination") and not llm_response.get("needs_disambiguation"):
             self.conversation_manager.collected_data.destination = llm_response["destination"]
+            self.conversation_manager.mark_collected(_DEST)
         
         # Update duration with validation
         if llm_response.get("duration"):
             duration = llm_response["duration"]
             if self.conversation_manager.validate_duration(duration):
                 self.conversation_manager.collected_data.duration = duration
+                self.conversation_manager.mark_collected(_DUR)
         
         # Update travelers
         if llm_response.get("travelers"):
@@ -356,6 +639,7 @@ USER INPUT: {user_input}
                 children=travelers_data["children"],
                 total=travelers_data["total"]
             )
+            self.conversation_manager.mark_collected(_TRV)
         
         # Update budget with accommodation type
         if llm_response.get("budget"):
@@ -377,6 +661,7 @@ USER INPUT: {user_input}
                     currency=budget_data["currency"],
                     accommodation_type=accommodation_type
                 )
+                self.conversation_manager.mark_collected(_BUD)
         
         # Update flags
         self.conversation_manager.collected_data.needs_disambiguation = llm_response.get("needs_disambiguation")
@@ -389,9 +674,10 @@ USER INPUT: {user_input}
         context_parts = []
         
         # Add conversation history
-        if self.conversation_manager.conversation_history:
+        history = self.conversation_manager.conversation_history
+        if history:
             context_parts.append("CONVERSATION HISTORY:")
-            for exchange in self.conversation_manager.conversation_history[-3:]:  # Last 3 exchanges
+            for exchange in islice(history, max(len(history) - 3, 0), None):  # Last 3 exchanges
                 context_parts.append(f"User: {exchange['user']}")
                 if exchange['agent'].get('next_question'):
                     context_parts.append(f"Agent: {exchange['agent']['next_question']}")
@@ -460,22 +746,26 @@ USER INPUT: {user_input}
         # Create final request
         final_request = self.get_final_request()
         
-        # Log final JSON output
-        self.logger.info("=" * 50)
-        self.logger.info("REQUESTPARSER FINAL OUTPUT")
-        self.logger.info("=" * 50)
-        self.logger.info(json.dumps(final_request, indent=2, default=str))
-        self.logger.info("=" * 50)
-        self.logger.info("HANDOFF TO ACTIVITIESPLANNER")
-        self.logger.info("=" * 50)
+        # Log final JSON output as one record; skip serializing it when INFO is off
+        if self.logger.isEnabledFor(logging.INFO):
+            separator = "=" * 50
+            self.logger.info("%s", "\n".join([
+                separator,
+                "REQUESTPARSER FINAL OUTPUT",
+                separator,
+                _json_dumps_pretty(final_request),
+                separator,
+                "HANDOFF TO ACTIVITIESPLANNER",
+                separator
+            ]))
         
         # TODO: Call ActivitiesPlanner agent here
         
         return {
             "destination": self.conversation_manager.collected_data.destination,
             "duration": self.conversation_manager.collected_data.duration,
-            "travelers": asdict(self.conversation_manager.collected_data.travelers),
-            "budget": asdict(self.conversation_manager.collected_data.budget),
+            "travelers": final_request["travelers"],
+            "budget": final_request["budget"],
             "missing_fields": [],
             "next_question": None,
             "is_complete": True,
@@ -491,8 +781,12 @@ USER INPUT: {user_input}
         Returns:
             Dict containing complete CoreTravelRequest data
         """
-        return asdict(self.conversation_manager.collected_data)
+        return self.conversation_manager.collected_data.to_dict()
+    
+    def get_final_travel_request(self) -> CoreTravelRequest:
+        """Get the complete final travel request as a CoreTravelRequest, detached from the conversation state"""
+        return copy.deepcopy(self.conversation_manager.collected_data)
     
     def reset_conversation(self):
         """Reset conversation state for new request"""
-        self.conversation_manager = ConversationManager()
\ No newline at end of file
+        self.conversation_manager = ConversationManager()
@@ -0,0 +1,57 @@
+"""
+Shared pieces of the interactive CLIs
+
+The RequestParserAgent instance, opening prompt, parser conversation loop and
+parsed request summary shared by interactive_parser, simple_interactive and
+interactive_itinerary_generator.
+"""
+
+import asyncio
+import functools
+from typing import Callable, Dict
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Prompt
+
+from agents.request_parser import RequestParserAgent
+
+
+@functools.lru_cache(maxsize=1)
+def get_parser_agent() -> RequestParserAgent:
+    """RequestParserAgent shared by the interactive CLIs, created on first use"""
+    return RequestParserAgent()
+
+
+def prompt_travel_request(console: Console, title: str, intro: str = "Let's plan your perfect trip! 🚀") -> str:
+    """Show the CLI header and read the initial travel request"""
+    console.print(Panel.fit(title, style="bold blue"))
+    console.print(f"\n[bold]{intro}[/bold]")
+    console.print("Describe your travel request in natural language...\n")
+    return Prompt.ask("Your travel request")
+
+
+async def run_parse_loop(parser_agent: RequestParserAgent, initial_input: str,
+                         show_response: Callable[[Dict, bool], None]) -> Dict:
+    """Ask follow-up questions until the request is complete and return the final request
+
+    show_response is called with each agent response and whether it is the first one.
+    """
+    response = await parser_agent.start_conversation(initial_input)
+    show_response(response, True)
+
+    while not response.get("is_complete", False):
+        # Get user response off the event loop so background tasks keep running
+        user_response = await asyncio.to_thread(Prompt.ask, "\n[bold]Your response[/bold]")
+        response = await parser_agent.continue_conversation(user_response)
+        show_response(response, False)
+
+    return parser_agent.get_final_request()
+
+
+def format_final_request(final_request: Dict) -> str:
+    """Parsed request summary as one markup block"""
+    return (f"\n[bold]Destination:[/bold] {final_request.get('destination', 'Not specified')}\n"
+            f"[bold]Duration:[/bold] {final_request.get('duration', 'Not specified')} days\n"
+            f"[bold]Travelers:[/bold] {final_request.get('travelers', 'Not specified')}\n"
+            f"[bold]Budget:[/bold] {final_request.get('budget', 'Not specified')}")
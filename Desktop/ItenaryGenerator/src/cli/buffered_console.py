@@ -0,0 +1,27 @@
+"""
+Buffered Rich console for the interactive CLIs
+
+Collects the lines of a multi-line block and emits them with a single
+console.print call, so Rich parses markup and renders once per block
+instead of once per line.
+"""
+
+from rich.console import Console
+
+
+class BufferedConsole(Console):
+    """Console that buffers lines with write() and flushes them on writeln()"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer = []
+
+    def write(self, line: str = ""):
+        """Buffer a line for the next flush"""
+        self._line_buffer.append(line)
+
+    def writeln(self, line: str = ""):
+        """Buffer a final line and print the whole block at once"""
+        self._line_buffer.append(line)
+        super().print("\n".join(self._line_buffer))
+        self._line_buffer.clear()
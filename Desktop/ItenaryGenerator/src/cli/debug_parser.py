@@ -44,6 +44,8 @@ async def debug_request_parser():
     # Initialize the agent
     console.print("\n[bold]Initializing RequestParserAgent...[/bold]")
     parser_agent = RequestParserAgent()
+    # Show the follow-up question while the rest of the JSON is still streaming
+    parser_agent.on_next_question = lambda question: console.print(f"[dim]Streaming question:[/dim] {question}")
     console.print("[green]✅ Agent initialized[/green]")
     
     # Get initial request
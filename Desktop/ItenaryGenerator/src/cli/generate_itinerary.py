@@ -12,8 +12,9 @@ import json
 import logging
 import sys
 import os
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from pathlib import Path
 
 # Rich imports for beautiful terminal UI
 from rich.console import Console
@@ -36,12 +37,19 @@ from rich.layout import Layout
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from workflows.travel_itinerary_workflow import generate_travel_itinerary
+from workflows.travel_itinerary_workflow import generate_travel_itinerary, WorkflowIdFilter
 from workflows.data_models import TravelItineraryResponse, WorkflowMetadata, AgentStatus
+from workflows.semantic_cache import SemanticCache
 
 # Initialize console
 console = Console()
 
+# logging's default format, plus the ID of the workflow that logged the record
+_LOG_FORMAT = "%(levelname)s:%(name)s:[%(workflow_id)s] %(message)s"
+
+# json.dumps with non-default options builds a new encoder per call; build it once instead
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
 # Global progress tracking
 current_progress = None
 current_live = None
@@ -96,7 +104,8 @@ class ProgressTracker:
             self.live.stop()
 
 
-def progress_callback(message: str, percentage: float, metadata: Optional[WorkflowMetadata] = None):
+def progress_callback(message: str, percentage: float, metadata: Optional[WorkflowMetadata] = None,
+                      partial_response=None):
     """Callback function for workflow progress updates"""
     global current_progress
     if current_progress:
@@ -352,7 +361,7 @@ def format_json_output(response: TravelItineraryResponse) -> str:
                 "errors": response.workflow_metadata.errors
             }
         
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _JSON_ENCODER.encode(data)
         
     except Exception as e:
         return f'{{"error": "Failed to serialize response: {str(e)}"}}'
@@ -518,6 +527,73 @@ def format_primary_output(response: TravelItineraryResponse) -> str:
     return "\n".join(lines)
 
 
+# Formatter and saved-file extension for each --format choice
+_FORMATTERS = {
+    "summary": (format_summary_output, "txt"),
+    "detailed": (format_detailed_output, "txt"),
+    "json": (format_json_output, "json"),
+    "markdown": (format_markdown_output, "md"),
+    "primary": (format_primary_output, "txt"),
+}
+
+
+def read_requests_file(path: str) -> List[str]:
+    """Travel requests from a file with one JSON request per line (a string or {"request": ...})"""
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            requests.append(item["request"] if isinstance(item, dict) else str(item))
+    return requests
+
+
+async def run_batch(requests: List[str], args) -> bool:
+    """Generate itineraries for all requests concurrently, saving each to <output-dir>/<n>.<ext>"""
+    formatter, extension = _FORMATTERS[args.format]
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = None if args.no_cache else SemanticCache()
+    
+    async def generate(request: str) -> TravelItineraryResponse:
+        # SQLite calls run in worker threads so they don't stall the other requests
+        response = await asyncio.to_thread(cache.get, request) if cache else None
+        if response is None:
+            # Each request gets its own workflow, since the request parser keeps conversation state
+            response = await generate_travel_itinerary(request, use_cache=not args.no_cache)
+            if cache:
+                await asyncio.to_thread(cache.put, request, response)
+        return response
+    
+    if not args.quiet:
+        console.print(f"[yellow]Processing {len(requests)} requests concurrently...[/yellow]")
+    try:
+        results = await asyncio.gather(*(generate(request) for request in requests), return_exceptions=True)
+    finally:
+        if cache:
+            cache.close()
+    
+    table = Table(title="Batch Results")
+    table.add_column("#", justify="right")
+    table.add_column("Request")
+    table.add_column("Status")
+    table.add_column("Saved to")
+    all_ok = True
+    for i, (request, result) in enumerate(zip(requests, results), 1):
+        if isinstance(result, Exception):
+            all_ok = False
+            table.add_row(str(i), request, f"[red]❌ {result}[/red]", "")
+            continue
+        path = output_dir / f"{i}.{extension}"
+        path.write_text(formatter(result), encoding="utf-8")
+        all_ok = all_ok and result.is_complete()
+        table.add_row(str(i), request, result.get_completion_status(), str(path))
+    console.print(table)
+    return all_ok
+
+
 async def main():
     """Main CLI function"""
     global current_progress
@@ -531,29 +607,40 @@ Examples:
   python generate_itinerary.py "Visit Tokyo for 5 days" # Direct input
   python generate_itinerary.py --format json            # JSON output
   python generate_itinerary.py --output travel.md       # Save to file
+  python generate_itinerary.py --requests-file trips.jsonl --output-dir out  # Batch mode
         """
     )
     
-    parser.add_argument("input", nargs="?", help="Travel request (if not provided, interactive mode)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("input", nargs="?", help="Travel request (if not provided, interactive mode)")
+    source.add_argument("--requests-file", help="Generate itineraries for every request in a file (one JSON request per line)")
     parser.add_argument("--format", choices=["summary", "detailed", "json", "markdown", "primary"], 
                        default="summary", help="Output format (default: summary)")
     parser.add_argument("--output", "-o", help="Save output to file")
+    parser.add_argument("--output-dir", default="itineraries", help="Directory for batch outputs (default: itineraries)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
     parser.add_argument("--quiet", "-q", action="store_true", help="Quiet mode (no progress bar)")
+    parser.add_argument("--no-cache", action="store_true", help="Always run the full workflow, ignoring cached itineraries and agent results")
     
     args = parser.parse_args()
     
-    # Configure logging
-    if args.verbose:
-        logging.basicConfig(level=logging.INFO)
-    else:
-        logging.basicConfig(level=logging.WARNING)
+    # Configure logging; records carry the workflow ID, which tells batch runs apart
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format=_LOG_FORMAT)
+    for handler in logging.getLogger().handlers:
+        handler.addFilter(WorkflowIdFilter())
     
+    cache = None
     try:
         # Print header
         if not args.quiet:
             print_header()
         
+        # Batch mode: all requests run under this one event loop
+        if args.requests_file:
+            if not await run_batch(read_requests_file(args.requests_file), args):
+                sys.exit(1)
+            return
+        
         # Get user input
         if args.input:
             user_input = args.input
@@ -563,30 +650,32 @@ Examples:
         else:
             user_input = get_user_input_interactive()
         
-        # Initialize progress tracker
-        if not args.quiet:
-            current_progress = ProgressTracker()
-            current_progress.start()
+        # Reuse the itinerary of an identical or reworded earlier request
+        cache = None if args.no_cache else SemanticCache()
+        response = await asyncio.to_thread(cache.get, user_input) if cache else None
+        if response and not args.quiet:
+            console.print("[dim]♻️  Reusing a cached itinerary for a matching request (--no-cache to regenerate)[/dim]")
         
-        # Execute workflow
-        try:
-            response = await generate_travel_itinerary(user_input, progress_callback if not args.quiet else None)
-        finally:
-            if current_progress:
-                current_progress.stop()
-                current_progress = None
+        if response is None:
+            # Initialize progress tracker
+            if not args.quiet:
+                current_progress = ProgressTracker()
+                current_progress.start()
+            
+            # Execute workflow
+            try:
+                response = await generate_travel_itinerary(user_input, progress_callback if not args.quiet else None,
+                                                           use_cache=not args.no_cache)
+            finally:
+                if current_progress:
+                    current_progress.stop()
+                    current_progress = None
+            
+            if cache:
+                await asyncio.to_thread(cache.put, user_input, response)
         
         # Format output
-        if args.format == "summary":
-            output = format_summary_output(response)
-        elif args.format == "detailed":
-            output = format_detailed_output(response)
-        elif args.format == "json":
-            output = format_json_output(response)
-        elif args.format == "markdown":
-            output = format_markdown_output(response)
-        elif args.format == "primary":
-            output = format_primary_output(response)
+        output = _FORMATTERS[args.format][0](response)
         
         # Display or save output
         if args.output:
@@ -618,6 +707,9 @@ Examples:
         if args.verbose:
             console.print_exception()
         sys.exit(1)
+    finally:
+        if cache:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -7,172 +7,208 @@ that displays rich terminal output similar to the primary format command.
 """
 
 import asyncio
+import io
+import re
 import sys
 import os
 from pathlib import Path
-from rich.console import Console
+from rich.console import Group
+from rich.live import Live
 from rich.prompt import Prompt
-from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
 from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from cli.buffered_console import BufferedConsole
 from workflows import TravelItineraryWorkflow, TravelItineraryResponse
 from workflows.data_models import WorkflowMetadata, AgentStatus
-from agents.request_parser import RequestParserAgent
+from cli._shared import get_parser_agent, prompt_travel_request, run_parse_loop
 
-console = Console()
+console = BufferedConsole()
 
-def format_primary_schema(response: TravelItineraryResponse) -> str:
-    """Format the response in primary schema format"""
-    lines = []
+# Static pieces of the primary schema, built once at import
+_SEP60 = "=" * 60
+_NL_SEP60 = "\n" + _SEP60
+_SCHEMA_HEADER = (f"🏛️ PRIMARY TRAVEL SCHEMA\n{_SEP60}\n\n"
+                  f"📋 STRUCTURED TRAVEL INFORMATION\n{'-' * 40}\n\n")
+_METADATA_HEADER = f"🔍 SCHEMA METADATA\n{'-' * 20}\n"
+_SCHEMA_FOOTER = f"\n✅ Primary schema generation complete\n{_SEP60}"
+
+def _format_header(request, write):
+    """Schema header plus the destination and duration sections"""
+    # Header with schema identifier, then core schema elements
+    write(_SCHEMA_HEADER)
+    if not request:
+        return
     
-    # Header with schema identifier
-    lines.append("🏛️ PRIMARY TRAVEL SCHEMA")
-    lines.append("=" * 60)
-    lines.append("")
+    # 1. DESTINATION
+    write(f"🌍 DESTINATION\n"
+          f"   Location: {request.destination}\n"
+          f"   Travel Type: International/Domestic Travel\n\n")
     
-    # Core Schema Elements
-    lines.append("📋 STRUCTURED TRAVEL INFORMATION")
-    lines.append("-" * 40)
-    lines.append("")
+    # 2. DURATION
+    children = request.travelers.children
+    travelers_text = f"   Travelers: {request.travelers.adults} adults{f', {children} children' if children > 0 else ''}"
+    write(f"⏰ DURATION\n"
+          f"   Trip Length: {request.duration} days\n"
+          f"{travelers_text}\n"
+          f"   Budget: {request.budget.total_amount}\n\n")
+
+def _format_places(places, write):
+    """Activities section (with significance) for a non-empty list of places"""
+    write("🎯 ACTIVITIES & ATTRACTIONS\n   Key Places to Visit:\n\n")
     
-    # 1. DESTINATION
-    if response.parsed_request:
-        lines.append("🌍 DESTINATION")
-        lines.append(f"   Location: {response.parsed_request.destination}")
-        lines.append(f"   Travel Type: International/Domestic Travel")
-        lines.append("")
-        
-        # 2. DURATION
-        lines.append("⏰ DURATION")
-        lines.append(f"   Trip Length: {response.parsed_request.duration} days")
-        travelers_text = f"   Travelers: {response.parsed_request.travelers.adults} adults"
-        if response.parsed_request.travelers.children > 0:
-            travelers_text += f", {response.parsed_request.travelers.children} children"
-        lines.append(travelers_text)
-        lines.append(f"   Budget: {response.parsed_request.budget.total_amount}")
-        lines.append("")
+    categories = set()
+    for i, place in enumerate(places, 1):
+        categories.add(place.category)
+        write(f"   {i}. {place.name}\n"
+              f"      📍 Location: {place.location}\n"
+              f"      🏛️ Category: {place.category}\n"
+              f"      ⭐ Significance: {place.significance}\n")
+        duration = getattr(place, 'estimated_duration', None)
+        if duration:
+            write(f"      ⏱️ Duration: {duration}\n")
+        write("\n")
     
-    # 3. ACTIVITIES (with significance)
-    if response.itinerary and response.itinerary.must_visit_places:
-        lines.append("🎯 ACTIVITIES & ATTRACTIONS")
-        lines.append("   Key Places to Visit:")
-        lines.append("")
-        
-        for i, place in enumerate(response.itinerary.must_visit_places, 1):
-            lines.append(f"   {i}. {place.name}")
-            lines.append(f"      📍 Location: {place.location}")
-            lines.append(f"      🏛️ Category: {place.category}")
-            lines.append(f"      ⭐ Significance: {place.significance}")
-            if hasattr(place, 'estimated_duration') and place.estimated_duration:
-                lines.append(f"      ⏱️ Duration: {place.estimated_duration}")
-            lines.append("")
-        
-        # Activity Summary
-        total_places = len(response.itinerary.must_visit_places)
-        categories = list(set(place.category for place in response.itinerary.must_visit_places))
-        lines.append(f"   📊 Activity Summary: {total_places} places across {len(categories)} categories")
-        lines.append(f"   📂 Categories: {', '.join(categories)}")
-        lines.append("")
+    # Activity Summary
+    write(f"   📊 Activity Summary: {len(places)} places across {len(categories)} categories\n"
+          f"   📂 Categories: {', '.join(categories)}\n\n")
+
+def _format_accommodations(hotels, write):
+    """Accommodations section for a non-empty list of hotel options"""
+    write("🏨 ACCOMMODATIONS\n   Recommended Hotels:\n\n")
     
-    # 4. ACCOMMODATIONS
-    if response.accommodations and response.accommodations.accommodation_options:
-        lines.append("🏨 ACCOMMODATIONS")
-        lines.append("   Recommended Hotels:")
-        lines.append("")
-        
-        for i, hotel in enumerate(response.accommodations.accommodation_options, 1):
-            lines.append(f"   {i}. {hotel.name}")
-            lines.append(f"      📍 Location: {hotel.location}")
-            lines.append(f"      💰 Price: ₹{hotel.price_per_night:,.0f}/night")
-            lines.append(f"      💳 Total Cost: ₹{hotel.total_cost:,.0f}")
-            lines.append(f"      ⭐ Rating: {hotel.rating}")
-            lines.append(f"      🎯 Proximity: {hotel.proximity_score} (to attractions)")
-            if hotel.brief_description:
-                # Truncate description for primary schema
-                desc = hotel.brief_description[:100] + "..." if len(hotel.brief_description) > 100 else hotel.brief_description
-                lines.append(f"      📝 Description: {desc}")
-            lines.append("")
-        
-        # Accommodation Summary
-        total_hotels = len(response.accommodations.accommodation_options)
-        # Calculate average price
-        prices = [hotel.price_per_night for hotel in response.accommodations.accommodation_options if hotel.price_per_night > 0]
-        avg_price = sum(prices) / len(prices) if prices else 0
-        lines.append(f"   📊 Accommodation Summary: {total_hotels} options available")
-        if avg_price > 0:
-            lines.append(f"   💰 Average Price: ₹{avg_price:.0f}/night")
-        lines.append("")
+    price_sum = 0
+    price_count = 0
+    for i, hotel in enumerate(hotels, 1):
+        if hotel.price_per_night > 0:
+            price_sum += hotel.price_per_night
+            price_count += 1
+        write(f"   {i}. {hotel.name}\n"
+              f"      📍 Location: {hotel.location}\n"
+              f"      💰 Price: ₹{hotel.price_per_night:,.0f}/night\n"
+              f"      💳 Total Cost: ₹{hotel.total_cost:,.0f}\n"
+              f"      ⭐ Rating: {hotel.rating}\n"
+              f"      🎯 Proximity: {hotel.proximity_score} (to attractions)\n")
+        if hotel.brief_description:
+            # Truncate description for primary schema
+            desc = hotel.brief_description[:100] + "..." if len(hotel.brief_description) > 100 else hotel.brief_description
+            write(f"      📝 Description: {desc}\n")
+        write("\n")
     
-    # SCHEMA METADATA
-    lines.append("🔍 SCHEMA METADATA")
-    lines.append("-" * 20)
+    # Accommodation Summary with average price
+    avg_price = price_sum / price_count if price_count else 0
+    write(f"   📊 Accommodation Summary: {len(hotels)} options available\n")
+    if avg_price > 0:
+        write(f"   💰 Average Price: ₹{avg_price:.0f}/night\n")
+    write("\n")
+
+def _format_metadata(response: TravelItineraryResponse, write):
+    """Schema metadata section and footer"""
+    write(_METADATA_HEADER)
     if response.workflow_metadata:
-        lines.append(f"   Generation Time: {response.workflow_metadata.total_duration:.1f} seconds")
-        lines.append(f"   Generation Status: {response.get_completion_status()}")
-        
-        # Agent Performance
-        lines.append("   Agent Performance:")
-        for agent in [response.workflow_metadata.request_parser, 
-                     response.workflow_metadata.activities_planner, 
-                     response.workflow_metadata.accommodation_suggester]:
+        metadata = response.workflow_metadata
+        write(f"   Generation Time: {metadata.total_duration:.1f} seconds\n"
+              f"   Generation Status: {response.get_completion_status()}\n"
+              f"   Agent Performance:\n")
+        for agent in [metadata.request_parser, 
+                     metadata.activities_planner, 
+                     metadata.accommodation_suggester]:
             if agent.duration:
-                lines.append(f"   - {agent.agent_name}: {agent.duration:.1f}s ({agent.status.value})")
+                write(f"   - {agent.agent_name}: {agent.duration:.1f}s ({agent.status.value})\n")
     
-    lines.append("")
-    lines.append("✅ Primary schema generation complete")
-    lines.append("=" * 60)
+    write(_SCHEMA_FOOTER)
+
+def _write_schema_sections(response: TravelItineraryResponse, write):
+    """Write the header and whichever destination/activity/hotel sections are populated"""
+    _format_header(response.parsed_request, write)
+    # Section writers only run for sections that have data, as in partial-failure responses
+    if response.itinerary and response.itinerary.must_visit_places:
+        _format_places(response.itinerary.must_visit_places, write)
+    if response.accommodations and response.accommodations.accommodation_options:
+        _format_accommodations(response.accommodations.accommodation_options, write)
+
+def format_primary_schema(response: TravelItineraryResponse) -> str:
+    """Format the response in primary schema format"""
+    buf = io.StringIO()
+    _write_schema_sections(response, buf.write)
+    _format_metadata(response, buf.write)
+    return buf.getvalue()
+
+def format_primary_schema_partial(response: TravelItineraryResponse) -> str:
+    """Format the sections produced so far, without the end-of-run metadata"""
+    buf = io.StringIO()
+    _write_schema_sections(response, buf.write)
+    return buf.getvalue()
+
+# Last (response, rendered text) pair, so displaying and saving format a response only once
+_last_rendered = None
+
+def render_primary_schema(response: TravelItineraryResponse) -> str:
+    """format_primary_schema, reusing the previous rendering for the same response object"""
+    global _last_rendered
+    if _last_rendered is None or _last_rendered[0] is not response:
+        _last_rendered = (response, format_primary_schema(response))
+    return _last_rendered[1]
+
+# Progress indicator (icon, style) keyed by the phase keyword found in a progress message
+_PHASE_RE = re.compile(r"(parsing|finding|planning|accommodation|hotel|assembling|final)", re.I)
+_PHASE_TABLE = {
+    "parsing": ("🔍", Style(color="blue")),
+    "finding": ("🗺️", Style(color="green")),
+    "planning": ("🗺️", Style(color="green")),
+    "accommodation": ("🏨", Style(color="yellow")),
+    "hotel": ("🏨", Style(color="yellow")),
+    "assembling": ("📋", Style(color="magenta")),
+    "final": ("📋", Style(color="magenta")),
+}
+_DEFAULT_PROGRESS_STYLE = ("🔄", Style(color="cyan"))
+
+def _progress_text(message: str) -> Text:
+    """Progress message with the loading indicator for its phase"""
+    match = _PHASE_RE.search(message)
+    icon, style = _PHASE_TABLE[match.group(1).lower()] if match else _DEFAULT_PROGRESS_STYLE
+    return Text(f"{icon} {message}", style=style)
+
+def make_streaming_progress_callback(live: Live):
+    """Progress callback that redraws one status line plus the sections produced so far in the Live display"""
+    status = Text("")
+    preview = Text("")
     
-    return "\n".join(lines)
+    def streaming_progress_callback(message: str, percentage: float, metadata=None, partial_response=None):
+        nonlocal status, preview
+        status = _progress_text(message)
+        if partial_response is not None:
+            preview = Text(format_primary_schema_partial(partial_response))
+        live.update(Group(status, preview), refresh=True)
+    return streaming_progress_callback
 
-def progress_callback(message: str, percentage: float, metadata=None):
-    """Callback function for workflow progress updates"""
-    # Show progress with loading indicators
-    if "parsing" in message.lower():
-        console.print(f"[blue]🔍 {message}[/blue]")
-    elif "finding" in message.lower() or "planning" in message.lower():
-        console.print(f"[green]🗺️ {message}[/green]")
-    elif "accommodation" in message.lower() or "hotel" in message.lower():
-        console.print(f"[yellow]🏨 {message}[/yellow]")
-    elif "assembling" in message.lower() or "final" in message.lower():
-        console.print(f"[magenta]📋 {message}[/magenta]")
-    else:
-        console.print(f"[cyan]🔄 {message}[/cyan]")
+async def _prewarm_workflow() -> TravelItineraryWorkflow:
+    """Build the workflow and its agents in a worker thread while the user is still answering"""
+    return await asyncio.to_thread(TravelItineraryWorkflow)
+
+def _show_parser_response(response: dict, first: bool):
+    """Print the parser's follow-up question or error while the request is incomplete"""
+    if response.get("is_complete"):
+        return
+    if response.get("next_question"):
+        console.print(f"[blue]🤖 {response['next_question']}[/blue]")
+    elif response.get("parse_error"):
+        console.print(f"[red]❌ Error: {response['parse_error']}[/red]")
 
 async def parse_request_interactively(user_input: str) -> dict:
     """Parse the user request using the RequestParserAgent interactively"""
-    parser_agent = RequestParserAgent()
+    parser_agent = get_parser_agent()
+    parser_agent.reset_conversation()
     
     console.print("[green]🔍 Parsing your travel request...[/green]")
     
     try:
-        # Start the conversation
-        response = await parser_agent.start_conversation(user_input)
-        
-        # If the conversation is complete, get the final request
-        if response.get("is_complete"):
-            final_request = parser_agent.get_final_request()
-            console.print("[green]✅ Request parsed successfully![/green]")
-            return final_request
-        
-        # If not complete, continue the conversation
-        while not response.get("is_complete", False):
-            if response.get("next_question"):
-                console.print(f"[blue]🤖 {response['next_question']}[/blue]")
-            elif response.get("parse_error"):
-                console.print(f"[red]❌ Error: {response['parse_error']}[/red]")
-            
-            # Get user response
-            user_response = Prompt.ask("\n[bold]Your response[/bold]")
-            
-            # Continue conversation
-            response = await parser_agent.continue_conversation(user_response)
-        
-        # Get final request
-        final_request = parser_agent.get_final_request()
+        # Ask follow-up questions until every field is collected
+        final_request = await run_parse_loop(parser_agent, user_input, _show_parser_response)
         console.print("[green]✅ Request parsing completed![/green]")
         return final_request
         
@@ -189,74 +225,78 @@ async def parse_request_interactively(user_input: str) -> dict:
 async def interactive_itinerary_generator():
     """Run the interactive itinerary generator"""
     
-    console.print(Panel.fit(
-        "🌍 Interactive Travel Itinerary Generator",
-        style="bold blue"
-    ))
-    
-    console.print("\n[bold]Let's create your perfect travel itinerary! 🚀[/bold]")
-    console.print("Describe your travel request in natural language...\n")
-    
     # Get user input
-    user_input = Prompt.ask("Your travel request")
+    user_input = prompt_travel_request(
+        console, "🌍 Interactive Travel Itinerary Generator",
+        intro="Let's create your perfect travel itinerary! 🚀"
+    )
     
     if not user_input.strip():
         console.print("\n[red]❌ No travel request provided. Exiting.[/red]")
         return None
     
+    # Agent setup (search tools, LLM clients) doesn't depend on the answers, so overlap it with the dialogue
+    workflow_task = asyncio.create_task(_prewarm_workflow())
+    
     # Parse the request first
     parsed_request = await parse_request_interactively(user_input)
     
     # Now run the complete workflow
-    console.print("\n" + "="*60)
-    console.print("[bold blue]🚀 Starting Complete Travel Itinerary Generation...[/bold blue]")
-    console.print("="*60)
+    console.write(_NL_SEP60)
+    console.write("[bold blue]🚀 Starting Complete Travel Itinerary Generation...[/bold blue]")
+    console.write(_SEP60)
     
     # Show what we're about to process
-    console.print(f"\n[dim]Processing: {parsed_request.get('destination', 'Unknown')} for {parsed_request.get('duration', 3)} days[/dim]")
+    console.write(f"\n[dim]Processing: {parsed_request.get('destination', 'Unknown')} for {parsed_request.get('duration', 3)} days[/dim]")
     if parsed_request.get('travelers'):
         travelers = parsed_request['travelers']
-        console.print(f"[dim]Travelers: {travelers.get('adults', 0)} adults, {travelers.get('children', 0)} children[/dim]")
+        console.write(f"[dim]Travelers: {travelers.get('adults', 0)} adults, {travelers.get('children', 0)} children[/dim]")
     if parsed_request.get('budget'):
         budget = parsed_request['budget']
-        console.print(f"[dim]Budget: {budget.get('total_amount')} {budget.get('currency')}[/dim]")
-    console.print()
-    
-    # Import the workflow
-    from workflows.travel_itinerary_workflow import generate_travel_itinerary
+        console.write(f"[dim]Budget: {budget.get('total_amount')} {budget.get('currency')}[/dim]")
+    console.writeln()
     
     # Create a user input string from the parsed request
-    user_input = f"I want to visit {parsed_request.get('destination')} for {parsed_request.get('duration')} days"
+    parts = [f"I want to visit {parsed_request.get('destination')} for {parsed_request.get('duration')} days"]
     if parsed_request.get('travelers'):
         travelers = parsed_request['travelers']
-        user_input += f" with {travelers.get('adults', 0)} adults and {travelers.get('children', 0)} children"
+        parts.append(f"with {travelers.get('adults', 0)} adults and {travelers.get('children', 0)} children")
     if parsed_request.get('budget'):
         budget = parsed_request['budget']
-        user_input += f" with a budget of {budget.get('total_amount')} {budget.get('currency')}"
+        parts.append(f"with a budget of {budget.get('total_amount')} {budget.get('currency')}")
+    user_input = " ".join(parts)
     
-    console.print(f"\n[yellow]Processing complete request:[/yellow] {user_input}")
-    console.print()
+    console.write(f"\n[yellow]Processing complete request:[/yellow] {user_input}")
+    console.writeln()
     
     try:
         # Run the complete workflow
-        console.print("\n[bold green]🎉 Complete Itinerary Generated![/bold green]")
-        console.print("="*60)
+        console.write("\n[bold green]🎉 Complete Itinerary Generated![/bold green]")
+        console.writeln(_SEP60)
+        
+        workflow = await workflow_task
         
-        result = await generate_travel_itinerary(user_input, progress_callback=progress_callback)
+        # Progress ticks redraw in place and sections preview as they land; prompts stay outside
+        # the Live region, and the transient preview is replaced by the full schema below
+        with Live(console=console, auto_refresh=False, transient=True) as live:
+            workflow.progress_callback = make_streaming_progress_callback(live)
+            result = await workflow.execute_workflow(user_input)
         
         # Display results
         console.print("\n")
         
         if result.is_complete():
             console.print("\n[bold green]✅ Full itinerary generated successfully![/bold green]")
-            console.print(format_primary_schema(result))
+            # Plain text: skip markup parsing of the whole report
+            console.print(Text(render_primary_schema(result)))
         elif result.is_partial():
             console.print("\n[yellow]⚠️ Partial results generated. Some agents encountered issues.[/yellow]")
             if result.workflow_metadata and result.workflow_metadata.errors:
-                console.print(f"\n[red]Errors:[/red]")
-                for error in result.workflow_metadata.errors:
-                    console.print(f"- {error}")
-            console.print(format_primary_schema(result))
+                console.write(f"\n[red]Errors:[/red]")
+                for error in result.workflow_metadata.errors[:-1]:
+                    console.write(f"- {error}")
+                console.writeln(f"- {result.workflow_metadata.errors[-1]}")
+            console.print(Text(render_primary_schema(result)))
         else:
             console.print("\n[red]❌ Failed to generate itinerary. Check logs for details.[/red]")
         
@@ -273,18 +313,25 @@ async def main():
         if result:
             console.print(f"\n[green]✅ Successfully generated itinerary![/green]")
             
-            # Ask if user wants to save to file
-            save_to_file = Prompt.ask(
-                "\nWould you like to save the itinerary to a file?", 
-                choices=["y", "n"], 
-                default="n"
-            )
+            # Ask if user wants to save to file; scripted runs take the answers from the environment
+            interactive = sys.stdin.isatty()
+            if interactive:
+                save_to_file = Prompt.ask(
+                    "\nWould you like to save the itinerary to a file?", 
+                    choices=["y", "n"], 
+                    default="n"
+                )
+            else:
+                save_to_file = os.environ.get("SAVE_ITINERARY", "n")
             
             if save_to_file.lower() == "y":
-                filename = Prompt.ask("Enter filename", default="itinerary.txt")
+                if interactive:
+                    filename = Prompt.ask("Enter filename", default="itinerary.txt")
+                else:
+                    filename = os.environ.get("ITINERARY_FILENAME", "itinerary.txt")
                 try:
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(format_primary_schema(result))
+                    # Write in a worker thread so a large itinerary doesn't stall the event loop
+                    await asyncio.to_thread(Path(filename).write_text, render_primary_schema(result), encoding='utf-8')
                     console.print(f"[green]✅ Itinerary saved to {filename}[/green]")
                 except Exception as e:
                     console.print(f"[red]❌ Failed to save file: {str(e)}[/red]")
@@ -10,70 +10,44 @@ import asyncio
 import sys
 import os
 from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
 from rich.text import Text
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from agents.request_parser import RequestParserAgent
+from cli._shared import format_final_request, get_parser_agent, prompt_travel_request, run_parse_loop
 
 console = Console()
 
+def _show_agent_response(response: dict, first: bool):
+    """Print the agent's reply to the last turn"""
+    prefix = "" if first else "\n"
+    if response.get("message"):
+        console.print(f"{prefix}[bold blue]Agent:[/bold blue] {response['message']}")
+
 async def interactive_request_parser():
     """Run the RequestParserAgent in interactive mode"""
     
-    console.print(Panel.fit(
-        "🌍 Interactive Travel Request Parser",
-        style="bold blue"
-    ))
+    initial_input = prompt_travel_request(console, "🌍 Interactive Travel Request Parser")
     
     # Initialize the agent
-    parser_agent = RequestParserAgent()
-    
-    # Get initial request
-    console.print("\n[bold]Let's plan your perfect trip! 🚀[/bold]")
-    console.print("Describe your travel request in natural language...\n")
-    
-    initial_input = Prompt.ask("Your travel request")
+    parser_agent = get_parser_agent()
+    parser_agent.reset_conversation()
     
     # Start conversation
     console.print(f"\n[yellow]Processing:[/yellow] {initial_input}")
     console.print()
     
     try:
-        # Start the conversation
-        response = await parser_agent.start_conversation(initial_input)
-        
-        # Display the agent's response
-        if response.get("message"):
-            console.print(f"[bold blue]Agent:[/bold blue] {response['message']}")
-        
         # Continue conversation until complete
-        while not response.get("is_complete", False):
-            # Get user response
-            user_response = Prompt.ask("\n[bold]Your response[/bold]")
-            
-            # Continue conversation
-            response = await parser_agent.continue_conversation(user_response)
-            
-            # Display agent response
-            if response.get("message"):
-                console.print(f"\n[bold blue]Agent:[/bold blue] {response['message']}")
-        
-        # Get final request
-        final_request = parser_agent.get_final_request()
+        final_request = await run_parse_loop(parser_agent, initial_input, _show_agent_response)
         
         console.print("\n" + "="*60)
         console.print("[bold green]✅ Request parsing completed![/bold green]")
         console.print("="*60)
         
         # Display parsed information
-        console.print(f"\n[bold]Destination:[/bold] {final_request.get('destination', 'Not specified')}")
-        console.print(f"[bold]Duration:[/bold] {final_request.get('duration', 'Not specified')} days")
-        console.print(f"[bold]Travelers:[/bold] {final_request.get('travelers', 'Not specified')}")
-        console.print(f"[bold]Budget:[/bold] {final_request.get('budget', 'Not specified')}")
+        console.print(format_final_request(final_request))
         
         return final_request
         
@@ -8,81 +8,64 @@ This script provides a clean interactive interface that properly displays AI res
 import asyncio
 import sys
 import os
-from rich.console import Console
+from pathlib import Path
 from rich.prompt import Prompt
-from rich.panel import Panel
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from agents.request_parser import RequestParserAgent
+from cli._shared import format_final_request, get_parser_agent, prompt_travel_request, run_parse_loop
+from cli.buffered_console import BufferedConsole
 
-console = Console()
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
+
+console = BufferedConsole()
+
+_SEP60 = "=" * 60
+_NL_SEP60 = "\n" + _SEP60
+
+def _show_agent_response(response: dict, first: bool):
+    """Print the agent's reply to the last turn"""
+    prefix = "" if first else "\n"
+    if response.get("next_question"):
+        console.print(f"{prefix}[bold blue]Agent:[/bold blue] {response['next_question']}")
+    elif response.get("parse_error"):
+        console.print(f"{prefix}[red]Error:[/red] {response['parse_error']}")
+    elif response.get("final_message"):
+        console.print(f"{prefix}[bold green]Agent:[/bold green] {response['final_message']}")
 
 async def simple_interactive_parser():
     """Run the RequestParserAgent in a simple interactive mode"""
     
-    console.print(Panel.fit(
-        "🌍 Simple Interactive Travel Request Parser",
-        style="bold blue"
-    ))
+    initial_input = prompt_travel_request(console, "🌍 Simple Interactive Travel Request Parser")
     
     # Initialize the agent
-    parser_agent = RequestParserAgent()
-    
-    # Get initial request
-    console.print("\n[bold]Let's plan your perfect trip! 🚀[/bold]")
-    console.print("Describe your travel request in natural language...\n")
-    
-    initial_input = Prompt.ask("Your travel request")
+    parser_agent = get_parser_agent()
+    parser_agent.reset_conversation()
     
     # Start conversation
     console.print(f"\n[yellow]Processing:[/yellow] {initial_input}")
     console.print()
     
     try:
-        # Start the conversation
-        response = await parser_agent.start_conversation(initial_input)
-        
-        # Display the agent's response
-        if response.get("next_question"):
-            console.print(f"[bold blue]Agent:[/bold blue] {response['next_question']}")
-        elif response.get("parse_error"):
-            console.print(f"[red]Error:[/red] {response['parse_error']}")
-        
         # Continue conversation until complete
-        while not response.get("is_complete", False):
-            # Get user response
-            user_response = Prompt.ask("\n[bold]Your response[/bold]")
-            
-            # Continue conversation
-            response = await parser_agent.continue_conversation(user_response)
-            
-            # Display agent response
-            if response.get("next_question"):
-                console.print(f"\n[bold blue]Agent:[/bold blue] {response['next_question']}")
-            elif response.get("parse_error"):
-                console.print(f"\n[red]Error:[/red] {response['parse_error']}")
-            elif response.get("final_message"):
-                console.print(f"\n[bold green]Agent:[/bold green] {response['final_message']}")
-        
-        # Get final request
-        final_request = parser_agent.get_final_request()
+        final_request = await run_parse_loop(parser_agent, initial_input, _show_agent_response)
         
-        console.print("\n" + "="*60)
-        console.print("[bold green]✅ Request parsing completed![/bold green]")
-        console.print("="*60)
+        console.write(_NL_SEP60)
+        console.write("[bold green]✅ Request parsing completed![/bold green]")
+        console.write(_SEP60)
         
         # Display parsed information
-        console.print(f"\n[bold]Destination:[/bold] {final_request.get('destination', 'Not specified')}")
-        console.print(f"[bold]Duration:[/bold] {final_request.get('duration', 'Not specified')} days")
-        console.print(f"[bold]Travelers:[/bold] {final_request.get('travelers', 'Not specified')}")
-        console.print(f"[bold]Budget:[/bold] {final_request.get('budget', 'Not specified')}")
+        console.write(format_final_request(final_request))
         
         # Now run the complete workflow
-        console.print("\n" + "="*60)
-        console.print("[bold blue]🚀 Starting Complete Travel Itinerary Generation...[/bold blue]")
-        console.print("="*60)
+        console.write(_NL_SEP60)
+        console.write("[bold blue]🚀 Starting Complete Travel Itinerary Generation...[/bold blue]")
+        console.writeln(_SEP60)
         
         # Import the workflow
         from workflows.travel_itinerary_workflow import generate_travel_itinerary
@@ -96,48 +79,50 @@ async def simple_interactive_parser():
             budget = final_request['budget']
             user_input += f" with a budget of {budget.get('total_amount')} {budget.get('currency')}"
         
-        console.print(f"\n[yellow]Processing complete request:[/yellow] {user_input}")
-        console.print()
+        console.write(f"\n[yellow]Processing complete request:[/yellow] {user_input}")
+        console.writeln()
         
         # Run the complete workflow
         try:
             response = await generate_travel_itinerary(user_input, progress_callback=None)
             
             # Display the results
-            console.print("\n" + "="*60)
-            console.print("[bold green]🎉 Complete Itinerary Generated![/bold green]")
-            console.print("="*60)
+            console.write(_NL_SEP60)
+            console.write("[bold green]🎉 Complete Itinerary Generated![/bold green]")
+            console.writeln(_SEP60)
             
             if response.is_complete():
-                console.print("\n[bold green]✅ Full itinerary generated successfully![/bold green]")
+                console.write("\n[bold green]✅ Full itinerary generated successfully![/bold green]")
                 
                 # Display itinerary summary
                 if response.itinerary:
-                    console.print(f"\n[bold]📅 Itinerary Summary:[/bold]")
-                    console.print(f"Destination: {response.parsed_request.destination}")
-                    console.print(f"Duration: {response.parsed_request.duration} days")
-                    console.print(f"Travelers: {response.parsed_request.travelers}")
-                    console.print(f"Budget: {response.parsed_request.budget}")
+                    console.write(f"\n[bold]📅 Itinerary Summary:[/bold]")
+                    console.write(f"Destination: {response.parsed_request.destination}")
+                    console.write(f"Duration: {response.parsed_request.duration} days")
+                    console.write(f"Travelers: {response.parsed_request.travelers}")
+                    console.write(f"Budget: {response.parsed_request.budget}")
                     
                     # Display activities from daily itineraries
                     if response.itinerary.daily_itineraries:
-                        console.print(f"\n[bold]🎯 Daily Activities:[/bold]")
+                        out = ["\n[bold]🎯 Daily Activities:[/bold]"]
                         for day_num, day_itinerary in enumerate(response.itinerary.daily_itineraries, 1):
-                            console.print(f"\n[bold]Day {day_num}:[/bold]")
+                            out.append(f"\n[bold]Day {day_num}:[/bold]")
                             if day_itinerary.activities:
-                                for i, activity in enumerate(day_itinerary.activities, 1):
-                                    console.print(f"  {i}. {activity.name} - {activity.description}")
+                                out.extend(f"  {i}. {activity.name} - {activity.description}"
+                                           for i, activity in enumerate(day_itinerary.activities, 1))
                             else:
-                                console.print("  No activities planned for this day")
+                                out.append("  No activities planned for this day")
+                        console.write("\n".join(out))
                     
                     # Display accommodations
                     if response.accommodations and response.accommodations.accommodation_options:
-                        console.print(f"\n[bold]🏨 Accommodations:[/bold]")
+                        console.write(f"\n[bold]🏨 Accommodations:[/bold]")
                         for i, acc in enumerate(response.accommodations.accommodation_options, 1):
-                            console.print(f"{i}. {acc.name} - {acc.location} (₹{acc.price_per_night}/night)")
+                            console.write(f"{i}. {acc.name} - {acc.location} (₹{acc.price_per_night}/night)")
                     elif response.accommodations:
-                        console.print(f"\n[bold]🏨 Accommodations:[/bold]")
-                        console.print("No accommodation options found")
+                        console.write(f"\n[bold]🏨 Accommodations:[/bold]")
+                        console.write("No accommodation options found")
+                console.writeln()
                 
             elif response.is_partial():
                 console.print("\n[yellow]⚠️ Partial results generated. Some agents encountered issues.[/yellow]")
@@ -157,9 +142,13 @@ async def simple_interactive_parser():
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     filename = f"itinerary_{final_request.get('destination', 'trip').lower()}_{timestamp}.json"
                     
-                    import json
-                    with open(filename, "w", encoding="utf-8") as f:
-                        json.dump(response.to_dict(), f, indent=2, default=str)
+                    if orjson is not None:
+                        payload = orjson.dumps(response.to_dict(), option=orjson.OPT_INDENT_2, default=str)
+                    else:
+                        import json
+                        payload = json.dumps(response.to_dict(), indent=2, default=str).encode("utf-8")
+                    # Write in a worker thread so a large itinerary doesn't stall the event loop
+                    await asyncio.to_thread(Path(filename).write_bytes, payload)
                     
                     console.print(f"\n[green]✅ Itinerary saved to: {filename}[/green]")
                 except Exception as save_error:
@@ -9,7 +9,9 @@ import sys
 import os
 
 # Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 from cli.generate_itinerary import format_primary_output
 from workflows.data_models import TravelItineraryResponse, WorkflowMetadata, AgentExecution
@@ -18,6 +20,18 @@ from agents.activities_planner import Place, ItineraryOutput
 from agents.accommodation_suggester import AccommodationOption, AccommodationOutput
 
 
+# Output banners, assembled once
+_TEST_BANNER = f"🧪 Testing Primary Schema Output Format\n{'=' * 50}\n"
+_OUTPUT_HEADER = f"🎯 PRIMARY SCHEMA OUTPUT:\n{'-' * 30}"
+
+# Sample agent execution spans: (agent name, start time, end time)
+_SAMPLE_SPANS = (
+    ("RequestParser", 1705401600.0, 1705401608.2),
+    ("ActivitiesPlanner", 1705401608.2, 1705401675.5),
+    ("AccommodationSuggester", 1705401675.5, 1705401765.6),
+)
+
+
 def create_sample_response():
     """Create a sample TravelItineraryResponse for testing"""
     
@@ -104,32 +118,17 @@ def create_sample_response():
         accommodation_options=accommodations_list
     )
     
-    # Create sample workflow metadata
+    # Create sample workflow metadata from (agent, start, end) spans
     agent_metadata = [
         AgentExecution(
-            agent_name="RequestParser",
-            start_time=1705401600.0,  # Unix timestamp
-            end_time=1705401608.2,
-            duration=8.2,
-            status="completed",
-            error_message=None
-        ),
-        AgentExecution(
-            agent_name="ActivitiesPlanner", 
-            start_time=1705401608.2,
-            end_time=1705401675.5,
-            duration=67.3,
-            status="completed",
-            error_message=None
-        ),
-        AgentExecution(
-            agent_name="AccommodationSuggester",
-            start_time=1705401675.5,
-            end_time=1705401765.6,
-            duration=90.1,
+            agent_name=name,
+            start_time=start,  # Unix timestamp
+            end_time=end,
+            duration=round(end - start, 1),
             status="completed",
             error_message=None
         )
+        for name, start, end in _SAMPLE_SPANS
     ]
     
     workflow_metadata = WorkflowMetadata(
@@ -155,9 +154,7 @@ def create_sample_response():
 
 def main():
     """Test the primary format output"""
-    print("🧪 Testing Primary Schema Output Format")
-    print("=" * 50)
-    print()
+    print(_TEST_BANNER)
     
     # Create sample response
     response = create_sample_response()
@@ -167,8 +164,7 @@ def main():
     primary_output = format_primary_output(response)
     
     print()
-    print("🎯 PRIMARY SCHEMA OUTPUT:")
-    print("-" * 30)
+    print(_OUTPUT_HEADER)
     print(primary_output)
     
     print()
@@ -4,28 +4,79 @@ Allows interactive testing of the conversation flow
 """
 
 import asyncio
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
-# Add project root to Python path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
-from src.agents.request_parser import RequestParserAgent
+# Add src to path for imports, so modules load under the same names the agents use
+# (importing via "src." would load a second copy of the agents and config modules)
+_src_dir = str(project_root / "src")
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
+from agents.request_parser import RequestParserAgent
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('request_parser_test.log')
-    ]
+
+# Configure logging: records are queued and written by a listener thread,
+# so the conversation loop never blocks on file or console I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('request_parser_test.log', delay=True)
+_file_handler.setFormatter(_log_formatter)
+_console_handler = logging.StreamHandler()
+_console_handler.setLevel(logging.WARNING)
+_console_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _console_handler, respect_handler_level=True
 )
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+# Stopping the listener drains the queue and flushes the file on exit
+atexit.register(_log_listener.stop)
+
+
+# Banner rules used by the display helpers
+_RULE40 = "-" * 40
+_RULE50 = "=" * 50
+_RULE60 = "=" * 60
+
+# Multi-line banners, assembled once
+_SESSION_BANNER = "\n".join((
+    "\n" + _RULE60,
+    "🤖 REQUESTPARSER AGENT - INTERACTIVE TEST",
+    _RULE60,
+    "This agent will help you plan your trip by collecting:",
+    "1. 🌍 Destination (where you want to go)",
+    "2. ⏰ Duration (how many days)",
+    "3. 👥 Travelers (adults and children)",
+    "4. 💰 Budget (total amount with currency)",
+    "\nType 'quit' to exit, 'reset' to start over",
+    _RULE60,
+))
+_SCENARIOS_BANNER = f"\n{_RULE60}\n🧪 RUNNING TEST SCENARIOS\n{_RULE60}"
+_SUMMARY_BANNER = f"\n{_RULE50}\n🎯 TRIP SUMMARY\n{_RULE50}"
+_RESPONSE_RULE = "\n" + _RULE40
+_SCENARIO_END = "\n" + "=" * 40
+
+# Response keys read by the display helpers, in unpacking order
+_MESSAGE_FIELDS = ("parse_error", "needs_disambiguation", "next_question", "final_message")
+_PROGRESS_FIELDS = ("destination", "duration", "travelers", "budget", "missing_fields")
+_SUMMARY_FIELDS = _PROGRESS_FIELDS[:4]
+
+
+def _emit(lines):
+    """Write a block of display lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class RequestParserCLI:
@@ -48,28 +99,19 @@ class RequestParserCLI:
     
     async def run_interactive_session(self):
         """Run an interactive conversation session"""
-        print("\n" + "="*60)
-        print("🤖 REQUESTPARSER AGENT - INTERACTIVE TEST")
-        print("="*60)
-        print("This agent will help you plan your trip by collecting:")
-        print("1. 🌍 Destination (where you want to go)")
-        print("2. ⏰ Duration (how many days)")
-        print("3. 👥 Travelers (adults and children)")
-        print("4. 💰 Budget (total amount with currency)")
-        print("\nType 'quit' to exit, 'reset' to start over")
-        print("="*60)
+        print(_SESSION_BANNER)
         
         conversation_active = True
         first_input = True
         
         while conversation_active:
             try:
-                # Get user input
+                # Get user input off the event loop so background tasks keep running
                 if first_input:
-                    user_input = input("\n🚀 Tell me about your travel plans: ").strip()
+                    user_input = (await asyncio.to_thread(input, "\n🚀 Tell me about your travel plans: ")).strip()
                     first_input = False
                 else:
-                    user_input = input("\n💬 Your response: ").strip()
+                    user_input = (await asyncio.to_thread(input, "\n💬 Your response: ")).strip()
                 
                 # Handle special commands
                 if user_input.lower() == 'quit':
@@ -103,7 +145,7 @@ class RequestParserCLI:
                     self._display_final_summary(response)
                     
                     # Ask if user wants to start a new conversation
-                    new_conversation = input("\n🔄 Start a new trip plan? (y/n): ").strip().lower()
+                    new_conversation = (await asyncio.to_thread(input, "\n🔄 Start a new trip plan? (y/n): ")).strip().lower()
                     if new_conversation == 'y':
                         self.agent.reset_conversation()
                         first_input = True
@@ -121,83 +163,83 @@ class RequestParserCLI:
     
     def _display_agent_response(self, response: dict):
         """Display the agent's response in a user-friendly format"""
-        print("\n" + "-"*40)
-        
-        # Show error if present
-        if response.get("parse_error"):
-            print(f"❌ {response['parse_error']}")
-            return
-        
-        # Show disambiguation request
-        if response.get("needs_disambiguation"):
-            print(f"🤔 {response['needs_disambiguation']}")
-            return
+        _emit(self._agent_response_lines(response))
+    
+    def _agent_response_lines(self, response: dict) -> list:
+        """Display lines for the agent's response"""
+        lines = [_RESPONSE_RULE]
         
-        # Show next question
-        if response.get("next_question"):
-            print(f"🤖 {response['next_question']}")
+        parse_error, needs_disambiguation, next_question, final_message = map(response.get, _MESSAGE_FIELDS)
         
-        # Show final message if complete
-        if response.get("final_message"):
-            print(f"✅ {response['final_message']}")
+        if parse_error:
+            # Show error if present
+            lines.append(f"❌ {parse_error}")
+        elif needs_disambiguation:
+            # Show disambiguation request
+            lines.append(f"🤔 {needs_disambiguation}")
+        else:
+            # Show next question
+            if next_question:
+                lines.append(f"🤖 {next_question}")
+            
+            # Show final message if complete
+            if final_message:
+                lines.append(f"✅ {final_message}")
+            
+            # Show progress
+            lines.extend(self._progress_lines(response))
         
-        # Show progress
-        self._show_progress(response)
+        return lines
     
-    def _show_progress(self, response: dict):
-        """Show collection progress"""
+    def _progress_lines(self, response: dict) -> list:
+        """Collection progress lines"""
+        destination, duration, travelers, budget, missing = map(response.get, _PROGRESS_FIELDS)
+        lines = []
         collected = []
         
-        if response.get("destination"):
-            collected.append(f"🌍 {response['destination']}")
-        if response.get("duration"):
-            collected.append(f"⏰ {response['duration']} days")
-        if response.get("travelers"):
-            travelers = response["travelers"]
+        if destination:
+            collected.append(f"🌍 {destination}")
+        if duration:
+            collected.append(f"⏰ {duration} days")
+        if travelers:
             collected.append(f"👥 {travelers['total']} people ({travelers['adults']} adults, {travelers['children']} children)")
-        if response.get("budget"):
-            budget = response["budget"]
+        if budget:
             collected.append(f"💰 {budget['total_amount']} {budget['currency']}")
-            if budget.get("accommodation_type"):
-                accommodation_type = budget["accommodation_type"]
-                if hasattr(accommodation_type, 'value'):
-                    collected.append(f"🏨 {accommodation_type.value.title()} accommodation")
-                else:
-                    collected.append(f"🏨 {str(accommodation_type).title()} accommodation")
+            accommodation_type = budget.get("accommodation_type")
+            if accommodation_type:
+                # Enum members carry the label in .value; plain strings are used as-is
+                label = getattr(accommodation_type, 'value', None) or str(accommodation_type)
+                collected.append(f"🏨 {label.title()} accommodation")
         
         if collected:
-            print(f"\n📝 Collected so far: {' | '.join(collected)}")
+            lines.append(f"\n📝 Collected so far: {' | '.join(collected)}")
         
-        missing = response.get("missing_fields", [])
         if missing:
-            print(f"⏳ Still needed: {', '.join(missing)}")
+            lines.append(f"⏳ Still needed: {', '.join(missing)}")
+        return lines
     
     def _display_final_summary(self, response: dict):
         """Display final trip summary"""
-        print("\n" + "="*50)
-        print("🎯 TRIP SUMMARY")
-        print("="*50)
+        destination, duration, travelers, budget = map(response.get, _SUMMARY_FIELDS)
+        lines = [_SUMMARY_BANNER]
         
-        if response.get("destination"):
-            print(f"🌍 Destination: {response['destination']}")
-        if response.get("duration"):
-            print(f"⏰ Duration: {response['duration']} days")
-        if response.get("travelers"):
-            travelers = response["travelers"]
-            print(f"👥 Travelers: {travelers['total']} people")
-            print(f"   - Adults: {travelers['adults']}")
-            print(f"   - Children: {travelers['children']}")
-        if response.get("budget"):
-            budget = response["budget"]
-            print(f"💰 Budget: {budget['total_amount']} {budget['currency']}")
-            if budget.get("accommodation_type"):
-                accommodation_type = budget["accommodation_type"]
-                if hasattr(accommodation_type, 'value'):
-                    print(f"🏨 Accommodation: {accommodation_type.value.title()}")
-                else:
-                    print(f"🏨 Accommodation: {str(accommodation_type).title()}")
+        if destination:
+            lines.append(f"🌍 Destination: {destination}")
+        if duration:
+            lines.append(f"⏰ Duration: {duration} days")
+        if travelers:
+            lines.append(f"👥 Travelers: {travelers['total']} people")
+            lines.append(f"   - Adults: {travelers['adults']}")
+            lines.append(f"   - Children: {travelers['children']}")
+        if budget:
+            lines.append(f"💰 Budget: {budget['total_amount']} {budget['currency']}")
+            accommodation_type = budget.get("accommodation_type")
+            if accommodation_type:
+                label = getattr(accommodation_type, 'value', None) or str(accommodation_type)
+                lines.append(f"🏨 Accommodation: {label.title()}")
         
-        print("="*50)
+        lines.append(_RULE50)
+        _emit(lines)
     
     async def run_test_scenarios(self):
         """Run predefined test scenarios"""
@@ -226,34 +268,38 @@ class RequestParserCLI:
             }
         ]
         
-        print("\n" + "="*60)
-        print("🧪 RUNNING TEST SCENARIOS")
-        print("="*60)
+        print(_SCENARIOS_BANNER)
         
-        for i, scenario in enumerate(test_scenarios, 1):
-            print(f"\n📋 Test {i}: {scenario['name']}")
-            print("-" * 40)
+        # Scenarios are independent, so run them concurrently and print each one's output as a block
+        results = await asyncio.gather(
+            *(self._run_scenario(i, scenario) for i, scenario in enumerate(test_scenarios, 1))
+        )
+        for lines in results:
+            _emit(lines)
+    
+    async def _run_scenario(self, number: int, scenario: dict) -> list:
+        """Run one scenario on its own agent and return its display lines"""
+        agent = RequestParserAgent()
+        lines = [f"\n📋 Test {number}: {scenario['name']}", _RULE40]
+        
+        # Process inputs
+        for j, user_input in enumerate(scenario['inputs']):
+            lines.append(f"\nUser Input {j+1}: {user_input}")
             
-            # Reset agent for each scenario
-            self.agent.reset_conversation()
+            if j == 0:
+                response = await agent.start_conversation(user_input)
+            else:
+                response = await agent.continue_conversation(user_input)
             
-            # Process inputs
-            for j, user_input in enumerate(scenario['inputs']):
-                print(f"\nUser Input {j+1}: {user_input}")
-                
-                if j == 0:
-                    response = await self.agent.start_conversation(user_input)
-                else:
-                    response = await self.agent.continue_conversation(user_input)
-                
-                print("Agent Response:")
-                self._display_agent_response(response)
-                
-                if response.get("is_complete"):
-                    print("✅ Scenario completed successfully!")
-                    break
+            lines.append("Agent Response:")
+            lines.extend(self._agent_response_lines(response))
             
-            print("\n" + "="*40)
+            if response.get("is_complete"):
+                lines.append("✅ Scenario completed successfully!")
+                break
+        
+        lines.append(_SCENARIO_END)
+        return lines
 
 
 async def main():
@@ -292,6 +338,13 @@ if __name__ == "__main__":
         print("Please add your OpenRouter API key to the .env file")
         sys.exit(1)
     
+    # Use uvloop's faster event loop when it's installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     # Run the CLI
     try:
         asyncio.run(main())
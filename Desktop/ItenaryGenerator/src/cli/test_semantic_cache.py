@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the itinerary SemanticCache
+
+Checks the exact and semantic tiers against a temporary database, without
+running the workflow.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to path for imports
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+
+from cli.test_primary_format import create_sample_response
+from workflows.semantic_cache import SemanticCache
+
+
+_LYON_REQUEST = "We want a 5 day family trip to Lyon with 2 adults and 1 child, budget 3000 USD"
+
+
+def _lyon_response():
+    """Sample response whose parsed destination is Lyon"""
+    response = create_sample_response()
+    response.parsed_request.destination = "Lyon, France"
+    return response
+
+
+def _cache(tmp_dir: str, **kwargs) -> SemanticCache:
+    """Cache in a temporary directory holding the Lyon response"""
+    cache = SemanticCache(os.path.join(tmp_dir, "itineraries.sqlite3"), **kwargs)
+    cache.put(_LYON_REQUEST, _lyon_response())
+    return cache
+
+
+def test_exact_and_reworded_hits():
+    """The same request and a reworded one reuse the cached itinerary"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = _cache(tmp_dir)
+        try:
+            exact = cache.get(_LYON_REQUEST)
+            assert exact is not None
+            assert "cache_hit (exact)" in exact.workflow_metadata.performance_notes
+            reworded = "Please plan a 5 day family holiday in Lyon for 2 adults and 1 child, budget 3000 USD"
+            hit = cache.get(reworded)
+            assert hit is not None
+            assert hit.user_input == reworded
+            assert any(note.startswith("cache_hit (semantic") for note in hit.workflow_metadata.performance_notes)
+        finally:
+            cache.close()
+
+
+def test_destination_only_differs_misses():
+    """A request that only changes the city must not get the other city's itinerary"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = _cache(tmp_dir)
+        try:
+            assert cache.get(_LYON_REQUEST.replace("Lyon", "Nice")) is None
+        finally:
+            cache.close()
+
+
+def test_currency_or_roles_differ_misses():
+    """The same numbers in another currency or for other travelers must miss"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = _cache(tmp_dir)
+        try:
+            assert cache.get(_LYON_REQUEST.replace("USD", "EUR")) is None
+            assert cache.get(_LYON_REQUEST.replace("3000 USD", "₹3000")) is None
+            assert cache.get(_LYON_REQUEST.replace("2 adults and 1 child", "1 adult and 2 children")) is None
+        finally:
+            cache.close()
+
+
+def test_expired_entries_miss():
+    """Entries older than the TTL are not served"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = _cache(tmp_dir, ttl=0)
+        try:
+            assert cache.get(_LYON_REQUEST) is None
+        finally:
+            cache.close()
+
+
+def main():
+    """Run the SemanticCache checks"""
+    print("🧪 Testing SemanticCache")
+    for test in (test_exact_and_reworded_hits, test_destination_only_differs_misses,
+                 test_currency_or_roles_differ_misses, test_expired_entries_miss):
+        test()
+        print(f"✅ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,47 +3,57 @@ Centralized Model Configuration
 All model names and configurations used across the project
 """
 
+from types import MappingProxyType
+
+# Model names shared between the tables below, so each is stored once
+_DEEPSEEK_V3 = "deepseek-chat-v3-0324"
+_DEEPSEEK_V3_FREE = "openrouter/deepseek/deepseek-chat-v3-0324:free"
+
 # Model configurations for different agents and purposes
-MODELS = {
+MODELS = MappingProxyType({
     # Core agent models - Using cheaper models to avoid credit limits
-    "REQUEST_PARSER": "openrouter/deepseek/deepseek-chat-v3-0324:free",
-    "ACTIVITIES_PLANNER": "openrouter/deepseek/deepseek-chat-v3-0324:free", 
-    "ACCOMMODATION_SUGGESTER": "openrouter/deepseek/deepseek-chat-v3-0324:free",
-    "COST_ESTIMATOR": "openrouter/deepseek/deepseek-chat-v3-0324:free",
+    "REQUEST_PARSER": _DEEPSEEK_V3_FREE,
+    "ACTIVITIES_PLANNER": _DEEPSEEK_V3_FREE,
+    "ACCOMMODATION_SUGGESTER": _DEEPSEEK_V3_FREE,
+    "COST_ESTIMATOR": _DEEPSEEK_V3_FREE,
     
     # Factory function defaults (for openrouter_config.py)
-    "DEFAULT_REQUEST_PARSER": "deepseek-chat-v3-0324",
-    "DEFAULT_ACTIVITIES_PLANNER": "deepseek-chat-v3-0324",
-    "DEFAULT_ACCOMMODATION_SUGGESTER": "deepseek-chat-v3-0324",
-    "DEFAULT_COST_ESTIMATOR": "deepseek-chat-v3-0324",
+    "DEFAULT_REQUEST_PARSER": _DEEPSEEK_V3,
+    "DEFAULT_ACTIVITIES_PLANNER": _DEEPSEEK_V3,
+    "DEFAULT_ACCOMMODATION_SUGGESTER": _DEEPSEEK_V3,
+    "DEFAULT_COST_ESTIMATOR": _DEEPSEEK_V3,
     
     # General purpose models
-    "DEFAULT_AGENT": "deepseek-chat-v3-0324",
-    "TEST_AGENT": "deepseek-chat-v3-0324",
-}
+    "DEFAULT_AGENT": _DEEPSEEK_V3,
+    "TEST_AGENT": _DEEPSEEK_V3,
+})
 
 # OpenRouter model mappings (from openrouter_config.py)
-GEMINI_MODELS = {
+GEMINI_MODELS = MappingProxyType({
     "gemini-pro": "openrouter/google/gemini-pro",
     "gemini-pro-vision": "openrouter/google/gemini-pro-vision", 
     "gemini-1.5-pro": "openrouter/google/gemini-1.5-pro",
     "gemini-1.5-flash": "openrouter/google/gemini-1.5-flash",
     "gemini-2.0-flash": "openrouter/google/gemini-2.0-flash",
     "gemini-2.5-pro": "openrouter/google/gemini-2.5-pro",
-}
+})
 
 # Cheaper alternative models
-CHEAP_MODELS = {
-    "deepseek-chat-v3-0324": "openrouter/deepseek/deepseek-chat-v3-0324:free",
+CHEAP_MODELS = MappingProxyType({
+    _DEEPSEEK_V3: _DEEPSEEK_V3_FREE,
     "deepseek-chat-v3-0324-paid": "openrouter/deepseek/deepseek-chat-v3-0324",
     "mistral-7b": "openrouter/mistralai/mistral-7b-instruct:free",
     "llama-3.1-8b": "openrouter/meta-llama/llama-3.1-8b-instruct:free",
-}
+})
+
+# Case-insensitive view of MODELS for agent names not given in canonical upper case
+_MODELS_BY_LOWER = {name.lower(): model for name, model in MODELS.items()}
 
 # Convenience functions
 def get_model(agent_name):
     """Get the model for a specific agent"""
-    return MODELS.get(agent_name.upper())
+    model = MODELS.get(agent_name)
+    return model if model is not None else _MODELS_BY_LOWER.get(agent_name.lower())
 
 def get_openrouter_model(model_name):
     """Get the full OpenRouter model path for a Gemini model"""
@@ -53,13 +63,20 @@ def get_cheap_model(model_name):
     """Get a cheaper model to avoid credit limits"""
     return CHEAP_MODELS.get(model_name)
 
+def supports_prompt_caching(model):
+    """Check whether a model accepts explicit cache_control breakpoints (Anthropic via OpenRouter)"""
+    return "anthropic/" in model or "claude" in model
+
+# Model tables are static, so the listing is built once at import
+_AVAILABLE_MODELS = {
+    "Agent Models": MODELS,
+    "Gemini Models": GEMINI_MODELS,
+    "Cheap Models": CHEAP_MODELS
+}
+
 def list_available_models():
     """List all available models"""
-    return {
-        "Agent Models": MODELS,
-        "Gemini Models": GEMINI_MODELS,
-        "Cheap Models": CHEAP_MODELS
-    }
+    return _AVAILABLE_MODELS
 
 # Example usage:
 # from config.model_used import get_model, get_openrouter_model
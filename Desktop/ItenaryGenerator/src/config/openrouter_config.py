@@ -3,33 +3,65 @@ OpenRouter Configuration for Google ADK
 Using LiteLLM to access Gemini models via OpenRouter with OpenAI API schema
 """
 
+import functools
 import os
-from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from typing import TYPE_CHECKING, NamedTuple
 from .model_used import GEMINI_MODELS, MODELS
 
-# Load environment variables
+# Load environment variables (agents importing this module read their API keys from it)
 from dotenv import load_dotenv
 load_dotenv()
 
+# google-adk is imported where agents are built, so importing the config alone stays cheap
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
+    from google.adk.models.lite_llm import LiteLlm
+
+DEFAULT_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+class _Cfg(NamedTuple):
+    """Validated OpenRouter settings"""
+    api_key: str
+    base_url: str
+
+@functools.cache
+def _config() -> _Cfg:
+    """Read and validate the OpenRouter settings once; a missing key is re-checked on the next call"""
+    load_dotenv()
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        raise ValueError(
+            "OPENROUTER_API_KEY not found in environment variables. "
+            "Please add it to your .env file."
+        )
+    return _Cfg(api_key, os.getenv("OPENROUTER_BASE_URL", DEFAULT_OPENROUTER_BASE_URL))
+
+# Listed in the error for an unknown model name
+_VALID_MODEL_NAMES = list(GEMINI_MODELS)
+
+def _resolve_model(model_name: str) -> str:
+    """Full OpenRouter path for a Gemini model name"""
+    try:
+        return GEMINI_MODELS[model_name]
+    except KeyError:
+        raise ValueError(f"Model {model_name} not available. Choose from: {_VALID_MODEL_NAMES}") from None
+
+@functools.lru_cache(maxsize=None)
+def _get_litellm(model_path: str, api_key: str, api_base: str) -> "LiteLlm":
+    """LiteLLM wrapper shared by every agent created for the same model and endpoint"""
+    from google.adk.models.lite_llm import LiteLlm
+    return LiteLlm(model=model_path, api_key=api_key, api_base=api_base)
+
 class OpenRouterConfig:
     """Configuration class for OpenRouter integration with Google ADK"""
     
-    # OpenRouter settings
-    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-    OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
-    
     # Available Gemini models through OpenRouter (imported from model_used.py)
     # GEMINI_MODELS is now imported from model_used.py
     
     @classmethod
     def validate_config(cls):
         """Validate that required environment variables are set"""
-        if not cls.OPENROUTER_API_KEY:
-            raise ValueError(
-                "OPENROUTER_API_KEY not found in environment variables. "
-                "Please add it to your .env file."
-            )
+        _config()
         return True
     
     @classmethod
@@ -45,19 +77,14 @@ class OpenRouterConfig:
         Returns:
             LlmAgent: Configured ADK agent using LiteLLM wrapper
         """
-        cls.validate_config()
-        
-        if model_name not in GEMINI_MODELS:
-            raise ValueError(f"Model {model_name} not available. Choose from: {list(GEMINI_MODELS.keys())}")
+        config = _config()
+        model_path = _resolve_model(model_name)
         
-        # Create LiteLLM wrapper configured for OpenRouter
-        litellm_model = LiteLlm(
-            model=GEMINI_MODELS[model_name],
-            api_key=cls.OPENROUTER_API_KEY,
-            api_base=cls.OPENROUTER_BASE_URL
-        )
+        # Reuse the LiteLLM wrapper configured for OpenRouter
+        litellm_model = _get_litellm(model_path, config.api_key, config.base_url)
         
         # Create ADK agent with LiteLLM wrapper
+        from google.adk.agents import LlmAgent
         agent = LlmAgent(
             model=litellm_model,
             name=agent_name,
@@ -13,22 +13,42 @@ Usage:
 
 import argparse
 import asyncio
-import json
+import io
 import logging
 import sys
 import time
 from pathlib import Path
-from dataclasses import asdict
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator
+
+try:
+    import uvloop
+except ImportError:
+    # Optional faster event loop (not available on Windows); asyncio's default loop works the same
+    uvloop = None
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.workflows import (
-    TravelItineraryWorkflow, 
-    TravelItineraryResponse,
-    IncompleteRequestException
-)
+# The workflow pulls in every agent and the LLM SDKs, so it is imported in main()
+# after argument parsing; --help and argument errors stay fast
+if TYPE_CHECKING:
+    from src.workflows import TravelItineraryResponse
+
+
+# Placeholders summarized when an agent returned nothing
+_EMPTY_ITINERARY = SimpleNamespace(must_visit_places=(), daily_itineraries=(), total_estimated_cost='N/A')
+_EMPTY_ACCOMMODATIONS = SimpleNamespace(accommodation_suggestions=(), children_count=0)
+
+
+def _trip_overview(request_summary: dict) -> tuple:
+    """Travelers total and budget text shown in the trip overview"""
+    travelers = request_summary.get('travelers')
+    budget = request_summary.get('budget')
+    travelers_text = travelers.get('total', 'N/A') if travelers else 'N/A'
+    budget_text = f"{budget.get('total_amount', 'N/A')} {budget.get('currency', '')}" if budget else 'N/A '
+    return travelers_text, budget_text
 
 
 def setup_logging(verbose: bool = False):
@@ -54,23 +74,16 @@ def format_parallel_progress() -> str:
 """
 
 
-def format_results_summary(result: TravelItineraryResponse) -> str:
+def format_results_summary(result: "TravelItineraryResponse") -> str:
     """Format final results for CLI display"""
     success_icon = "✅" if result.success else "⚠️"
     
     # Handle None values safely
-    itinerary = result.itinerary or type('obj', (object,), {
-        'must_visit_places': [],
-        'daily_itineraries': [],
-        'total_estimated_cost': 'N/A'
-    })()
-    
-    accommodations = result.accommodations or type('obj', (object,), {
-        'accommodation_suggestions': [],
-        'children_count': 0
-    })()
+    itinerary = result.itinerary or _EMPTY_ITINERARY
+    accommodations = result.accommodations or _EMPTY_ACCOMMODATIONS
     
     request_summary = result.request_summary or {}
+    travelers, budget = _trip_overview(request_summary)
     
     return f"""
 {'='*60}
@@ -86,8 +99,8 @@ def format_results_summary(result: TravelItineraryResponse) -> str:
 🎯 Trip Summary:
    Destination: {request_summary.get('destination', 'N/A')}
    Duration: {request_summary.get('duration', 'N/A')} days
-   Travelers: {request_summary.get('travelers', {}).get('total', 'N/A') if request_summary.get('travelers') else 'N/A'} total
-   Budget: {request_summary.get('budget', {}).get('total_amount', 'N/A') if request_summary.get('budget') else 'N/A'} {request_summary.get('budget', {}).get('currency', '') if request_summary.get('budget') else ''}
+   Travelers: {travelers} total
+   Budget: {budget}
 
 🏛️  Activities & Itinerary:
    Must-visit places: {len(itinerary.must_visit_places)}
@@ -104,14 +117,22 @@ def format_results_summary(result: TravelItineraryResponse) -> str:
 """
 
 
-def format_detailed_markdown(result: TravelItineraryResponse) -> str:
-    """Format detailed markdown output"""
+def format_json(result: "TravelItineraryResponse") -> str:
+    """Format JSON output, leaving out unset workflow fields"""
+    buffer = io.BytesIO()
+    result.to_json_stream(buffer)
+    return buffer.getvalue().decode()
+
+
+def _iter_markdown(result: "TravelItineraryResponse") -> Iterator[str]:
+    """Detailed markdown output, yielded in chunks"""
     # Handle None values safely
     itinerary = result.itinerary
     accommodations = result.accommodations
     request_summary = result.request_summary or {}
+    travelers, budget = _trip_overview(request_summary)
     
-    md = f"""# Travel Itinerary - {request_summary.get('destination', 'Unknown Destination')}
+    yield f"""# Travel Itinerary - {request_summary.get('destination', 'Unknown Destination')}
 
 **Generated on**: {result.generated_at}  
 **Processing time**: {result.processing_time:.2f} seconds  
@@ -121,54 +142,57 @@ def format_detailed_markdown(result: TravelItineraryResponse) -> str:
 
 - **Destination**: {request_summary.get('destination', 'N/A')}
 - **Duration**: {request_summary.get('duration', 'N/A')} days
-- **Travelers**: {request_summary.get('travelers', {}).get('total', 'N/A') if request_summary.get('travelers') else 'N/A'} total
-- **Budget**: {request_summary.get('budget', {}).get('total_amount', 'N/A') if request_summary.get('budget') else 'N/A'} {request_summary.get('budget', {}).get('currency', '') if request_summary.get('budget') else ''}
+- **Travelers**: {travelers} total
+- **Budget**: {budget}
 - **Estimated Total Cost**: {result.final_cost_estimate or 'Unable to estimate'}
 
 """
 
     # Add itinerary details if available
     if itinerary and itinerary.must_visit_places:
-        md += "\n## Must-Visit Places\n\n"
+        yield "\n## Must-Visit Places\n\n"
         for i, place in enumerate(itinerary.must_visit_places, 1):
-            md += f"### {i}. {place.name}\n"
-            md += f"**Location**: {place.location}  \n"
-            md += f"**Category**: {place.category}  \n"
-            md += f"**Significance**: {place.significance}\n\n"
+            yield (f"### {i}. {place.name}\n"
+                   f"**Location**: {place.location}  \n"
+                   f"**Category**: {place.category}  \n"
+                   f"**Significance**: {place.significance}\n\n")
     
     # Add daily itinerary if available
     if itinerary and itinerary.daily_itineraries:
-        md += "\n## Daily Itinerary\n\n"
+        yield "\n## Daily Itinerary\n\n"
         for day in itinerary.daily_itineraries:
-            md += f"### Day {day.day_number}\n\n"
+            yield f"### Day {day.day_number}\n\n"
             if day.activities:
                 for activity in day.activities:
-                    md += f"- **{activity.name}** at {activity.place} ({activity.duration})\n"
-                    md += f"  {activity.description}\n"
+                    yield (f"- **{activity.name}** at {activity.place} ({activity.duration})\n"
+                           f"  {activity.description}\n")
                     if activity.cost_estimate:
-                        md += f"  *Cost: {activity.cost_estimate}*\n"
-                    md += "\n"
+                        yield f"  *Cost: {activity.cost_estimate}*\n"
+                    yield "\n"
     
     # Add accommodation suggestions if available
     if accommodations and accommodations.accommodation_suggestions:
-        md += "\n## Accommodation Suggestions\n\n"
+        yield "\n## Accommodation Suggestions\n\n"
         for i, acc in enumerate(accommodations.accommodation_suggestions, 1):
-            md += f"### {i}. {acc.name}\n"
-            md += f"**Location**: {acc.location}  \n"
-            md += f"**Price Range**: {acc.price_range}  \n"
-            md += f"**Rating**: {acc.rating}/5  \n"
-            md += f"**Type**: {acc.accommodation_type}  \n"
-            md += f"**Family-friendly**: {'Yes' if acc.family_friendly else 'No'}  \n"
-            md += f"**Amenities**: {', '.join(acc.amenities)}  \n"
-            md += f"**Description**: {acc.description}\n\n"
+            yield (f"### {i}. {acc.name}\n"
+                   f"**Location**: {acc.location}  \n"
+                   f"**Price Range**: {acc.price_range}  \n"
+                   f"**Rating**: {acc.rating}/5  \n"
+                   f"**Type**: {acc.accommodation_type}  \n"
+                   f"**Family-friendly**: {'Yes' if acc.family_friendly else 'No'}  \n"
+                   f"**Amenities**: {', '.join(acc.amenities)}  \n"
+                   f"**Description**: {acc.description}\n\n")
     
     # Add errors if any
     if result.errors:
-        md += "\n## Errors Encountered\n\n"
+        yield "\n## Errors Encountered\n\n"
         for error in result.errors:
-            md += f"- {error}\n"
-    
-    return md
+            yield f"- {error}\n"
+
+
+def format_detailed_markdown(result: "TravelItineraryResponse") -> str:
+    """Format detailed markdown output"""
+    return "".join(_iter_markdown(result))
 
 
 async def main():
@@ -214,6 +238,8 @@ Examples:
     # Setup logging
     setup_logging(args.verbose)
     
+    from src.workflows import TravelItineraryWorkflow, IncompleteRequestException
+    
     # Create workflow
     workflow = TravelItineraryWorkflow(
         interactive=args.interactive, 
@@ -232,21 +258,25 @@ Examples:
         start_time = time.time()
         result = await workflow.generate_itinerary(args.request)
         
-        # Format output
+        # Format output; JSON and markdown are streamed straight to the file when saving
         if args.format == "json":
-            output = json.dumps(asdict(result), indent=2, default=str)
+            chunks = () if args.output else (format_json(result),)
         elif args.format == "markdown":
-            output = format_detailed_markdown(result)
+            chunks = _iter_markdown(result)
         else:  # summary
-            output = format_results_summary(result)
+            chunks = (format_results_summary(result),)
         
         # Save or display output
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
+            if args.format == "json":
+                with open(args.output, 'wb') as f:
+                    result.to_json_stream(f)
+            else:
+                with open(args.output, 'w', encoding='utf-8') as f:
+                    f.writelines(chunks)
             print(f"\n✅ Itinerary saved to {args.output}")
         else:
-            print(output)
+            print("".join(chunks))
         
         # Performance feedback
         if result.processing_time < 20:
@@ -275,7 +305,7 @@ Examples:
 
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        exit_code = (uvloop.run if uvloop is not None else asyncio.run)(main())
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\n⏹️ Interrupted")
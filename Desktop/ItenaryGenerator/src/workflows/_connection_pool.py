@@ -0,0 +1,51 @@
+"""
+Keep-alive HTTP pool shared by the agents' LLM calls.
+
+LiteLLM sends OpenAI-compatible calls through litellm.aclient_session when it
+is set. warm_llm_pool() installs one pooled httpx client per event loop and
+opens a connection to the LLM endpoint right away, so the first agent call
+doesn't pay DNS, TCP and TLS setup and later calls reuse idle connections.
+"""
+
+import asyncio
+import logging
+import os
+
+try:
+    import httpx
+    import litellm
+except ImportError:
+    # httpx comes with litellm; without them there is nothing to warm
+    httpx = litellm = None
+
+from config.openrouter_config import DEFAULT_OPENROUTER_BASE_URL
+
+logger = logging.getLogger(__name__)
+
+MAX_KEEPALIVE_CONNECTIONS = 16
+KEEPALIVE_EXPIRY = 300  # seconds
+_WARM_UP_TIMEOUT = 5.0
+
+# Event loop the installed client belongs to; httpx clients can't be shared across loops
+_session_loop = None
+
+
+async def warm_llm_pool():
+    """Install the pooled client for this event loop (once) and open a connection to the LLM endpoint"""
+    global _session_loop
+    if httpx is None:
+        return
+    loop = asyncio.get_running_loop()
+    if _session_loop is loop:
+        return
+    _session_loop = loop
+
+    client = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                                                   keepalive_expiry=KEEPALIVE_EXPIRY))
+    litellm.aclient_session = client
+    base_url = os.getenv("OPENROUTER_BASE_URL", DEFAULT_OPENROUTER_BASE_URL)
+    try:
+        # Any response will do; the point is the open connection left in the pool
+        await client.head(base_url, timeout=_WARM_UP_TIMEOUT)
+    except httpx.HTTPError as e:
+        logger.info("LLM connection warm-up failed: %s", e)
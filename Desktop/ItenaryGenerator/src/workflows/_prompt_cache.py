@@ -0,0 +1,93 @@
+"""
+In-process cache for idempotent agent calls.
+
+Results are kept for a TTL in a small LRU keyed by a hash of the call's key
+tuple, and a call that is still running is shared instead of being started
+again. The workflow's retry loop relies on the latter: a call that hit the
+agent timeout keeps running, and the retry waits on it rather than paying for
+a fresh LLM round trip. Calls a workflow run waited on are recorded in
+owned_calls_var so the run can cancel the ones nobody is waiting for when it
+finishes.
+"""
+
+import asyncio
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+CACHE_SIZE = 128
+
+# digest -> (expiry on the monotonic clock, result)
+_results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_in_flight: Dict[str, asyncio.Task] = {}
+# digest -> number of callers awaiting the in-flight call
+_waiters: Dict[str, int] = {}
+
+# Digests of the calls the current workflow run has waited on
+owned_calls_var: ContextVar[Optional[Set[str]]] = ContextVar("owned_calls", default=None)
+
+
+def _digest(key: tuple) -> str:
+    """Stable hash of a call's key tuple"""
+    return hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def _run(digest: str, coro_factory: Callable[[], Awaitable], ttl: float,
+               cacheable: Optional[Callable[[Any], bool]]):
+    """Run the call and cache its result; failures and rejected results are not cached"""
+    try:
+        result = await coro_factory()
+        if cacheable is None or cacheable(result):
+            _results[digest] = (time.monotonic() + ttl, result)
+            if len(_results) > CACHE_SIZE:
+                _results.popitem(last=False)
+        return result
+    finally:
+        _in_flight.pop(digest, None)
+
+
+async def cached_call(key: tuple, coro_factory: Callable[[], Awaitable], ttl: float = 600,
+                      cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    Result of coro_factory(), reusing a cached result or a matching call still in flight
+
+    The underlying call is shielded, so cancelling the caller (e.g. asyncio.wait_for
+    timing out) leaves it running for the next caller with the same key. cacheable
+    runs in the call's own task and decides whether its result is kept. Each caller
+    gets its own copy of the result.
+    """
+    digest = _digest(key)
+    entry = _results.get(digest)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            _results.move_to_end(digest)
+            return copy.deepcopy(entry[1])
+        del _results[digest]
+
+    task = _in_flight.get(digest)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_run(digest, coro_factory, ttl, cacheable))
+        _in_flight[digest] = task
+    owned = owned_calls_var.get()
+    if owned is not None:
+        owned.add(digest)
+    _waiters[digest] = _waiters.get(digest, 0) + 1
+    try:
+        result = await asyncio.shield(task)
+    finally:
+        _waiters[digest] -= 1
+        if not _waiters[digest]:
+            del _waiters[digest]
+    return copy.deepcopy(result)
+
+
+def cancel_abandoned(digests: Set[str]):
+    """Cancel the in-flight calls among digests that no caller is waiting on"""
+    loop = asyncio.get_running_loop()
+    for digest in digests:
+        task = _in_flight.get(digest)
+        if task is not None and task.get_loop() is loop and digest not in _waiters:
+            task.cancel()
@@ -6,19 +6,37 @@ the sequential execution of all travel planning agents.
 """
 
 import time
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
 # Import existing agent data models
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 from agents.request_parser import CoreTravelRequest
 from agents.activities_planner import ItineraryOutput
 from agents.accommodation_suggester import AccommodationOutput
 
+# Durations are timed on the monotonic clock; the wall clock is read once, at the start
+_now = time.perf_counter
+
+
+def _slim_dict(obj) -> Dict[str, Any]:
+    """Dataclass fields that are neither None nor empty, with nested workflow models slimmed too"""
+    data = {}
+    for f in fields(obj):
+        if not f.init:
+            continue  # internal timing state, not part of the model
+        value = getattr(obj, f.name)
+        if value is None or (isinstance(value, (str, list, dict)) and not value):
+            continue
+        data[f.name] = value.to_slim_dict() if hasattr(value, "to_slim_dict") else value
+    return data
+
 
 class WorkflowStage(Enum):
     """Enum for workflow stages"""
@@ -40,7 +58,7 @@ class AgentStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentExecution:
     """Metadata for individual agent execution"""
     agent_name: str
@@ -50,34 +68,46 @@ class AgentExecution:
     duration: Optional[float] = None
     error_message: Optional[str] = None
     retry_count: int = 0
+    _started: Optional[float] = field(default=None, init=False, repr=False, compare=False)
     
     def start(self):
         """Mark agent as started"""
         self.status = AgentStatus.RUNNING
         self.start_time = time.time()
+        self._started = _now()
+    
+    def _stop(self):
+        """Stamp the end time and duration"""
+        if self._started is not None:
+            self.duration = _now() - self._started
+            self.end_time = self.start_time + self.duration
+        else:
+            self.end_time = time.time()
+            if self.start_time:
+                self.duration = self.end_time - self.start_time
     
     def complete(self):
         """Mark agent as completed"""
         self.status = AgentStatus.COMPLETED
-        self.end_time = time.time()
-        if self.start_time:
-            self.duration = self.end_time - self.start_time
+        self._stop()
     
     def fail(self, error_message: str):
         """Mark agent as failed"""
         self.status = AgentStatus.FAILED
-        self.end_time = time.time()
-        if self.start_time:
-            self.duration = self.end_time - self.start_time
+        self._stop()
         self.error_message = error_message
     
     def skip(self, reason: str):
         """Mark agent as skipped"""
         self.status = AgentStatus.SKIPPED
         self.error_message = reason
+    
+    def to_slim_dict(self) -> Dict[str, Any]:
+        """Fields that are set, for compact serialization"""
+        return _slim_dict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetadata:
     """Metadata for the entire workflow execution"""
     workflow_id: str
@@ -99,48 +129,63 @@ class WorkflowMetadata:
     # Performance metrics
     performance_notes: List[str] = field(default_factory=list)
     
+    _started: float = field(default_factory=_now, init=False, repr=False, compare=False)
+    
+    def _stop(self):
+        """Stamp the total end time and duration"""
+        self.total_duration = _now() - self._started
+        self.total_end_time = self.total_start_time + self.total_duration
+    
     def complete_workflow(self):
         """Mark the entire workflow as completed"""
-        self.total_end_time = time.time()
-        self.total_duration = self.total_end_time - self.total_start_time
+        self._stop()
         self.current_stage = WorkflowStage.COMPLETED
         self.overall_status = "completed"
     
     def fail_workflow(self, error_message: str):
         """Mark the entire workflow as failed"""
-        self.total_end_time = time.time()
-        self.total_duration = self.total_end_time - self.total_start_time
+        self._stop()
         self.current_stage = WorkflowStage.FAILED
         self.overall_status = "failed"
         self.errors.append(f"Workflow failure: {error_message}")
     
+    def _snapshot(self) -> Tuple[int, int, Optional[AgentExecution]]:
+        """Completed count, failed count and running agent, from a single pass over the agents"""
+        completed = failed = 0
+        running = None
+        for agent in (self.request_parser, self.activities_planner, self.accommodation_suggester):
+            status = agent.status
+            if status is AgentStatus.COMPLETED:
+                completed += 1
+            elif status is AgentStatus.FAILED:
+                failed += 1
+            elif status is AgentStatus.RUNNING and running is None:
+                running = agent
+        return completed, failed, running
+    
     def get_completion_percentage(self) -> float:
         """Calculate overall completion percentage"""
-        completed_agents = sum(1 for agent in [self.request_parser, self.activities_planner, self.accommodation_suggester] 
-                             if agent.status == AgentStatus.COMPLETED)
-        return (completed_agents / 3) * 100
+        return (self._snapshot()[0] / 3) * 100
     
     def get_current_agent(self) -> Optional[AgentExecution]:
         """Get the currently running agent"""
-        for agent in [self.request_parser, self.activities_planner, self.accommodation_suggester]:
-            if agent.status == AgentStatus.RUNNING:
-                return agent
-        return None
+        return self._snapshot()[2]
     
     def has_errors(self) -> bool:
         """Check if any errors occurred"""
-        return len(self.errors) > 0 or any(agent.status == AgentStatus.FAILED 
-                                          for agent in [self.request_parser, self.activities_planner, self.accommodation_suggester])
+        return len(self.errors) > 0 or self._snapshot()[1] > 0
     
     def is_partial_success(self) -> bool:
         """Check if we have partial success (some agents completed, some failed)"""
-        statuses = [self.request_parser.status, self.activities_planner.status, self.accommodation_suggester.status]
-        has_completed = any(status == AgentStatus.COMPLETED for status in statuses)
-        has_failed = any(status == AgentStatus.FAILED for status in statuses)
-        return has_completed and has_failed
+        completed, failed, _ = self._snapshot()
+        return completed > 0 and failed > 0
+    
+    def to_slim_dict(self) -> Dict[str, Any]:
+        """Fields that are set, for compact serialization"""
+        return _slim_dict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TravelItineraryResponse:
     """
     Complete response from the Travel Itinerary Workflow.
@@ -211,6 +256,10 @@ class TravelItineraryResponse:
         
         return data
     
+    def to_slim_dict(self) -> Dict[str, Any]:
+        """Fields that are set, for compact serialization (agent outputs are left to the encoder)"""
+        return _slim_dict(self)
+    
     def get_error_summary(self) -> List[str]:
         """Get summary of all errors"""
         errors = []
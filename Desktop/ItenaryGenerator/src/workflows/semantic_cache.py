@@ -0,0 +1,262 @@
+"""
+Result caches for the Travel Itinerary Workflow.
+
+SemanticCache stores complete TravelItineraryResponse objects in SQLite so a
+repeated or reworded travel request can skip the LLM pipeline. Lookups go
+through two tiers:
+1. Exact: hash of the normalized request text
+2. Semantic: cosine similarity of word-count vectors against earlier requests
+   that mention the same numbers (duration, budget, traveler counts), the same
+   currency and traveler roles, and name the cached itinerary's destination
+Entries expire after a TTL, since cached itineraries carry hotel prices.
+
+AgentCache stores individual agent results keyed on the slice of the parsed
+request each agent depends on, so a new request can reuse the parts it shares
+with an earlier one. Its entries expire after a TTL as well.
+"""
+
+import collections
+import hashlib
+import logging
+import math
+import pickle
+import re
+import shelve
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Counter, Dict, Hashable, Optional, Set, Union
+
+from .data_models import TravelItineraryResponse, WorkflowStage
+
+DEFAULT_CACHE_DIR = Path.home() / ".itinerary_cache"
+DEFAULT_CACHE_PATH = DEFAULT_CACHE_DIR / "itineraries.sqlite3"
+DEFAULT_TTL = 6 * 3600  # seconds; cached prices go stale
+
+# One lock per shelf file: the dbm backends don't support concurrent writers
+_SHELF_LOCKS: Dict[str, threading.Lock] = collections.defaultdict(threading.Lock)
+# Shelf files already swept for expired entries by this process
+_PRUNED_SHELVES: Set[str] = set()
+
+_WORD_RE = re.compile(r"[a-z]+|\d+(?:\.\d+)?")
+# Filler words that change between rewordings of the same request
+_STOP_WORDS = frozenset((
+    "a", "an", "the", "i", "we", "my", "our", "want", "would", "like", "to", "for",
+    "with", "of", "and", "in", "on", "at", "is", "are", "be", "please", "trip",
+    "visit", "go", "plan", "me", "us", "around", "about",
+))
+# Currency symbols and names, normalized to ISO codes for the semantic partition key
+_CURRENCY_RE = re.compile(r"[$€£¥₹]|\b(?:usd|eur|gbp|inr|jpy|aud|cad|chf|cny|sgd|aed|"
+                          r"dollars?|euros?|pounds?|rupees?|yen)\b")
+_CURRENCY_ALIASES = {
+    "$": "usd", "dollar": "usd", "dollars": "usd",
+    "€": "eur", "euro": "eur", "euros": "eur",
+    "£": "gbp", "pound": "gbp", "pounds": "gbp",
+    "₹": "inr", "rupee": "inr", "rupees": "inr",
+    "¥": "jpy", "yen": "jpy",
+}
+# Traveler counts with their role, so "2 adults 1 child" differs from "1 adult 2 children"
+_TRAVELERS_RE = re.compile(r"(\d+)\s*(adult|child|kid)")
+
+# Bumped whenever the table layout changes; older tables are dropped and rebuilt
+_SCHEMA_VERSION = 3
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS itineraries (
+    key TEXT PRIMARY KEY,
+    partition TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    words TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    response BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS itineraries_partition ON itineraries (partition);
+"""
+
+
+def _tokenize(request: str) -> list:
+    """Lower-cased words and numbers of a request, without filler words"""
+    return [token for token in _WORD_RE.findall(request.lower().replace(",", ""))
+            if token not in _STOP_WORDS]
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    """Cosine similarity of two word-count vectors"""
+    dot = sum(count * b[word] for word, count in a.items() if word in b)
+    if not dot:
+        return 0.0
+    norm_a = math.sqrt(sum(count * count for count in a.values()))
+    norm_b = math.sqrt(sum(count * count for count in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+class SemanticCache:
+    """
+    SQLite-backed cache of complete itinerary responses keyed on the user request.
+
+    Only requests mentioning exactly the same numbers, currency and traveler roles
+    and the cached itinerary's destination are compared semantically, so
+    "Paris 5 days" never matches "Paris 7 days", "Lyon 5 days" or "Paris 5 days
+    3000 EUR" against "3000 USD" however similar the wording.
+
+    The connection is shared across threads under a lock, so async callers can
+    run get and put with asyncio.to_thread.
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_CACHE_PATH, threshold: float = 0.9,
+                 ttl: float = DEFAULT_TTL):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: SQLite file holding the cached responses
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Seconds a cached response stays valid
+        """
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.ttl = ttl
+        db_path = Path(db_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            with self._db:
+                self._db.execute("DROP TABLE IF EXISTS itineraries")
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, request: str) -> Optional[TravelItineraryResponse]:
+        """Return a cached response for the request, or None on a miss"""
+        started = time.time()
+        cutoff = started - self.ttl
+        tokens = _tokenize(request)
+        key = self._key(tokens)
+
+        with self._lock:
+            # Exact tier: identical normalized text skips the similarity scan
+            row = self._db.execute(
+                "SELECT response FROM itineraries WHERE key = ? AND created_at > ?", (key, cutoff)
+            ).fetchone()
+            if row:
+                return self._cached_response(row[0], request, started, "exact")
+
+            # Semantic tier: closest earlier request in the same partition that names its destination
+            candidates = self._db.execute(
+                "SELECT destination, words, response FROM itineraries WHERE partition = ? AND created_at > ?",
+                (self._partition(request, tokens), cutoff),
+            ).fetchall()
+
+        words = collections.Counter(tokens)
+        best_score, best_blob = 0.0, None
+        for destination, cached_words, blob in candidates:
+            if not destination or not all(word in words for word in destination.split()):
+                continue
+            score = _cosine(words, collections.Counter(cached_words.split()))
+            if score > best_score:
+                best_score, best_blob = score, blob
+
+        if best_blob is not None and best_score >= self.threshold:
+            return self._cached_response(best_blob, request, started, f"semantic {best_score:.2f}")
+        return None
+
+    def put(self, request: str, response: TravelItineraryResponse):
+        """Store a complete response; partial or failed results are not cached"""
+        if not response.is_complete():
+            return
+        tokens = _tokenize(request)
+        now = time.time()
+        row = (self._key(tokens), self._partition(request, tokens), self._destination(response), " ".join(tokens),
+               now, pickle.dumps(response, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM itineraries WHERE created_at <= ?", (now - self.ttl,))
+            self._db.execute("INSERT OR REPLACE INTO itineraries VALUES (?, ?, ?, ?, ?, ?)", row)
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _key(tokens: list) -> str:
+        """Exact-tier key of a tokenized request"""
+        return hashlib.sha256(" ".join(tokens).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _partition(request: str, tokens: list) -> str:
+        """Semantic tier's partition key: the request's numbers, currencies and traveler roles"""
+        text = request.lower()
+        numbers = " ".join(sorted(token for token in tokens if token[0].isdigit()))
+        currencies = " ".join(sorted({_CURRENCY_ALIASES.get(match, match) for match in _CURRENCY_RE.findall(text)}))
+        travelers = " ".join(sorted(f"{count} {role.replace('kid', 'child')}"
+                                    for count, role in _TRAVELERS_RE.findall(text)))
+        return f"{numbers}|{currencies}|{travelers}"
+
+    @staticmethod
+    def _destination(response: TravelItineraryResponse) -> str:
+        """Tokens of the response's destination city, which a request must name for a semantic hit"""
+        destination = response.parsed_request.destination or ""
+        return " ".join(_tokenize(destination.split(",")[0]))
+
+    def _cached_response(self, blob: bytes, request: str, started: float, tier: str) -> TravelItineraryResponse:
+        """Unpickle a cached response and give it fresh metadata marking it as cached"""
+        response = pickle.loads(blob)
+        metadata = response.workflow_metadata
+        now = time.time()
+        response.workflow_metadata = replace(
+            metadata,
+            workflow_id=uuid.uuid4().hex[:8],
+            total_start_time=started,
+            total_end_time=now,
+            total_duration=now - started,
+            current_stage=WorkflowStage.COMPLETED,
+            overall_status="cached",
+            performance_notes=[*metadata.performance_notes, f"cache_hit ({tier})"],
+        )
+        response.user_input = request
+        self.logger.info("Itinerary cache hit (%s)", tier)
+        return response
+
+
+class AgentCache:
+    """
+    Disk cache of one agent's results, stored under DEFAULT_CACHE_DIR/agent_<name>.
+
+    Entries are stored with their write time and expire after ttl seconds. The
+    methods do blocking disk I/O; async callers run them with asyncio.to_thread.
+    """
+
+    def __init__(self, agent_name: str, cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+                 ttl: float = DEFAULT_TTL):
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path = str(cache_dir / f"agent_{agent_name}")
+        self._lock = _SHELF_LOCKS[self._path]
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        """Shelve key (a string) for a key tuple"""
+        return repr(key)
+
+    def _live(self, entry: Any, now: float) -> bool:
+        """Whether a stored entry is a timestamped result that hasn't expired"""
+        return isinstance(entry, tuple) and len(entry) == 2 and now - entry[0] < self.ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached result for the key, or None on a miss or an expired entry"""
+        with self._lock, shelve.open(self._path) as db:
+            entry = db.get(self._key(key))
+        return entry[1] if self._live(entry, time.time()) else None
+
+    def put(self, key: Hashable, value: Any):
+        """Store a result for the key, sweeping expired entries on the first write of the process"""
+        now = time.time()
+        with self._lock, shelve.open(self._path) as db:
+            if self._path not in _PRUNED_SHELVES:
+                _PRUNED_SHELVES.add(self._path)
+                for stale in [k for k in db.keys() if not self._live(db[k], now)]:
+                    del db[stale]
+            db[self._key(key)] = (now, value)
@@ -1,17 +1,24 @@
 """
 Travel Itinerary Workflow - Main Orchestration Class
 
-Sequential workflow that coordinates the execution of:
+Workflow that coordinates the execution of:
 RequestParser → ActivitiesPlanner → AccommodationSuggester
+(AccommodationSuggester overlaps ActivitiesPlanner's day-by-day planning)
 
 Provides progress tracking, error handling, and comprehensive response assembly.
 """
 
 import asyncio
+import copy
+import hashlib
+import inspect
 import logging
+import random
 import time
 import uuid
-from typing import Optional, Callable
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Awaitable, Dict, Optional, Callable, Tuple
 
 # Import our data models
 from .data_models import (
@@ -19,50 +26,195 @@ from .data_models import (
     WorkflowMetadata, 
     WorkflowStage, 
     AgentStatus,
+    AgentExecution,
     create_workflow_metadata,
     create_empty_response
 )
+from .semantic_cache import AgentCache
+from .workflow_types import IncompleteRequestException
+from ._prompt_cache import cached_call, cancel_abandoned, owned_calls_var
 
 # Import agents
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
-from agents.request_parser import RequestParserAgent
-from agents.activities_planner import ActivitiesPlanner
+from agents.request_parser import RequestParserAgent, CoreTravelRequest, Travelers, Budget, AccommodationType
+from agents.activities_planner import ActivitiesPlanner, Place
 from agents.accommodation_suggester import AccommodationSuggester
+from agents._concurrency import loop_semaphore
+from agents._fallback import used_fallback
+from ._connection_pool import warm_llm_pool
+
+
+# ID of the workflow running in the current task; tasks it starts inherit it
+workflow_id_var: ContextVar[str] = ContextVar("workflow_id", default="-")
+
+
+class WorkflowIdFilter(logging.Filter):
+    """Adds the current workflow_id to log records, for handler formats using %(workflow_id)s"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.workflow_id = workflow_id_var.get()
+        return True
+
+
+# RequestParser accommodation_type strings
+_ACCOMMODATION_TYPES = {
+    "budget": AccommodationType.BUDGET,
+    "mid-range": AccommodationType.MID_RANGE,
+    "luxury": AccommodationType.LUXURY
+}
+
+# Planner and suggester keep no per-request state, so their clients are built once per process
+_SHARED_AGENTS = None
+
+
+def _shared_agents() -> tuple:
+    """Process-wide (ActivitiesPlanner, AccommodationSuggester), created on first use"""
+    global _SHARED_AGENTS
+    if _SHARED_AGENTS is None:
+        _SHARED_AGENTS = (ActivitiesPlanner(), AccommodationSuggester())
+    return _SHARED_AGENTS
+
+
+# Concurrency limits, so bursts queue here instead of piling timeouts onto a rate-limited
+# upstream; the agents call different endpoints, so each has its own limit
+MAX_CONCURRENT_WORKFLOWS = 8
+_AGENT_CONCURRENCY = {"parser": 4, "planner": 4, "accommodation": 4}
+
+async def _limited(agent: str, coro):
+    """Await an agent call under that agent's concurrency limit"""
+    async with loop_semaphore(agent, _AGENT_CONCURRENCY[agent]):
+        return await coro
+
+
+def _without_fallback(result) -> bool:
+    """Whether an agent result was built without canned fallback data"""
+    return not used_fallback()
+
+
+# Summary sections, one line per field
+_REQUEST_SUMMARY = ("✈️ Destination: {destination}\n"
+                    "📅 Duration: {duration} days\n"
+                    "💰 Budget: {budget}\n"
+                    "👥 Travelers: {adults} adults{children}\n")
+_ITINERARY_SUMMARY = ("🗺️ Activities: {places} must-visit places\n"
+                      "📋 Itinerary: {days} days planned\n")
+_ACCOMMODATIONS_SUMMARY = "🏨 Accommodations: {options} options found\n"
+
+def _input_digest(user_input: str) -> str:
+    """Digest of the case- and whitespace-normalized user input"""
+    return hashlib.blake2b(" ".join(user_input.lower().split()).encode("utf-8")).hexdigest()
+
+
+# Parser checkpoints and canonical itineraries older than this are ignored
+_CHECKPOINT_TTL = 3600  # seconds
+
+# Complete responses of recent requests, for exact resubmissions: digest -> (expiry, response)
+_RESPONSE_CACHE: Dict[str, Tuple[float, TravelItineraryResponse]] = {}
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_TTL = 3600  # seconds
+
+# Pending progress events; the oldest are dropped when a slow callback falls behind
+_PROGRESS_QUEUE_SIZE = 64
+# Progress updates within this many seconds of each other are delivered as one
+_PROGRESS_COALESCE_WINDOW = 0.05
+# Longest an async progress callback may take before its event is abandoned
+_PROGRESS_CALLBACK_TIMEOUT = 1.0
+
+
+
+async def _await_progress_callback(result, logger: logging.Logger):
+    """Wait for an async progress callback's result, giving up after _PROGRESS_CALLBACK_TIMEOUT"""
+    if not inspect.isawaitable(result):
+        return
+    try:
+        await asyncio.wait_for(result, timeout=_PROGRESS_CALLBACK_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Progress callback timed out after {_PROGRESS_CALLBACK_TIMEOUT}s")
+    except Exception as e:
+        logger.warning(f"Progress callback error: {e}")
+
+
+# Malformed agent output (bad JSON, missing fields) and incomplete requests fail the
+# same way on every attempt, so these errors skip the retry backoff
+_NON_RETRYABLE = (ValueError, KeyError, TypeError, IncompleteRequestException)
+
+
+def _budget_bucket(amount) -> object:
+    """Budget rounded to two significant figures, so near-identical budgets share a cache entry"""
+    try:
+        # Fallback requests carry the amount as text, e.g. "25000 INR"
+        value = float(str(amount).split()[0].replace(",", ""))
+    except (IndexError, ValueError):
+        return amount
+    return float(f"{value:.2g}") if value > 0 else 0.0
 
 
 class TravelItineraryWorkflow:
     """
     Main workflow orchestrator for travel itinerary generation.
     
-    Executes agents sequentially with progress tracking and error handling:
+    Executes agents with progress tracking and error handling:
     1. RequestParser: Parse user natural language input
     2. ActivitiesPlanner: Generate activities and itinerary 
-    3. AccommodationSuggester: Find location-aware accommodations
+    3. AccommodationSuggester: Find location-aware accommodations, starting as soon
+       as the must-visit places are known (or immediately on a cache hit)
     4. Assemble final response with all data
     """
     
-    def __init__(self, progress_callback: Optional[Callable] = None):
+    def __init__(self, progress_callback: Optional[Callable] = None, use_cache: bool = True,
+                 max_concurrent: int = MAX_CONCURRENT_WORKFLOWS):
         """
         Initialize the workflow with agents and optional progress callback.
         
         Args:
             progress_callback: Optional function to call for progress updates
+            use_cache: Reuse cached agent results from earlier requests
+            max_concurrent: Workflows allowed to run at once; later ones wait for a slot
         """
         self.logger = logging.getLogger(__name__)
         self.progress_callback = progress_callback
+        # Highest percentage reported so far, so overlapping stages never move progress backwards
+        self._progress_peak = 0
+        # (destination, task) of a place search started while the parser was still streaming
+        self._speculative_search = None
+        
+        # Progress events are delivered by a background task during execute_workflow
+        self._progress_queue: Optional[asyncio.Queue] = None
+        self._progress_worker: Optional[asyncio.Task] = None
         
-        # Initialize agents
+        # Initialize agents; the parser holds conversation state, so each workflow gets its own
         self.request_parser = RequestParserAgent()
-        self.activities_planner = ActivitiesPlanner()
-        self.accommodation_suggester = AccommodationSuggester()
+        self.activities_planner, self.accommodation_suggester = _shared_agents()
+        
+        # Per-agent result caches, keyed on the request fields each agent depends on
+        self.places_cache = AgentCache("activities_planner") if use_cache else None
+        # Whole itineraries carry cost estimates and are shared across a budget bucket, so they
+        # expire as quickly as the parser checkpoints
+        self.itinerary_cache = AgentCache("activities_planner_itinerary", ttl=_CHECKPOINT_TTL) if use_cache else None
+        self.accommodations_cache = AgentCache("accommodation_suggester") if use_cache else None
+        # Parsed requests checkpointed by input, so a rerun after a crash resumes at planning;
+        # the agent caches above already hold the later stages' results
+        self.parsed_cache = AgentCache("request_parser", ttl=_CHECKPOINT_TTL) if use_cache else None
+        
+        # Open the LLM connection while the caller is still setting up, when there is a loop to do it on
+        try:
+            self._warm_up = asyncio.get_running_loop().create_task(warm_llm_pool())
+        except RuntimeError:
+            self._warm_up = None
         
         # Workflow configuration
-        self.agent_timeout = 180  # 3 minutes per agent (RequestParser can be slow)
+        # Per-call timeouts in seconds; the planner's two calls each get their own budget
+        self.timeouts = {"parser": 180, "research": 60, "itinerary": 90, "accommodation": 60}
+        self.workflow_deadline = 300  # seconds for the whole workflow, retries included
+        self.max_concurrent = max_concurrent
         self.max_retries = 2
-        self.retry_delay = 5  # seconds
+        self.retry_delay = 5  # seconds, base of the jittered exponential backoff
+        self.max_retry_delay = 60  # seconds
         
         self.logger.info("TravelItineraryWorkflow initialized with all agents")
     
@@ -77,43 +229,94 @@ class TravelItineraryWorkflow:
             TravelItineraryResponse: Complete or partial response with metadata
         """
         # Initialize workflow metadata
-        workflow_id = str(uuid.uuid4())[:8]
+        workflow_id = uuid.uuid4().hex[:8]
         workflow_metadata = create_workflow_metadata(workflow_id)
         response = create_empty_response(user_input, workflow_metadata)
+        workflow_id_token = workflow_id_var.set(workflow_id)
+        owned_calls = set()
+        owned_calls_token = owned_calls_var.set(owned_calls)
         
-        self.logger.info(f"🚀 Starting workflow {workflow_id} for user request")
+        self.logger.info("🚀 Starting workflow for user request")
+        if self._warm_up is None:
+            self._warm_up = asyncio.create_task(warm_llm_pool())
+        self._progress_peak = 0
+        if self.progress_callback:
+            self._progress_queue = asyncio.Queue(maxsize=_PROGRESS_QUEUE_SIZE)
+            self._progress_worker = asyncio.create_task(self._drain_progress(self._progress_queue))
         self._update_progress("Starting travel itinerary generation...", 0, workflow_metadata)
         
         try:
-            # Stage 1: Parse user request
-            await self._execute_request_parser(user_input, response)
-            
-            # Stage 2: Plan activities (only if parsing succeeded)
-            if response.parsed_request:
-                await self._execute_activities_planner(response)
-            
-            # Stage 3: Find accommodations (only if activities planning succeeded)
-            if response.itinerary:
-                await self._execute_accommodation_suggester(response)
-            
-            # Stage 4: Assemble final response
-            await self._assemble_final_response(response)
-            
-            # Mark workflow as completed
-            workflow_metadata.complete_workflow()
-            self._update_progress("Travel itinerary generation completed!", 100, workflow_metadata)
-            
-            self.logger.info(f"✅ Workflow {workflow_id} completed successfully in {workflow_metadata.total_duration:.1f}s")
+            workflow_slot = loop_semaphore("workflow", self.max_concurrent)
+            if workflow_slot.locked():
+                self._update_progress("Queued, waiting for a free workflow slot...", 0, workflow_metadata)
+            # The deadline starts once the workflow has a slot
+            async with workflow_slot:
+                await asyncio.wait_for(self._run_stages(response), timeout=self.workflow_deadline)
+            self.logger.info("✅ Workflow completed successfully in %.1fs", workflow_metadata.total_duration)
             
+        except asyncio.TimeoutError:
+            error_msg = f"Workflow deadline of {self.workflow_deadline}s exceeded"
+            self.logger.error("⏰ Workflow failed: %s", error_msg)
+            for agent_exec in (workflow_metadata.request_parser, workflow_metadata.activities_planner,
+                               workflow_metadata.accommodation_suggester):
+                if agent_exec.status == AgentStatus.RUNNING:
+                    agent_exec.fail(error_msg)
+            workflow_metadata.fail_workflow(error_msg)
+            self._update_progress(f"Error: {error_msg}", workflow_metadata.get_completion_percentage(), workflow_metadata)
         except Exception as e:
             # Handle unexpected workflow errors
             error_msg = f"Unexpected workflow error: {str(e)}"
-            self.logger.error(f"❌ Workflow {workflow_id} failed: {error_msg}")
+            self.logger.error("❌ Workflow failed: %s", error_msg)
             workflow_metadata.fail_workflow(error_msg)
             self._update_progress(f"Error: {error_msg}", workflow_metadata.get_completion_percentage(), workflow_metadata)
+        finally:
+            self._discard_speculative_search()
+            # Agent calls left running past a timeout or the deadline would keep their slots
+            cancel_abandoned(owned_calls)
+            await self._stop_progress_worker()
+            owned_calls_var.reset(owned_calls_token)
+            workflow_id_var.reset(workflow_id_token)
         
         return response
     
+    async def _run_stages(self, response: TravelItineraryResponse):
+        """Run the agent stages and assemble the response"""
+        workflow_metadata = response.workflow_metadata
+        
+        # Stage 1: Parse user request, starting the place search as soon as the destination streams in
+        self.request_parser.on_destination = self._start_speculative_search
+        try:
+            await self._execute_request_parser(response.user_input, response)
+        finally:
+            self.request_parser.on_destination = None
+        
+        # Stages 2 and 3: Plan activities and find accommodations (only if parsing succeeded).
+        # Hotel search only needs the must-visit places, so it runs while the
+        # day-by-day itinerary is still being planned
+        if response.parsed_request:
+            places_ready = asyncio.get_running_loop().create_future()
+            results = await asyncio.gather(
+                self._execute_activities_planner(response, places_ready),
+                self._execute_accommodation_suggester(response, places_ready),
+                return_exceptions=True
+            )
+            # Each stage handles its own errors; anything that escapes only fails that agent
+            for agent_exec, result in zip((workflow_metadata.activities_planner,
+                                           workflow_metadata.accommodation_suggester), results):
+                if isinstance(result, Exception):
+                    error_msg = f"{agent_exec.agent_name} error: {result}"
+                    self.logger.error(f"❌ {error_msg}")
+                    agent_exec.fail(error_msg)
+                    workflow_metadata.errors.append(error_msg)
+            self._note_overlap(workflow_metadata)
+        
+        # Stage 4: Assemble final response
+        await self._assemble_final_response(response)
+        
+        # Mark workflow as completed
+        workflow_metadata.complete_workflow()
+        self._update_progress("Travel itinerary generation completed!", 100, workflow_metadata)
+    
     async def _execute_request_parser(self, user_input: str, response: TravelItineraryResponse):
         """Execute RequestParser with retry logic and progress tracking"""
         agent_exec = response.workflow_metadata.request_parser
@@ -122,185 +325,223 @@ class TravelItineraryWorkflow:
         self.logger.info("📝 Starting RequestParser...")
         self._update_progress("Parsing your travel request...", 5, response.workflow_metadata)
         
-        for attempt in range(self.max_retries + 1):
-            try:
-                agent_exec.start()
-                
-                # Execute with timeout
-                # RequestParserAgent has a different interface - it's conversational
-                parser_response = await asyncio.wait_for(
-                    self.request_parser.start_conversation(user_input),
-                    timeout=self.agent_timeout
+        parsed_key = ("parsed_request", _input_digest(user_input))
+        checkpoint = await self._cache_get(self.parsed_cache, parsed_key, response, "RequestParser checkpoint")
+        if checkpoint is not None:
+            agent_exec.start()
+            response.parsed_request = checkpoint
+            agent_exec.complete()
+            self._update_progress("Travel request parsed successfully!", 25, response.workflow_metadata,
+                                 partial_response=response)
+            return
+        
+        async def attempt():
+            # RequestParserAgent has a different interface - it's conversational
+            parser_response = await self._timed(
+                _limited("parser", self.request_parser.start_conversation(user_input)), "parser"
+            )
+            
+            # For workflow purposes, we need to extract CoreTravelRequest
+            if not parser_response.get("is_complete"):
+                # Planning on guessed fields wastes both downstream agents on the wrong trip
+                raise IncompleteRequestException(
+                    parser_response.get("next_question") or "More trip details are needed", parser_response
                 )
-                
-                # For workflow purposes, we need to extract CoreTravelRequest
-                # If the agent completes in one go, get the final request
-                if parser_response.get("is_complete"):
-                    final_request_data = self.request_parser.get_final_request()
-                    parsed_request = self._convert_to_core_travel_request(final_request_data)
-                else:
-                    # If not complete, we need to handle this differently
-                    # For now, create a simplified request from available data
-                    parsed_request = self._create_partial_request_from_response(parser_response, user_input)
-                
-                response.parsed_request = parsed_request
-                agent_exec.complete()
-                
-                self.logger.info(f"✅ RequestParser completed in {agent_exec.duration:.1f}s")
-                self._update_progress("Travel request parsed successfully!", 25, response.workflow_metadata)
-                return
-                
-            except asyncio.TimeoutError:
-                error_msg = f"RequestParser timeout after {self.agent_timeout}s"
-                self.logger.warning(f"⏰ {error_msg} (attempt {attempt + 1})")
-                
-                if attempt < self.max_retries:
-                    agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    agent_exec.fail(error_msg)
-                    self._update_progress(f"Failed to parse request: {error_msg}", 25, response.workflow_metadata)
-                    break
-                    
-            except Exception as e:
-                error_msg = f"RequestParser error: {str(e)}"
-                self.logger.error(f"❌ {error_msg} (attempt {attempt + 1})")
-                
-                if attempt < self.max_retries:
-                    agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    agent_exec.fail(error_msg)
-                    response.workflow_metadata.errors.append(error_msg)
-                    self._update_progress(f"Failed to parse request: {error_msg}", 25, response.workflow_metadata)
-                    break
+            final_request_data = self.request_parser.get_final_request()
+            response.parsed_request = self._convert_to_core_travel_request(final_request_data)
+        
+        if await self._run_with_retry(response, agent_exec, attempt, "Failed to parse request", 25):
+            await self._cache_put(self.parsed_cache, parsed_key, response.parsed_request)
+            self.logger.info("✅ RequestParser completed in %.1fs", agent_exec.duration)
+            self._update_progress("Travel request parsed successfully!", 25, response.workflow_metadata,
+                                 partial_response=response)
+    
+    async def _execute_activities_planner(self, response: TravelItineraryResponse,
+                                          places_ready: Optional[asyncio.Future] = None):
+        """
+        Execute ActivitiesPlanner with retry logic and progress tracking.
+        
+        places_ready, if given, is resolved with the must-visit places as soon as
+        they are known, or None if planning fails.
+        """
+        try:
+            await self._plan_activities(response, places_ready)
+        finally:
+            if places_ready is not None and not places_ready.done():
+                places_ready.set_result(None)
     
-    async def _execute_activities_planner(self, response: TravelItineraryResponse):
-        """Execute ActivitiesPlanner with retry logic and progress tracking"""
+    async def _plan_activities(self, response: TravelItineraryResponse, places_ready: Optional[asyncio.Future]):
+        """ActivitiesPlanner stage: cached itinerary, or research then planning with retries"""
         agent_exec = response.workflow_metadata.activities_planner
         response.workflow_metadata.current_stage = WorkflowStage.FINDING_PLACES
         
         self.logger.info("🗺️ Starting ActivitiesPlanner...")
         self._update_progress("Finding must-visit places and planning activities...", 30, response.workflow_metadata)
         
-        for attempt in range(self.max_retries + 1):
-            try:
-                agent_exec.start()
-                
-                # Phase 1: Research destination to get places
-                research_result = await asyncio.wait_for(
-                    self.activities_planner.research_destination(response.parsed_request),
-                    timeout=self.agent_timeout
+        # An equivalent earlier request (same trip, similar budget) skips research and planning entirely
+        itinerary_key = self._itinerary_cache_key(response.parsed_request)
+        itinerary = await self._cache_get(self.itinerary_cache, itinerary_key, response, "ActivitiesPlanner")
+        if itinerary is not None:
+            agent_exec.start()
+            request = response.parsed_request
+            itinerary = replace(itinerary, destination=request.destination,
+                                total_budget=f"{request.budget.total_amount} {request.budget.currency}")
+            if places_ready is not None and not places_ready.done():
+                places_ready.set_result(itinerary.must_visit_places)
+            response.itinerary = itinerary
+            agent_exec.complete()
+            self._update_progress("Activities and itinerary planned successfully!", 65, response.workflow_metadata,
+                                 partial_response=response)
+            return
+        
+        async def attempt():
+            # Phase 1: Research destination to get places (places don't depend on trip length)
+            places_key = self._places_cache_key(response.parsed_request)
+            research_result = await self._cache_get(self.places_cache, places_key, response, "ActivitiesPlanner research")
+            if research_result is None:
+                search_results = await self._take_speculative_search(response.parsed_request.destination)
+                if search_results is not None:
+                    response.workflow_metadata.performance_notes.append("Place search overlapped request parsing")
+                # A retry after a timeout waits on the still-running call rather than starting over
+                research_result = await self._timed(
+                    cached_call(
+                        ("ActivitiesPlanner.research_destination", response.parsed_request),
+                        lambda: _limited("planner", self.activities_planner.research_destination(
+                            response.parsed_request, search_results)),
+                        cacheable=lambda result: result.get("status") == "success"
+                    ),
+                    "research", label="research"
                 )
                 
                 if research_result["status"] != "success":
                     raise Exception(f"ActivitiesPlanner research failed: {research_result.get('error', 'Unknown error')}")
                 
-                # Convert places data to Place objects
-                from agents.activities_planner import Place
-                places_data = research_result.get("must_visit_places", [])
-                places = [Place(
-                    name=place_data["name"],
-                    location=place_data["location"], 
-                    category=place_data["category"],
-                    significance=place_data["significance"],
-                    estimated_duration=place_data.get("estimated_duration", "2-3 hours"),
-                    best_time_to_visit=place_data.get("best_time_to_visit", "morning")
-                ) for place_data in places_data]
-                
-                # Phase 2: Generate itinerary with places
-                itinerary = await asyncio.wait_for(
-                    self.activities_planner.generate_itinerary(response.parsed_request, places),
-                    timeout=self.agent_timeout
-                )
-                
-                response.itinerary = itinerary
-                agent_exec.complete()
-                
-                self.logger.info(f"✅ ActivitiesPlanner completed in {agent_exec.duration:.1f}s")
-                self._update_progress("Activities and itinerary planned successfully!", 65, response.workflow_metadata)
-                return
-                
-            except asyncio.TimeoutError:
-                error_msg = f"ActivitiesPlanner timeout after {self.agent_timeout}s"
-                self.logger.warning(f"⏰ {error_msg} (attempt {attempt + 1})")
-                
-                if attempt < self.max_retries:
-                    agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    agent_exec.fail(error_msg)
-                    self._update_progress(f"Failed to plan activities: {error_msg}", 65, response.workflow_metadata)
-                    break
-                    
-            except Exception as e:
-                error_msg = f"ActivitiesPlanner error: {str(e)}"
-                self.logger.error(f"❌ {error_msg} (attempt {attempt + 1})")
-                
-                if attempt < self.max_retries:
-                    agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
-                    continue
-                else:
-                    agent_exec.fail(error_msg)
-                    response.workflow_metadata.errors.append(error_msg)
-                    self._update_progress(f"Failed to plan activities: {error_msg}", 65, response.workflow_metadata)
-                    break
+                await self._cache_put(self.places_cache, places_key, research_result)
+            
+            # Convert places data to Place objects
+            places_data = research_result.get("must_visit_places", [])
+            places = [Place.from_dict(place_data, "2-3 hours", "morning") for place_data in places_data]
+            
+            # Hand the places to the accommodation search before planning the days
+            if places_ready is not None and not places_ready.done():
+                places_ready.set_result(places)
+            
+            # Phase 2: Generate itinerary with places
+            response.itinerary = await self._timed(
+                cached_call(
+                    ("ActivitiesPlanner.generate_itinerary", response.parsed_request, places),
+                    lambda: _limited("planner", self.activities_planner.generate_itinerary(response.parsed_request, places)),
+                    cacheable=_without_fallback
+                ),
+                "itinerary", label="itinerary"
+            )
+        
+        if await self._run_with_retry(response, agent_exec, attempt, "Failed to plan activities", 65):
+            await self._cache_put(self.itinerary_cache, itinerary_key, response.itinerary)
+            self.logger.info("✅ ActivitiesPlanner completed in %.1fs", agent_exec.duration)
+            self._update_progress("Activities and itinerary planned successfully!", 65, response.workflow_metadata,
+                                 partial_response=response)
     
-    async def _execute_accommodation_suggester(self, response: TravelItineraryResponse):
-        """Execute AccommodationSuggester with retry logic and progress tracking"""
+    async def _execute_accommodation_suggester(self, response: TravelItineraryResponse,
+                                               places_ready: Optional[asyncio.Future] = None):
+        """
+        Execute AccommodationSuggester with retry logic and progress tracking.
+        
+        A cached result is used right away; otherwise the search waits on places_ready
+        (or uses the places in response.itinerary when no future is given) and is
+        skipped if there are no places.
+        """
         agent_exec = response.workflow_metadata.accommodation_suggester
+        accommodations_key = self._accommodations_cache_key(response.parsed_request)
+        accommodations = await self._cache_get(self.accommodations_cache, accommodations_key, response,
+                                               "AccommodationSuggester")
+        places = response.itinerary.must_visit_places if response.itinerary else None
+        if accommodations is None:
+            if places_ready is not None:
+                places = await places_ready
+            if places is None:
+                return
+        
         response.workflow_metadata.current_stage = WorkflowStage.FINDING_ACCOMMODATIONS
         
         self.logger.info("🏨 Starting AccommodationSuggester...")
         self._update_progress("Finding perfect accommodations near your activities...", 70, response.workflow_metadata)
         
-        for attempt in range(self.max_retries + 1):
+        async def attempt():
+            if accommodations is not None:
+                response.accommodations = accommodations
+                return
+            response.accommodations = await self._timed(
+                cached_call(
+                    ("AccommodationSuggester.suggest_for_places", response.parsed_request, places),
+                    lambda: _limited("accommodation", self.accommodation_suggester.suggest_for_places(
+                        response.parsed_request, places)),
+                    cacheable=_without_fallback
+                ),
+                "accommodation"
+            )
+            await self._cache_put(self.accommodations_cache, accommodations_key, response.accommodations)
+        
+        if await self._run_with_retry(response, agent_exec, attempt, "Failed to find accommodations", 90):
+            self.logger.info("✅ AccommodationSuggester completed in %.1fs", agent_exec.duration)
+            self._update_progress("Accommodations found successfully!", 90, response.workflow_metadata,
+                                 partial_response=response)
+    
+    async def _run_with_retry(self, response: TravelItineraryResponse, agent_exec: AgentExecution,
+                              attempt: Callable[[], Awaitable], failure_text: str, failure_percentage: float) -> bool:
+        """
+        Run one agent attempt until it succeeds or the retries run out.
+        
+        Args:
+            response: Response being built; errors are recorded on its metadata
+            agent_exec: Execution record of the agent
+            attempt: Coroutine function making one attempt and storing its result on the response
+            failure_text: Progress message prefix reported when the agent gives up
+            failure_percentage: Progress percentage reported with the failure
+            
+        Returns:
+            bool: True if an attempt succeeded
+        """
+        for attempt_number in range(self.max_retries + 1):
             try:
                 agent_exec.start()
-                
-                # Execute with timeout
-                accommodations = await asyncio.wait_for(
-                    self.accommodation_suggester.suggest_accommodations(response.itinerary),
-                    timeout=self.agent_timeout
-                )
-                
-                response.accommodations = accommodations
+                await attempt()
                 agent_exec.complete()
+                return True
                 
-                self.logger.info(f"✅ AccommodationSuggester completed in {agent_exec.duration:.1f}s")
-                self._update_progress("Accommodations found successfully!", 90, response.workflow_metadata)
-                return
-                
-            except asyncio.TimeoutError:
-                error_msg = f"AccommodationSuggester timeout after {self.agent_timeout}s"
-                self.logger.warning(f"⏰ {error_msg} (attempt {attempt + 1})")
+            except asyncio.TimeoutError as e:
+                error_msg = f"{agent_exec.agent_name} {e}"
+                self.logger.warning(f"⏰ {error_msg} (attempt {attempt_number + 1})")
                 
-                if attempt < self.max_retries:
+                if attempt_number < self.max_retries:
                     agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
+                    await self._backoff(attempt_number)
                     continue
-                else:
-                    agent_exec.fail(error_msg)
-                    self._update_progress(f"Failed to find accommodations: {error_msg}", 90, response.workflow_metadata)
-                    break
-                    
+                agent_exec.fail(error_msg)
+                
             except Exception as e:
-                error_msg = f"AccommodationSuggester error: {str(e)}"
-                self.logger.error(f"❌ {error_msg} (attempt {attempt + 1})")
+                error_msg = f"{agent_exec.agent_name} error: {str(e)}"
+                self.logger.error(f"❌ {error_msg} (attempt {attempt_number + 1})")
                 
-                if attempt < self.max_retries:
+                if attempt_number < self.max_retries and not isinstance(e, _NON_RETRYABLE):
                     agent_exec.retry_count += 1
-                    await asyncio.sleep(self.retry_delay)
+                    await self._backoff(attempt_number)
                     continue
-                else:
-                    agent_exec.fail(error_msg)
-                    response.workflow_metadata.errors.append(error_msg)
-                    self._update_progress(f"Failed to find accommodations: {error_msg}", 90, response.workflow_metadata)
-                    break
+                agent_exec.fail(error_msg)
+                response.workflow_metadata.errors.append(error_msg)
+            
+            self._update_progress(f"{failure_text}: {error_msg}", failure_percentage, response.workflow_metadata)
+            return False
+        return False
+    
+    async def _timed(self, awaitable: Awaitable, phase: str, label: Optional[str] = None):
+        """Await with the phase's timeout; the timeout error carries the budget (and label) for the message"""
+        timeout = self.timeouts[phase]
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"{label} timeout after {timeout}s" if label else
+                                       f"timeout after {timeout}s") from None
     
     async def _assemble_final_response(self, response: TravelItineraryResponse):
         """Assemble the final response with summary"""
@@ -309,30 +550,36 @@ class TravelItineraryWorkflow:
         
         try:
             # Generate summary based on available data
-            summary_parts = []
+            summary = ""
             
-            if response.parsed_request:
-                summary_parts.append(f"✈️ Destination: {response.parsed_request.destination}")
-                summary_parts.append(f"📅 Duration: {response.parsed_request.duration} days")
-                summary_parts.append(f"💰 Budget: {response.parsed_request.budget.total_amount}")
-                summary_parts.append(f"👥 Travelers: {response.parsed_request.travelers.adults} adults" +
-                                   (f", {response.parsed_request.travelers.children} children" if response.parsed_request.travelers.children > 0 else ""))
+            request = response.parsed_request
+            if request:
+                travelers = request.travelers
+                summary += _REQUEST_SUMMARY.format(
+                    destination=request.destination,
+                    duration=request.duration,
+                    budget=request.budget.total_amount,
+                    adults=travelers.adults,
+                    children=f", {travelers.children} children" if travelers.children > 0 else ""
+                )
             
-            if response.itinerary:
-                summary_parts.append(f"🗺️ Activities: {len(response.itinerary.must_visit_places)} must-visit places")
-                summary_parts.append(f"📋 Itinerary: {len(response.itinerary.daily_itineraries)} days planned")
+            itinerary = response.itinerary
+            if itinerary:
+                summary += _ITINERARY_SUMMARY.format(places=len(itinerary.must_visit_places),
+                                                     days=len(itinerary.daily_itineraries))
             
             if response.accommodations:
-                summary_parts.append(f"🏨 Accommodations: {len(response.accommodations.accommodation_options)} options found")
+                summary += _ACCOMMODATIONS_SUMMARY.format(options=len(response.accommodations.accommodation_options))
             
             # Add completion status
-            summary_parts.append(f"📊 Status: {response.get_completion_status()}")
+            summary += f"📊 Status: {response.get_completion_status()}"
             
             # Add performance metrics
-            if response.workflow_metadata and response.workflow_metadata.total_duration:
-                summary_parts.append(f"⏱️ Generated in: {response.workflow_metadata.total_duration:.1f}s")
+            metadata = response.workflow_metadata
+            if metadata and metadata.total_duration:
+                summary += f"\n⏱️ Generated in: {metadata.total_duration:.1f}s"
             
-            response.summary = "\n".join(summary_parts)
+            response.summary = summary
             
             self.logger.info("📋 Final response assembled successfully")
             
@@ -342,18 +589,168 @@ class TravelItineraryWorkflow:
             response.workflow_metadata.errors.append(error_msg)
             response.summary = "Error generating summary"
     
-    def _update_progress(self, message: str, percentage: float, metadata: WorkflowMetadata):
-        """Update progress via callback if available"""
-        if self.progress_callback:
-            try:
-                self.progress_callback(message, percentage, metadata)
-            except Exception as e:
-                self.logger.warning(f"Progress callback error: {e}")
+    async def _backoff(self, attempt: int):
+        """Sleep before a retry: exponential backoff with full jitter, so concurrent workflows spread out"""
+        await asyncio.sleep(min(self.max_retry_delay,
+                                random.uniform(self.retry_delay, self.retry_delay * 3 ** attempt)))
+    
+    def _start_speculative_search(self, destination: str):
+        """Start searching for must-visit places once the parser has streamed the destination"""
+        if self._speculative_search is None and destination:
+            self.logger.info("🔮 Searching places for %s while parsing continues", destination)
+            task = asyncio.create_task(self.activities_planner.search_must_visit_places(destination))
+            self._speculative_search = (destination, task)
+    
+    async def _take_speculative_search(self, destination: Optional[str]):
+        """Results of the speculative search if it was for this destination, otherwise None"""
+        if self._speculative_search is None:
+            return None
+        speculative_destination, task = self._speculative_search
+        self._speculative_search = None
+        if not destination or speculative_destination.strip().lower() != destination.strip().lower():
+            # The parsed destination changed (e.g. after disambiguation), so the search is stale
+            task.cancel()
+            return None
+        try:
+            return await task
+        except Exception as e:
+            self.logger.warning(f"Speculative place search failed: {e}")
+            return None
+    
+    def _discard_speculative_search(self):
+        """Cancel a speculative search nobody consumed"""
+        if self._speculative_search is not None:
+            self._speculative_search[1].cancel()
+            self._speculative_search = None
+    
+    def _note_overlap(self, metadata: WorkflowMetadata):
+        """Record how long the accommodation search ran alongside activity planning"""
+        planner, suggester = metadata.activities_planner, metadata.accommodation_suggester
+        if not (planner.start_time and planner.end_time and suggester.start_time and suggester.end_time):
+            return
+        overlap = min(planner.end_time, suggester.end_time) - max(planner.start_time, suggester.start_time)
+        if overlap >= 0.1:
+            metadata.performance_notes.append(
+                f"AccommodationSuggester overlapped ActivitiesPlanner by {overlap:.1f}s"
+            )
+    
+    @staticmethod
+    def _itinerary_cache_key(request) -> Optional[tuple]:
+        """Canonical form of a request for itinerary reuse, or None if the request is incomplete"""
+        if not (request.destination and request.duration and request.travelers and request.budget):
+            return None
+        return (request.destination.strip().lower(), request.duration,
+                request.travelers.adults, request.travelers.children,
+                request.budget.accommodation_type.value if request.budget.accommodation_type else None,
+                request.budget.currency, _budget_bucket(request.budget.total_amount))
+    
+    @staticmethod
+    def _places_cache_key(request) -> Optional[tuple]:
+        """Request fields the must-visit places depend on, or None if the request is incomplete"""
+        if not (request.destination and request.travelers and request.budget):
+            return None
+        return (request.destination.strip().lower(), request.travelers.total,
+                request.budget.accommodation_type.value if request.budget.accommodation_type else None)
+    
+    @staticmethod
+    def _accommodations_cache_key(request) -> Optional[tuple]:
+        """Request fields the accommodation suggestions depend on, or None if the request is incomplete"""
+        if not (request.destination and request.travelers and request.budget):
+            return None
+        return (request.destination.strip().lower(), request.duration, request.travelers.total,
+                request.budget.total_amount, request.budget.currency)
+    
+    async def _cache_get(self, cache: Optional[AgentCache], key: Optional[tuple],
+                         response: TravelItineraryResponse, label: str):
+        """Cached agent result for the key, noting the hit in the workflow metadata"""
+        if cache is None or key is None:
+            return None
+        try:
+            # Shelve reads are blocking disk I/O
+            result = await asyncio.to_thread(cache.get, key)
+        except Exception as e:
+            self.logger.warning(f"Agent cache read error: {e}")
+            return None
+        if result is not None:
+            self.logger.info("♻️ Reusing cached %s result", label)
+            response.workflow_metadata.performance_notes.append(f"cache_hit: {label}")
+        return result
+    
+    async def _cache_put(self, cache: Optional[AgentCache], key: Optional[tuple], result):
+        """Store an agent result; cache errors never fail the workflow"""
+        if cache is None or key is None:
+            return
+        try:
+            await asyncio.to_thread(cache.put, key, result)
+        except Exception as e:
+            self.logger.warning(f"Agent cache write error: {e}")
+    
+    def _update_progress(self, message: str, percentage: float, metadata: WorkflowMetadata,
+                         partial_response: Optional[TravelItineraryResponse] = None):
+        """Queue a progress update for the callback, passing the response so far when a section completes"""
+        percentage = self._progress_peak = max(percentage, self._progress_peak)
+        if not self.progress_callback:
+            return
+        event = (message, percentage, metadata, partial_response)
+        if self._progress_queue is None:
+            # Outside execute_workflow there is no worker; deliver inline
+            self._deliver_progress(event)
+            return
+        self._enqueue_progress(self._progress_queue, event)
+    
+    @staticmethod
+    def _enqueue_progress(queue: asyncio.Queue, event):
+        """Put an event on the progress queue, dropping the oldest one if it is full"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+    
+    def _deliver_progress(self, event):
+        """Call the progress callback for one event; returns its result (awaitable for async callbacks)"""
+        message, percentage, metadata, partial_response = event
+        try:
+            if partial_response is None:
+                return self.progress_callback(message, percentage, metadata)
+            return self.progress_callback(message, percentage, metadata, partial_response=partial_response)
+        except Exception as e:
+            self.logger.warning(f"Progress callback error: {e}")
+    
+    @staticmethod
+    def _is_urgent_progress(event) -> bool:
+        """Completion and failure updates are delivered without coalescing"""
+        message, percentage = event[0], event[1]
+        return percentage >= 100 or message.startswith(("Error", "Failed"))
+    
+    async def _drain_progress(self, queue: asyncio.Queue):
+        """Deliver queued progress events off the agents' path until the None sentinel arrives"""
+        stopping = False
+        while not stopping and (event := await queue.get()) is not None:
+            if not self._is_urgent_progress(event):
+                # Updates arriving within the window collapse into the latest one,
+                # keeping the newest partial response. Urgent events go out as sent:
+                # they never carry one, so three-argument callbacks still get them
+                await asyncio.sleep(_PROGRESS_COALESCE_WINDOW)
+                while not queue.empty():
+                    newer = queue.get_nowait()
+                    if newer is None:
+                        stopping = True
+                        break
+                    if self._is_urgent_progress(newer):
+                        event = newer
+                        break
+                    event = (*newer[:3], newer[3] if newer[3] is not None else event[3])
+            await _await_progress_callback(self._deliver_progress(event), self.logger)
+    
+    async def _stop_progress_worker(self):
+        """Flush the pending progress events and stop the worker"""
+        if self._progress_worker is None:
+            return
+        self._enqueue_progress(self._progress_queue, None)
+        worker, self._progress_queue, self._progress_worker = self._progress_worker, None, None
+        await worker
     
     def _convert_to_core_travel_request(self, final_request_data: dict):
         """Convert RequestParser final data to CoreTravelRequest"""
-        from agents.request_parser import CoreTravelRequest, Travelers, Budget, AccommodationType
-        
         try:
             # Extract data from RequestParser format
             destination = final_request_data.get("destination", "Unknown")
@@ -375,16 +772,8 @@ class TravelItineraryWorkflow:
             # Handle accommodation type from budget data
             accommodation_type = budget_data.get("accommodation_type", AccommodationType.MID_RANGE)
             if isinstance(accommodation_type, str):
-                try:
-                    # Map string values to enum
-                    accommodation_type_map = {
-                        "budget": AccommodationType.BUDGET,
-                        "mid-range": AccommodationType.MID_RANGE,
-                        "luxury": AccommodationType.LUXURY
-                    }
-                    accommodation_type = accommodation_type_map.get(accommodation_type.lower(), AccommodationType.MID_RANGE)
-                except (ValueError, AttributeError):
-                    accommodation_type = AccommodationType.MID_RANGE
+                # Map string values to enum
+                accommodation_type = _ACCOMMODATION_TYPES.get(accommodation_type.lower(), AccommodationType.MID_RANGE)
             
             budget = Budget(
                 total_amount=budget_data.get("total_amount", "25000 INR"),
@@ -401,65 +790,69 @@ class TravelItineraryWorkflow:
             
         except Exception as e:
             self.logger.error(f"Error converting RequestParser data: {e}")
-            # Return a fallback request
-            return self._create_fallback_request()
-    
-    def _create_partial_request_from_response(self, response: dict, user_input: str):
-        """Create a partial request from incomplete RequestParser response"""
-        from agents.request_parser import CoreTravelRequest, Travelers, Budget, AccommodationType
-        
-        try:
-            # Try to extract what we can from the response
-            # This is a simplified approach for workflow compatibility
-            destination = "Mumbai, India"  # Default for testing
-            duration = 3
-            travelers = Travelers(adults=2, children=0, total=2)
-            budget = Budget(
-                total_amount="25000 INR", 
-                currency="INR",
-                accommodation_type=AccommodationType.MID_RANGE
-            )
-            
-            self.logger.warning("RequestParser didn't complete - using simplified request")
-            
-            return CoreTravelRequest(
-                destination=destination,
-                duration=duration,
-                travelers=travelers,
-                budget=budget
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error creating partial request: {e}")
-            return self._create_fallback_request()
-    
-    def _create_fallback_request(self):
-        """Create a fallback request for error cases"""
-        from agents.request_parser import CoreTravelRequest, Travelers, Budget, AccommodationType
-        
-        return CoreTravelRequest(
-            destination="Mumbai, India",
-            duration=3,
-            travelers=Travelers(adults=2, children=0, total=2),
-            budget=Budget(
-                total_amount="25000 INR", 
-                currency="INR",
-                accommodation_type=AccommodationType.MID_RANGE
-            )
-        )
+            raise
 
 
 # Helper function for quick workflow execution
-async def generate_travel_itinerary(user_input: str, progress_callback: Optional[Callable] = None) -> TravelItineraryResponse:
+async def generate_travel_itinerary(user_input: str, progress_callback: Optional[Callable] = None,
+                                    use_cache: bool = True) -> TravelItineraryResponse:
     """
     Convenience function to execute the complete travel itinerary workflow.
     
     Args:
         user_input: User's natural language travel request
         progress_callback: Optional function for progress updates
+        use_cache: Reuse cached agent results from earlier requests
         
     Returns:
         TravelItineraryResponse: Complete or partial response with metadata
     """
-    workflow = TravelItineraryWorkflow(progress_callback)
-    return await workflow.execute_workflow(user_input)
\ No newline at end of file
+    digest = _input_digest(user_input)
+    if use_cache:
+        cached = _cached_response(digest, user_input)
+        if cached is not None:
+            if progress_callback:
+                logger = logging.getLogger(__name__)
+                try:
+                    result = progress_callback("Travel itinerary generation completed!", 100, cached.workflow_metadata)
+                except Exception as e:
+                    logger.warning(f"Progress callback error: {e}")
+                else:
+                    await _await_progress_callback(result, logger)
+            return cached
+    
+    workflow = TravelItineraryWorkflow(progress_callback, use_cache)
+    response = await workflow.execute_workflow(user_input)
+    
+    if response.is_complete():
+        _RESPONSE_CACHE.pop(digest, None)
+        _RESPONSE_CACHE[digest] = (time.monotonic() + _RESPONSE_CACHE_TTL, copy.deepcopy(response))
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+    return response
+
+
+def _cached_response(digest: str, user_input: str) -> Optional[TravelItineraryResponse]:
+    """Copy of a recent complete response for the same input, with fresh metadata, or None"""
+    entry = _RESPONSE_CACHE.get(digest)
+    if entry is None:
+        return None
+    expires, cached = entry
+    if expires <= time.monotonic():
+        del _RESPONSE_CACHE[digest]
+        return None
+    
+    response = copy.deepcopy(cached)
+    now = time.time()
+    response.workflow_metadata = replace(
+        response.workflow_metadata,
+        workflow_id=uuid.uuid4().hex[:8],
+        total_start_time=now,
+        total_end_time=now,
+        total_duration=0.0,
+        current_stage=WorkflowStage.COMPLETED,
+        overall_status="cached",
+        performance_notes=[*response.workflow_metadata.performance_notes, "cache_hit (recent request)"],
+    )
+    response.user_input = user_input
+    return response
\ No newline at end of file
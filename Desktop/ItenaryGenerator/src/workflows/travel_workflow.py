@@ -13,10 +13,11 @@ Key Features:
 
 import asyncio
 import logging
+import re
 import time
-from typing import Dict, Tuple, Optional
+import uuid
+from typing import Dict, Tuple, Optional, Union
 from datetime import datetime
-from dataclasses import asdict
 
 # Import workflow types
 from .workflow_types import (
@@ -32,11 +33,22 @@ from .workflow_types import (
 # Import agents
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
 
 from agents.request_parser import RequestParserAgent, CoreTravelRequest
-from agents.activities_planner import ActivitiesPlanner, ItineraryOutput
+from agents.activities_planner import ActivitiesPlanner, ItineraryOutput, Place
 from agents.accommodation_suggester import AccommodationSuggester, AccommodationOutput
+from agents._concurrency import loop_semaphore
+
+logger = logging.getLogger(__name__)
+
+# Amounts in cost strings such as "€1200-1500"; thousands separators are stripped first
+_COST_NUM_RE = re.compile(r'\d+')
+
+# Amount formats for currencies with a symbol; others are written as "<amount> <code>"
+_CURRENCY_FMT = {"EUR": "€{:,}", "USD": "${:,}", "GBP": "£{:,}", "INR": "₹{:,}"}
 
 
 class TravelItineraryWorkflow:
@@ -47,26 +59,30 @@ class TravelItineraryWorkflow:
     User Input → RequestParser → [ActivitiesPlanner || AccommodationSuggester] → Final Response
     """
     
-    def __init__(self, interactive: bool = True, verbose: bool = False):
+    def __init__(self, interactive: bool = True, verbose: bool = False, concurrency: int = 4):
         """
         Initialize the travel itinerary workflow
         
         Args:
             interactive: Enable interactive conversation for missing information
-            verbose: Enable detailed logging and progress display
+            verbose: Enable detailed progress display (log levels come from the logging configuration)
+            concurrency: Most agent LLM/search calls allowed in flight at once
         """
         self.interactive = interactive
         self.verbose = verbose
+        # Keeps the agents' fan-out under the upstream rate limits instead of into 429 retries
+        self._concurrency = concurrency
         
         # Initialize agents
         self.request_parser = RequestParserAgent()
         self.activities_planner = ActivitiesPlanner()
         self.accommodation_suggester = AccommodationSuggester()
         
-        # Setup logging
-        self.logger = logging.getLogger(__name__)
-        if verbose:
-            self.logger.setLevel(logging.INFO)
+        # (destination, task) of a place search started while the conversation is still going
+        self._prefetch = None
+        
+        # Verbosity of the log itself is left to the caller's logging configuration
+        self.logger = logger
         
         self.logger.info("TravelItineraryWorkflow initialized with parallel execution")
     
@@ -84,51 +100,52 @@ class TravelItineraryWorkflow:
             IncompleteRequestException: If request parsing needs more information
             WorkflowException: For other workflow failures
         """
-        workflow_id = f"itinerary_{int(time.time())}"
+        # Random id so concurrent requests started in the same second stay distinct
+        workflow_id = uuid.uuid4().hex[:16]
         metrics = WorkflowMetrics(workflow_id=workflow_id)
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            self.logger.info(f"[{workflow_id}] Starting travel itinerary generation")
+            self.logger.info("[%s] Starting travel itinerary generation", workflow_id)
             self._log_user_request(user_input, workflow_id)
             
             # Phase 1: Request parsing (sequential, interactive)
-            parse_start = time.time()
+            parse_start = time.perf_counter()
             travel_request = await self._handle_request_parsing(user_input, workflow_id)
-            metrics.parsing_time = time.time() - parse_start
+            metrics.parsing_time = time.perf_counter() - parse_start
             
-            self.logger.info(f"[{workflow_id}] Request parsed in {metrics.parsing_time:.2f}s")
+            self.logger.info("[%s] Request parsed in %.2fs", workflow_id, metrics.parsing_time)
             self._log_parsed_request(travel_request, workflow_id)
             
             # Phase 2: PARALLEL EXECUTION 🚀
             if self.verbose:
                 self._log_parallel_execution_start(workflow_id)
             
-            parallel_start = time.time()
+            parallel_start = time.perf_counter()
             itinerary_output, accommodation_output = await self._execute_parallel_agents(
                 travel_request, workflow_id, metrics
             )
-            metrics.parallel_time = time.time() - parallel_start
+            metrics.parallel_time = time.perf_counter() - parallel_start
             
-            self.logger.info(f"[{workflow_id}] Parallel execution completed in {metrics.parallel_time:.2f}s")
+            self.logger.info("[%s] Parallel execution completed in %.2fs", workflow_id, metrics.parallel_time)
             
             # Phase 3: Final assembly
-            assembly_start = time.time()
+            assembly_start = time.perf_counter()
             response = await self._create_final_response(
                 travel_request, itinerary_output, accommodation_output, 
                 workflow_id, metrics
             )
-            metrics.assembly_time = time.time() - assembly_start
+            metrics.assembly_time = time.perf_counter() - assembly_start
             
             # Finalize metrics
-            metrics.total_time = time.time() - start_time
+            metrics.total_time = time.perf_counter() - start_time
             response.processing_time = metrics.total_time
             
             # Log performance summary
             if self.verbose:
                 self._log_performance_summary(metrics)
             
-            self.logger.info(f"[{workflow_id}] Workflow completed successfully in {metrics.total_time:.2f}s")
+            self.logger.info("[%s] Workflow completed successfully in %.2fs", workflow_id, metrics.total_time)
             return response
             
         except IncompleteRequestException:
@@ -136,9 +153,11 @@ class TravelItineraryWorkflow:
             raise
         except Exception as e:
             # Handle all other workflow errors
-            metrics.total_time = time.time() - start_time
-            self.logger.error(f"[{workflow_id}] Workflow failed: {e}")
+            metrics.total_time = time.perf_counter() - start_time
+            self.logger.error("[%s] Workflow failed: %s", workflow_id, e)
             return self._handle_workflow_error(e, workflow_id, metrics)
+        finally:
+            self._discard_prefetch()
     
     async def _handle_request_parsing(self, user_input: str, workflow_id: str) -> CoreTravelRequest:
         """
@@ -155,46 +174,15 @@ class TravelItineraryWorkflow:
             IncompleteRequestException: If more information needed in non-interactive mode
         """
         try:
-            self.logger.info(f"[{workflow_id}] Starting request parsing...")
+            self.logger.info("[%s] Starting request parsing...", workflow_id)
             
             # Start conversation with initial input
             response = await self.request_parser.start_conversation(user_input)
             
             # Check if complete
             if response.get('is_complete'):
-                final_request = self.request_parser.get_final_request()
-                self.logger.info(f"[{workflow_id}] Request parsing completed in one turn")
-                
-                # Ensure we have a CoreTravelRequest object, not a dict
-                if isinstance(final_request, dict):
-                    # Convert dict to CoreTravelRequest if needed
-                    from agents.request_parser import CoreTravelRequest, Travelers, Budget, AccommodationType
-                    
-                    travelers_data = final_request.get('travelers', {})
-                    budget_data = final_request.get('budget', {})
-                    
-                    travelers = Travelers(
-                        adults=travelers_data.get('adults', 2),
-                        children=travelers_data.get('children', 0),
-                        total=travelers_data.get('total', 2)
-                    )
-                    
-                    budget = Budget(
-                        total_amount=budget_data.get('total_amount', 0),
-                        currency=budget_data.get('currency', 'USD'),
-                        accommodation_type=AccommodationType(budget_data.get('accommodation_type', 'mid-range'))
-                    )
-                    
-                    final_request = CoreTravelRequest(
-                        destination=final_request.get('destination', ''),
-                        duration=final_request.get('duration', 1),
-                        travelers=travelers,
-                        budget=budget
-                    )
-                
-                # Set currency context for cost calculations
-                self._current_currency = final_request.budget.currency
-                
+                final_request = self.request_parser.get_final_travel_request()
+                self.logger.info("[%s] Request parsing completed in one turn", workflow_id)
                 return final_request
             
             # Handle incomplete request
@@ -231,11 +219,14 @@ class TravelItineraryWorkflow:
             next_question = response.get('next_question')
             missing_fields = response.get('missing_fields', [])
             
-            self.logger.info(f"[{workflow_id}] Conversation turn {conversation_turn}: asking for {missing_fields}")
+            self.logger.info("[%s] Conversation turn %d: asking for %s", workflow_id, conversation_turn, missing_fields)
             
-            # Display question to user
+            # Once the destination is known, search its places while the user answers
+            self._start_prefetch(self.request_parser.conversation_manager.collected_data.destination, workflow_id)
+            
+            # Display question to user; input is read off the event loop so the search keeps running
             print(f"\n📝 {next_question}")
-            user_response = input("> ")
+            user_response = await asyncio.to_thread(input, "> ")
             
             # Continue conversation
             response = await self.request_parser.continue_conversation(user_response)
@@ -245,14 +236,14 @@ class TravelItineraryWorkflow:
             if conversation_turn > 10:
                 raise WorkflowException("Too many conversation turns, aborting")
         
-        final_request = self.request_parser.get_final_request()
-        # Set currency context for cost calculations
-        self._current_currency = final_request.budget.currency
-        self.logger.info(f"[{workflow_id}] Interactive conversation completed in {conversation_turn} turns")
+        final_request = self.request_parser.get_final_travel_request()
+        self.logger.info("[%s] Interactive conversation completed in %d turns", workflow_id, conversation_turn)
         return final_request
     
     async def _execute_parallel_agents(self, travel_request: CoreTravelRequest, 
-                                     workflow_id: str, metrics: WorkflowMetrics) -> Tuple:
+                                     workflow_id: str, metrics: WorkflowMetrics
+                                     ) -> Tuple[Union[ItineraryOutput, BaseException],
+                                                Union[AccommodationOutput, BaseException]]:
         """
         Execute ActivitiesPlanner and AccommodationSuggester in parallel
         
@@ -264,18 +255,14 @@ class TravelItineraryWorkflow:
         Returns:
             Tuple of (ItineraryOutput, AccommodationOutput) or exceptions
         """
-        # Launch both agents in parallel
-        activities_task = asyncio.create_task(
-            self._handle_activities_planning(travel_request, workflow_id, metrics)
-        )
-        accommodation_task = asyncio.create_task(
-            self._handle_accommodation_search(travel_request, workflow_id, metrics)
+        # Launch both agents in parallel; each failure is returned rather than raised, so one
+        # agent failing doesn't cancel the other, while cancelling the workflow cancels both
+        itinerary_result, accommodation_result = await asyncio.gather(
+            self._handle_activities_planning(travel_request, workflow_id, metrics),
+            self._handle_accommodation_search(travel_request, workflow_id, metrics),
+            return_exceptions=True
         )
-        
-        # Wait for both to complete (return_exceptions=True prevents one failure from stopping the other)
-        results = await asyncio.gather(activities_task, accommodation_task, return_exceptions=True)
-        
-        return results[0], results[1]
+        return itinerary_result, accommodation_result
     
     async def _handle_activities_planning(self, travel_request: CoreTravelRequest, 
                                         workflow_id: str, metrics: WorkflowMetrics) -> ItineraryOutput:
@@ -293,48 +280,44 @@ class TravelItineraryWorkflow:
         Raises:
             ActivitiesPlanningException: If activities planning fails
         """
-        agent_start = time.time()
+        agent_start = time.perf_counter()
         
         try:
-            self.logger.info(f"[{workflow_id}] ActivitiesPlanner: Starting destination research...")
+            self.logger.info("[%s] ActivitiesPlanner: Starting destination research...", workflow_id)
             
-            # Phase 1: Destination research (uses Tavily parallel searches internally)
-            research_result = await self.activities_planner.research_destination(travel_request)
+            # Phase 1: Destination research (uses Tavily parallel searches internally),
+            # reusing the place search prefetched during the conversation
+            search_results = await self._take_prefetch(travel_request.destination)
+            async with loop_semaphore("parallel_llm", self._concurrency):
+                research_result = await self.activities_planner.research_destination(travel_request, search_results)
             
             if research_result["status"] != "success":
                 raise ActivitiesPlanningException(f"Research failed: {research_result.get('error')}")
             
             places_data = research_result.get("must_visit_places", [])
-            research_time = time.time() - agent_start
+            research_time = time.perf_counter() - agent_start
             
             # Convert dictionary places to Place objects
-            from agents.activities_planner import Place
-            places = []
-            for place_dict in places_data:
-                place = Place(
-                    name=place_dict.get("name", ""),
-                    location=place_dict.get("location", ""),
-                    significance=place_dict.get("significance", ""),
-                    category=place_dict.get("category", ""),
-                    estimated_duration=place_dict.get("estimated_duration"),
-                    best_time_to_visit=place_dict.get("best_time_to_visit")
-                )
-                places.append(place)
+            places = [Place(pd.get("name", ""), pd.get("location", ""), pd.get("significance", ""),
+                            pd.get("category", ""), pd.get("estimated_duration"), pd.get("best_time_to_visit"))
+                      for pd in places_data]
             
-            self.logger.info(f"[{workflow_id}] ActivitiesPlanner: Research completed in {research_time:.2f}s, found {len(places)} places")
+            self.logger.info("[%s] ActivitiesPlanner: Research completed in %.2fs, found %d places",
+                             workflow_id, research_time, len(places))
             
             # Phase 2: Itinerary generation
-            self.logger.info(f"[{workflow_id}] ActivitiesPlanner: Generating itinerary...")
-            itinerary_output = await self.activities_planner.generate_itinerary(travel_request, places)
+            self.logger.info("[%s] ActivitiesPlanner: Generating itinerary...", workflow_id)
+            async with loop_semaphore("parallel_llm", self._concurrency):
+                itinerary_output = await self.activities_planner.generate_itinerary(travel_request, places)
             
-            metrics.activities_time = time.time() - agent_start
-            self.logger.info(f"[{workflow_id}] ActivitiesPlanner: Completed in {metrics.activities_time:.2f}s")
+            metrics.activities_time = time.perf_counter() - agent_start
+            self.logger.info("[%s] ActivitiesPlanner: Completed in %.2fs", workflow_id, metrics.activities_time)
             
             return itinerary_output
             
         except Exception as e:
-            metrics.activities_time = time.time() - agent_start
-            self.logger.error(f"[{workflow_id}] ActivitiesPlanner failed: {e}")
+            metrics.activities_time = time.perf_counter() - agent_start
+            self.logger.error("[%s] ActivitiesPlanner failed: %s", workflow_id, e)
             raise ActivitiesPlanningException(f"Activities planning failed: {e}")
     
     async def _handle_accommodation_search(self, travel_request: CoreTravelRequest, 
@@ -353,26 +336,59 @@ class TravelItineraryWorkflow:
         Raises:
             AccommodationSearchException: If accommodation search fails
         """
-        agent_start = time.time()
+        agent_start = time.perf_counter()
         
         try:
-            self.logger.info(f"[{workflow_id}] AccommodationSuggester: Starting multi-platform search...")
+            self.logger.info("[%s] AccommodationSuggester: Starting multi-platform search...", workflow_id)
             
             # Execute accommodation search (uses asyncio.gather internally for platforms)
-            accommodation_output = await self.accommodation_suggester.find_accommodations(travel_request)
+            async with loop_semaphore("parallel_llm", self._concurrency):
+                accommodation_output = await self.accommodation_suggester.find_accommodations(travel_request)
             
-            metrics.accommodation_time = time.time() - agent_start
+            metrics.accommodation_time = time.perf_counter() - agent_start
             suggestions_count = len(accommodation_output.accommodation_suggestions)
             
-            self.logger.info(f"[{workflow_id}] AccommodationSuggester: Completed in {metrics.accommodation_time:.2f}s, found {suggestions_count} options")
+            self.logger.info("[%s] AccommodationSuggester: Completed in %.2fs, found %d options",
+                             workflow_id, metrics.accommodation_time, suggestions_count)
             
             return accommodation_output
             
         except Exception as e:
-            metrics.accommodation_time = time.time() - agent_start
-            self.logger.error(f"[{workflow_id}] AccommodationSuggester failed: {e}")
+            metrics.accommodation_time = time.perf_counter() - agent_start
+            self.logger.error("[%s] AccommodationSuggester failed: %s", workflow_id, e)
             raise AccommodationSearchException(f"Accommodation search failed: {e}")
     
+    def _start_prefetch(self, destination: Optional[str], workflow_id: str):
+        """Start the destination's place search, replacing one for a different destination"""
+        if not destination or (self._prefetch is not None and self._prefetch[0] == destination):
+            return
+        self._discard_prefetch()
+        self.logger.info("[%s] Prefetching places for %s during the conversation", workflow_id, destination)
+        self._prefetch = (destination, asyncio.create_task(
+            self.activities_planner.search_must_visit_places(destination)
+        ))
+    
+    async def _take_prefetch(self, destination: str) -> Optional[list]:
+        """Results of the prefetched place search if it was for this destination, else None"""
+        if self._prefetch is None:
+            return None
+        prefetched_destination, task = self._prefetch
+        self._prefetch = None
+        if prefetched_destination.lower() != destination.lower():
+            task.cancel()
+            return None
+        try:
+            return await task
+        except Exception as e:
+            self.logger.warning("Prefetched place search failed: %s", e)
+            return None
+    
+    def _discard_prefetch(self):
+        """Cancel a prefetched place search that won't be used"""
+        if self._prefetch is not None:
+            self._prefetch[1].cancel()
+            self._prefetch = None
+    
     async def _create_final_response(self, travel_request: CoreTravelRequest,
                                    itinerary_result, accommodation_result,
                                    workflow_id: str, metrics: WorkflowMetrics) -> TravelItineraryResponse:
@@ -389,68 +405,75 @@ class TravelItineraryWorkflow:
         Returns:
             TravelItineraryResponse with complete or partial results
         """
+        request_summary = travel_request.to_dict()
+        
+        # Both agents succeeded: no fallbacks or error list to build
+        if not isinstance(itinerary_result, Exception) and not isinstance(accommodation_result, Exception):
+            currency = travel_request.budget.currency if travel_request.budget else "EUR"
+            return TravelItineraryResponse(
+                request_summary=request_summary,
+                itinerary=itinerary_result,
+                accommodations=accommodation_result,
+                final_cost_estimate=self._estimate_total_cost(itinerary_result, accommodation_result, currency),
+                workflow_id=workflow_id,
+                success=True,
+                errors=None,
+                partial_results=False
+            )
+        
         # Handle individual agent failures
-        itinerary_output = None
-        accommodation_output = None
         errors = []
-        partial_results = False
         
         # Check ActivitiesPlanner result
         if isinstance(itinerary_result, Exception):
-            self.logger.error(f"[{workflow_id}] ActivitiesPlanner failed: {itinerary_result}")
+            self.logger.error("[%s] ActivitiesPlanner failed: %s", workflow_id, itinerary_result)
             errors.append(f"Activities planning failed: {str(itinerary_result)}")
             itinerary_output = self._create_fallback_itinerary(travel_request)
-            partial_results = True
         else:
             itinerary_output = itinerary_result
         
         # Check AccommodationSuggester result  
         if isinstance(accommodation_result, Exception):
-            self.logger.error(f"[{workflow_id}] AccommodationSuggester failed: {accommodation_result}")
+            self.logger.error("[%s] AccommodationSuggester failed: %s", workflow_id, accommodation_result)
             errors.append(f"Accommodation search failed: {str(accommodation_result)}")
             accommodation_output = self._create_fallback_accommodations(travel_request)
-            partial_results = True
         else:
             accommodation_output = accommodation_result
         
-        # Estimate total cost if both agents succeeded
-        final_cost_estimate = None
-        if not partial_results:
-            final_cost_estimate = self._estimate_total_cost(itinerary_output, accommodation_output)
-        
-        # Create response
-        response = TravelItineraryResponse(
-            request_summary=asdict(travel_request),
+        # At least one agent failed, so there is no total cost to estimate
+        return TravelItineraryResponse(
+            request_summary=request_summary,
             itinerary=itinerary_output,
             accommodations=accommodation_output,
-            final_cost_estimate=final_cost_estimate,
+            final_cost_estimate=None,
             workflow_id=workflow_id,
-            success=len(errors) == 0,
-            errors=errors if errors else None,
-            partial_results=partial_results
+            success=False,
+            errors=errors,
+            partial_results=True
         )
-        
-        return response
     
     # Utility methods for logging and fallbacks...
     def _log_user_request(self, user_input: str, workflow_id: str):
         """Log the initial user request"""
-        self.logger.info(f"[{workflow_id}] User request: {user_input}")
+        self.logger.info("[%s] User request: %s", workflow_id, user_input)
     
     def _log_parsed_request(self, travel_request: CoreTravelRequest, workflow_id: str):
         """Log the parsed travel request"""
-        self.logger.info(f"[{workflow_id}] Parsed: {travel_request.destination}, {travel_request.duration} days, "
-                        f"{travel_request.travelers.total} travelers, {travel_request.budget.total_amount} {travel_request.budget.currency}")
+        self.logger.info("[%s] Parsed: %s, %s days, %s travelers, %s %s", workflow_id,
+                         travel_request.destination, travel_request.duration, travel_request.travelers.total,
+                         travel_request.budget.total_amount, travel_request.budget.currency)
     
     def _log_parallel_execution_start(self, workflow_id: str):
         """Log parallel execution start"""
-        self.logger.info(f"""[{workflow_id}] 🚀 PARALLEL EXECUTION STARTED
+        self.logger.info("""[%s] 🚀 PARALLEL EXECUTION STARTED
 ├── 🏛️  ActivitiesPlanner: Researching destinations & planning itinerary...
 └── 🏨 AccommodationSuggester: Searching hotels across multiple platforms...
-⏱️  Expected completion: ~15-20 seconds""")
+⏱️  Expected completion: ~15-20 seconds""", workflow_id)
     
     def _log_performance_summary(self, metrics: WorkflowMetrics):
         """Log detailed performance summary"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         summary = metrics.get_summary()
         parallel_efficiency = summary['parallel_efficiency']
         
@@ -468,8 +491,6 @@ class TravelItineraryWorkflow:
     
     def _create_fallback_itinerary(self, travel_request: CoreTravelRequest) -> ItineraryOutput:
         """Create basic fallback itinerary when ActivitiesPlanner fails"""
-        from agents.activities_planner import ItineraryOutput
-        
         return ItineraryOutput(
             destination=travel_request.destination,
             duration_days=travel_request.duration,
@@ -483,8 +504,6 @@ class TravelItineraryWorkflow:
     
     def _create_fallback_accommodations(self, travel_request: CoreTravelRequest) -> AccommodationOutput:
         """Create basic fallback accommodations when AccommodationSuggester fails"""
-        from agents.accommodation_suggester import AccommodationOutput
-        
         return AccommodationOutput(
             destination=travel_request.destination,
             search_date=datetime.now().isoformat(),
@@ -498,8 +517,8 @@ class TravelItineraryWorkflow:
         )
     
     def _estimate_total_cost(self, itinerary_output: ItineraryOutput, 
-                           accommodation_output: AccommodationOutput) -> str:
-        """Estimate total trip cost from itinerary and accommodation outputs"""
+                           accommodation_output: AccommodationOutput, currency: str = "EUR") -> str:
+        """Estimate total trip cost from itinerary and accommodation outputs, in the request's currency"""
         try:
             # Simple cost estimation logic
             itinerary_cost = itinerary_output.total_estimated_cost or "0"
@@ -507,47 +526,38 @@ class TravelItineraryWorkflow:
             # Extract numeric cost from itinerary
             itinerary_amount = 0
             if itinerary_cost and itinerary_cost != "Unable to estimate":
-                # Extract numbers from string (rough estimation)
-                import re
-                numbers = re.findall(r'[\d,]+', itinerary_cost.replace(',', ''))
-                if numbers:
-                    itinerary_amount = int(numbers[0])
+                # First number in the string (rough estimation)
+                number = _COST_NUM_RE.search(itinerary_cost.replace(',', ''))
+                if number:
+                    itinerary_amount = int(number.group())
             
             # Extract accommodation cost
             accommodation_amount = 0
             if accommodation_output.accommodation_suggestions:
-                # Use average cost of suggested accommodations
-                costs = []
+                # Use average cost of suggested accommodations, in one pass
+                total_per_night = 0.0
+                priced = 0
                 for acc in accommodation_output.accommodation_suggestions:
-                    if acc.cost_per_night:
-                        costs.append(acc.cost_per_night)
+                    cost = acc.cost_per_night
+                    if cost:
+                        total_per_night += cost
+                        priced += 1
                 
-                if costs:
-                    avg_per_night = sum(costs) / len(costs)
+                if priced:
+                    avg_per_night = total_per_night / priced
                     # Estimate duration from itinerary
                     duration = len(itinerary_output.daily_itineraries) or 1
                     accommodation_amount = int(avg_per_night * duration)
             
             total_amount = itinerary_amount + accommodation_amount
             if total_amount > 0:
-                # Get currency from travel request (passed via workflow context)
-                currency = getattr(self, '_current_currency', 'EUR')  # Default to EUR
-                
-                if currency == "EUR":
-                    return f"€{total_amount:,} (approx.)"
-                elif currency == "USD":
-                    return f"${total_amount:,} (approx.)"
-                elif currency == "GBP":
-                    return f"£{total_amount:,} (approx.)"
-                elif currency == "INR":
-                    return f"₹{total_amount:,} (approx.)"
-                else:
-                    return f"{total_amount:,} {currency} (approx.)"
+                fmt = _CURRENCY_FMT.get(currency)
+                return f"{fmt.format(total_amount)} (approx.)" if fmt else f"{total_amount:,} {currency} (approx.)"
             else:
                 return "Unable to estimate total cost"
         
         except Exception as e:
-            self.logger.warning(f"Cost estimation failed: {e}")
+            self.logger.warning("Cost estimation failed: %s", e)
             return "Unable to estimate total cost"
     
     def _handle_workflow_error(self, error: Exception, workflow_id: str, 
@@ -4,35 +4,48 @@ Data types and schemas for the Travel Itinerary Workflow
 Defines the output schemas and data structures for the parallel workflow execution.
 """
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from datetime import datetime
-import json
-
-# Import existing agent output types
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
+
+_now = datetime.now
+
+
+def _json_default(obj):
+    """Encode the response, agent dataclasses and enums; the response is slimmed first"""
+    for method in ("to_slim_dict", "to_dict"):
+        encode = getattr(obj, method, None)
+        if encode is not None:
+            return encode()
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+# Agent modules pull in the LLM clients, so they are only imported for type checking
+if TYPE_CHECKING:
     from agents.request_parser import CoreTravelRequest
     from agents.activities_planner import ItineraryOutput
     from agents.accommodation_suggester import AccommodationOutput
-except ImportError:
-    # Handle import errors gracefully during development
-    CoreTravelRequest = None
-    ItineraryOutput = None
-    AccommodationOutput = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TravelItineraryResponse:
     """Complete travel itinerary response from parallel workflow execution"""
     
     # Core data
     request_summary: Dict  # CoreTravelRequest as dict
-    itinerary: ItineraryOutput
-    accommodations: AccommodationOutput
+    itinerary: "ItineraryOutput"
+    accommodations: "AccommodationOutput"
     
     # Metadata
     final_cost_estimate: Optional[str] = None
@@ -46,20 +59,65 @@ class TravelItineraryResponse:
     partial_results: bool = False
     
     def __post_init__(self):
-        """Set generated_at if not provided"""
+        """Set generated_at if not provided (callers may pass one shared stamp)"""
         if self.generated_at is None:
-            self.generated_at = datetime.now().isoformat()
+            self.generated_at = _now().isoformat(timespec='seconds')
     
     def to_dict(self) -> Dict:
         """Convert to dictionary with proper serialization"""
-        return asdict(self)
+        return {
+            # Already a plain dict; shared by reference, so callers must not mutate it
+            'request_summary': self.request_summary,
+            'itinerary': self.itinerary.to_dict() if self.itinerary is not None else None,
+            'accommodations': self.accommodations.to_dict() if self.accommodations is not None else None,
+            'final_cost_estimate': self.final_cost_estimate,
+            'generated_at': self.generated_at,
+            'processing_time': self.processing_time,
+            'workflow_id': self.workflow_id,
+            'success': self.success,
+            'errors': self.errors,
+            'partial_results': self.partial_results
+        }
+    
+    def to_slim_dict(self) -> Dict:
+        """Fields that are neither None nor empty; agent outputs are left for the encoder's default hook"""
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is None or (isinstance(value, (str, list, dict)) and not value):
+                continue
+            data[f.name] = value
+        return data
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
+        # orjson only supports 2-space indentation
+        if orjson is not None and indent in (None, 0, 2):
+            return self.to_bytes(indent=indent).decode()
+        import json  # only needed when orjson can't handle the request
         return json.dumps(self.to_dict(), indent=indent, default=str)
-
-
-@dataclass
+    
+    def to_bytes(self, indent: int = 2) -> bytes:
+        """Convert to UTF-8 encoded JSON bytes (for file/network writes)"""
+        if orjson is None:
+            import json
+            return json.dumps(self.to_dict(), indent=indent, default=str).encode()
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(self.to_dict(), option=option, default=str)
+    
+    def to_json_stream(self, fp, indent: int = 2) -> None:
+        """Write the slimmed JSON to a binary file-like object without building an intermediate dict tree"""
+        if orjson is not None and indent in (None, 0, 2):
+            # Dataclasses are passed through to the default hook so the response is slimmed in the same pass
+            option = orjson.OPT_PASSTHROUGH_DATACLASS | (orjson.OPT_INDENT_2 if indent else 0)
+            fp.write(orjson.dumps(self, option=option, default=_json_default))
+            return
+        import json
+        for chunk in json.JSONEncoder(indent=indent, default=_json_default).iterencode(self):
+            fp.write(chunk.encode())
+
+
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Performance metrics for workflow execution"""
     
@@ -71,27 +129,49 @@ class WorkflowMetrics:
     accommodation_time: float = 0.0
     assembly_time: float = 0.0
     
+    def __post_init__(self):
+        """Intern workflow_id so metrics keyed by it compare by identity"""
+        self.workflow_id = sys.intern(self.workflow_id)
+    
     def parallel_efficiency(self) -> float:
         """Calculate parallel execution efficiency percentage"""
         if self.parallel_time == 0:
             return 0.0
         
-        max_agent_time = max(self.activities_time, self.accommodation_time)
+        a = self.activities_time
+        b = self.accommodation_time
+        max_agent_time = a if a > b else b
         return (max_agent_time / self.parallel_time) * 100
     
+    def to_dict(self) -> Dict:
+        """Convert raw metrics to dictionary"""
+        return {
+            'workflow_id': self.workflow_id,
+            'total_time': self.total_time,
+            'parsing_time': self.parsing_time,
+            'parallel_time': self.parallel_time,
+            'activities_time': self.activities_time,
+            'accommodation_time': self.accommodation_time,
+            'assembly_time': self.assembly_time
+        }
+    
     def get_summary(self) -> Dict:
         """Get metrics summary as dictionary"""
+        _r = round
+        total_time = self.total_time
+        parallel_time = self.parallel_time
+        efficiency = self.parallel_efficiency()
         return {
             'workflow_id': self.workflow_id,
-            'total_time': round(self.total_time, 2),
-            'parsing_time': round(self.parsing_time, 2),
-            'parallel_time': round(self.parallel_time, 2),
-            'activities_time': round(self.activities_time, 2),
-            'accommodation_time': round(self.accommodation_time, 2),
-            'assembly_time': round(self.assembly_time, 2),
-            'parallel_efficiency': round(self.parallel_efficiency(), 1),
-            'performance_target_met': self.total_time < 30.0,
-            'parallel_target_met': self.parallel_time < 20.0
+            'total_time': _r(total_time, 2),
+            'parsing_time': _r(self.parsing_time, 2),
+            'parallel_time': _r(parallel_time, 2),
+            'activities_time': _r(self.activities_time, 2),
+            'accommodation_time': _r(self.accommodation_time, 2),
+            'assembly_time': _r(self.assembly_time, 2),
+            'parallel_efficiency': _r(efficiency, 1),
+            'performance_target_met': total_time < 30.0,
+            'parallel_target_met': parallel_time < 20.0
         }
 
 
@@ -127,10 +207,10 @@ class ParallelExecutionException(WorkflowException):
         self.activities_error = activities_error
         self.accommodation_error = accommodation_error
         
-        errors = []
-        if activities_error:
-            errors.append(f"Activities: {activities_error}")
-        if accommodation_error:
-            errors.append(f"Accommodations: {accommodation_error}")
+        errors = tuple(
+            f"{tag}: {error}"
+            for tag, error in (("Activities", activities_error), ("Accommodations", accommodation_error))
+            if error is not None
+        )
         
         super().__init__(f"Parallel execution failed: {'; '.join(errors)}")
\ No newline at end of file